@@ -0,0 +1,181 @@
+"""
+Local stand-in for :term:`Placeholder API`, used by load benchmarks.
+
+It serves the same endpoints we call, with configurable latency
+and injected errors, so benchmarks do not depend on the real service:
+
+.. code:: bash
+
+  python -m benchmarks.fake_placeholder --port 8010 --latency 0.05
+
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar, Dict, Final, Iterator, List, Optional, final
+from urllib.parse import parse_qs, urlsplit
+
+_USER_PATH: Final = re.compile(r'^/users/\d+$')
+
+
+@final
+class PlaceholderHandler(BaseHTTPRequestHandler):
+    """Handles ``/photos`` and ``/users`` the way the real API does."""
+
+    #: Configured by :func:`serve`, shared by all handler instances:
+    latency: ClassVar[float] = 0
+    jitter: ClassVar[float] = 0
+    error_rate: ClassVar[float] = 0
+    total_photos: ClassVar[int] = 5000
+
+    _user_ids: ClassVar[Iterator[int]] = itertools.count(1)
+    _user_ids_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Photos, the whole list or a single page of it."""
+        url = urlsplit(self.path)
+        if url.path != '/photos':
+            self._respond(HTTPStatus.NOT_FOUND, {})
+            return
+
+        query = parse_qs(url.query)
+        limit = _int_param(query, '_limit', self.total_photos)
+        page = _int_param(query, '_page', 1)
+        # Photos never change, so the page is enough for an `ETag`:
+        etag = '"{0}-{1}"'.format(page, limit)
+        if self.headers.get('If-None-Match') == etag:
+            self._respond(HTTPStatus.NOT_MODIFIED, None, etag=etag)
+            return
+        self._respond(
+            HTTPStatus.OK,
+            _photos_page(page, limit, self.total_photos),
+            etag=etag,
+        )
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Create a user and return its new id."""
+        if self.path != '/users':
+            self._respond(HTTPStatus.NOT_FOUND, {})
+            return
+        self._read_body()
+        with self._user_ids_lock:
+            user_id = next(self._user_ids)
+        self._respond(HTTPStatus.CREATED, {'id': user_id})
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        """Update a user, the request body is ignored."""
+        if not _USER_PATH.match(self.path):
+            self._respond(HTTPStatus.NOT_FOUND, {})
+            return
+        self._read_body()
+        self._respond(HTTPStatus.OK, {})
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: WPS125
+        """Access logs would slow us down, we don't need them."""
+
+    def _read_body(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _respond(
+        self,
+        status: HTTPStatus,
+        payload: Any,
+        *,
+        etag: Optional[str] = None,
+    ) -> None:
+        jitter = random.uniform(-self.jitter, self.jitter)  # noqa: S311
+        time.sleep(max(0, self.latency + jitter))
+        if random.random() < self.error_rate:  # noqa: S311
+            status, payload, etag = HTTPStatus.SERVICE_UNAVAILABLE, {}, None
+
+        body = b'' if payload is None else json.dumps(payload).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(
+    port: int,
+    *,
+    latency: float = 0,
+    jitter: float = 0,
+    error_rate: float = 0,
+    total_photos: int = 5000,
+) -> None:
+    """Serve fake API until interrupted."""
+    PlaceholderHandler.latency = latency
+    PlaceholderHandler.jitter = jitter
+    PlaceholderHandler.error_rate = error_rate
+    PlaceholderHandler.total_photos = total_photos
+    # Keep-alive connections, like the real API has:
+    PlaceholderHandler.protocol_version = 'HTTP/1.1'
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), PlaceholderHandler)
+    server.daemon_threads = True
+    with server:
+        server.serve_forever()
+
+
+def _photos_page(page: int, limit: int, total: int) -> List[Dict[str, Any]]:
+    first = (page - 1) * limit + 1
+    return [
+        _photo(photo_id)
+        for photo_id in range(first, min(first + limit, total + 1))
+    ]
+
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int) -> int:
+    query_values = query.get(name)
+    return int(query_values[0]) if query_values else default
+
+
+def _photo(photo_id: int) -> Dict[str, Any]:
+    url = 'https://via.placeholder.com/600/{0:06x}'.format(photo_id)
+    return {
+        'albumId': (photo_id - 1) // 50 + 1,
+        'id': photo_id,
+        'title': 'photo {0}'.format(photo_id),
+        'url': url,
+        'thumbnailUrl': url.replace('/600/', '/150/'),
+    }
+
+
+def main() -> None:
+    """Parse command line arguments and serve."""
+    parser = argparse.ArgumentParser(
+        description='Local stand-in for Placeholder API.',
+    )
+    parser.add_argument('--port', type=int, default=8010)
+    parser.add_argument(
+        '--latency', type=float, default=0, help='seconds per response',
+    )
+    parser.add_argument(
+        '--jitter', type=float, default=0, help='+/- seconds of latency',
+    )
+    parser.add_argument(
+        '--error-rate', type=float, default=0, help='share of 503 responses',
+    )
+    parser.add_argument('--total-photos', type=int, default=5000)
+    args = parser.parse_args()
+    serve(
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        total_photos=args.total_photos,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,575 @@
+"""
+Load benchmark of the main user flows.
+
+It starts :mod:`benchmarks.fake_placeholder` and the app with ``gunicorn``,
+then virtual users register, log in and keep using the :term:`dashboard`,
+:term:`favourites` and their profile until the time is up.
+Throughput and latency percentiles of each step are reported
+and compared with a stored baseline:
+
+.. code:: bash
+
+  python -m benchmarks.load --profile gthread --save-baseline
+  python -m benchmarks.load --profile gthread
+
+Exits with ``1`` when some step is slower than its baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import secrets
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from http import HTTPStatus
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Final, Iterator, List, Optional, final
+from uuid import uuid4
+
+import attr
+import requests
+
+_BASELINES: Final = Path(__file__).parent / 'baselines'
+
+#: Successful responses, we don't follow redirects after forms:
+_OK_STATUSES: Final = MappingProxyType({
+    'GET': HTTPStatus.OK,
+    'POST': HTTPStatus.FOUND,
+})
+
+_PERCENTILES: Final = (50, 95, 99)
+
+#: Latency percentiles of steps with fewer requests are mostly noise:
+_MIN_REQUESTS: Final = 100
+
+#: Report key of the app memory usage, it is not a step:
+_MEMORY: Final = 'memory_mb'
+
+#: Step report: `requests`, `errors`, `rps` and `p50`, `p95`, `p99` in ms.
+StepReport = Dict[str, float]
+Report = Dict[str, StepReport]
+
+#: Where a baseline was recorded, results of other machines differ:
+Machine = Dict[str, str]
+
+#: Steps are allowed to fail this often, even when they never did before:
+_MAX_ERROR_RATE: Final = 0.01
+
+_API_PORT: Final = 8010
+_APP_PORT: Final = 8020
+
+
+@final
+@attr.dataclass(slots=True)
+class Recorder(object):
+    """Collects response times of all virtual users by step."""
+
+    #: Responses before this moment are warmup, they are not recorded:
+    started_at: float
+    _durations: Dict[str, List[float]] = attr.ib(factory=dict)
+    _errors: Dict[str, int] = attr.ib(factory=dict)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)
+
+    def record(self, step: str, duration: float, *, ok: bool) -> None:
+        """Remember a single response."""
+        if time.monotonic() < self.started_at:
+            return
+        with self._lock:
+            self._durations.setdefault(step, []).append(duration)
+            if not ok:
+                self._errors[step] = self._errors.get(step, 0) + 1
+
+    def report(self, elapsed: float) -> Report:
+        """Throughput and latency of each step and of all of them."""
+        with self._lock:
+            steps = {
+                step: sorted(durations)
+                for step, durations in self._durations.items()
+            }
+            errors = dict(self._errors)
+        steps['total'] = sorted(chain.from_iterable(steps.values()))
+        errors['total'] = sum(errors.values())
+        return {
+            step: _step_report(durations, errors.get(step, 0), elapsed)
+            for step, durations in sorted(steps.items())
+        }
+
+
+@final
+class VirtualUser(object):
+    """A single user who goes through our flows one request at a time."""
+
+    #: Weights of :meth:`dashboard`, :meth:`favourite`, :meth:`favourites`
+    #: and :meth:`profile_update`, users repeat them after signing up:
+    action_weights: Final = (5, 2, 2, 1)
+
+    def __init__(self, base_url: str, recorder: Recorder) -> None:
+        """Every user has own cookies and connection."""
+        self._client = _Client(base_url, recorder)
+        self._email = 'bench-{0}@example.com'.format(uuid4().hex)
+        # Hex passwords are often rejected as too similar to hex emails:
+        self._password = secrets.token_urlsafe(16)
+
+    def run(self, deadline: float) -> None:
+        """Sign up and keep working until the deadline."""
+        self.sign_up()
+        actions = (
+            self.dashboard,
+            self.favourite,
+            self.favourites,
+            self.profile_update,
+        )
+        while time.monotonic() < deadline:  # noqa: WPS457
+            random.choices(actions, self.action_weights)[0]()  # noqa: S311
+
+    def sign_up(self) -> None:
+        """Register and log in, opening both forms first."""
+        self._client.request(
+            'registration_form', 'GET', '/identity/registration',
+        )
+        self._client.request('registration', 'POST', '/identity/registration', {
+            'email': self._email,
+            'password1': self._password,
+            'password2': self._password,
+            **_profile_form(),
+        })
+        self._client.request('login_form', 'GET', '/identity/login')
+        self._client.request('login', 'POST', '/identity/login', {
+            'username': self._email,
+            'password': self._password,
+        })
+
+    def dashboard(self) -> None:
+        """Pictures from the catalog or :term:`Placeholder API`."""
+        self._client.request('dashboard', 'GET', '/pictures/dashboard')
+
+    def favourite(self) -> None:
+        """Add a single picture to favourites."""
+        foreign_id = random.randint(1, 5000)  # noqa: S311
+        self._client.request('favourite', 'POST', '/pictures/dashboard', {
+            'foreign_id': foreign_id,
+            'url': 'https://via.placeholder.com/600/{0:06x}'.format(
+                foreign_id,
+            ),
+        })
+
+    def favourites(self) -> None:
+        """The first page of favourites."""
+        self._client.request('favourites', 'GET', '/pictures/favourites')
+
+    def profile_update(self) -> None:
+        """Open the profile and save it with new details."""
+        self._client.request('profile_form', 'GET', '/identity/update')
+        self._client.request(
+            'profile_update', 'POST', '/identity/update', _profile_form(),
+        )
+
+
+@final
+class _Client(object):
+    """Sends requests of a single user and records their timings."""
+
+    def __init__(self, base_url: str, recorder: Recorder) -> None:
+        self._base_url = base_url.rstrip('/')
+        self._recorder = recorder
+        self._session = requests.Session()
+
+    def request(
+        self,
+        step: str,
+        method: str,
+        path: str,
+        form: Optional[Dict[str, object]] = None,
+    ) -> None:
+        headers = {}
+        if method == 'POST':
+            headers['X-CSRFToken'] = _cookie(self._session, 'csrftoken')
+        start = time.monotonic()
+        try:
+            response = self._session.request(
+                method,
+                self._base_url + path,
+                data=form,
+                headers=headers,
+                allow_redirects=False,
+                timeout=30,
+            )
+        except requests.RequestException:
+            ok = False
+        else:
+            ok = response.status_code == _OK_STATUSES[method]
+        self._recorder.record(step, time.monotonic() - start, ok=ok)
+
+
+def run_load(
+    base_url: str,
+    *,
+    users: int,
+    duration: float,
+    warmup: float,
+) -> Report:
+    """Run all virtual users at the same time and report their results."""
+    recorder = Recorder(started_at=time.monotonic() + warmup)
+    deadline = recorder.started_at + duration
+    threads = [
+        threading.Thread(
+            target=VirtualUser(base_url, recorder).run,
+            args=(deadline,),
+            daemon=True,
+        )
+        for _ in range(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for started_thread in threads:
+        started_thread.join()
+    return recorder.report(duration)
+
+
+def compare(
+    report: Report,
+    baseline: Report,
+    *,
+    tolerance: float,
+) -> List[str]:
+    """Steps that are slower than in the baseline, or fail more often."""
+    regressions: List[str] = []
+    for step, expected in baseline.items():
+        actual = report.get(step)
+        if actual is not None and step != _MEMORY:
+            regressions.extend(
+                _step_regressions(step, actual, expected, tolerance),
+            )
+    regressions.extend(_app_regressions(report, baseline, tolerance))
+    return regressions
+
+
+def percentile(sorted_values: List[float], rank: int) -> float:
+    """Nearest-rank percentile of sorted values, ``0`` when there are none."""
+    if not sorted_values:
+        return 0
+    return sorted_values[round(rank / 100 * (len(sorted_values) - 1))]
+
+
+def memory_megabytes(pid: int) -> float:
+    """
+    Proportional set size of a process and its children.
+
+    Unlike RSS, shared pages are divided between processes,
+    so it shows what preloading and copy-on-write save. Linux only.
+    """
+    pids = [pid]
+    total = 0
+    while pids:
+        proc = Path('/proc/{0}'.format(pids.pop()))
+        total += int(_proc_field(proc / 'smaps_rollup', 'Pss').split()[0])
+        children = proc / 'task' / proc.name / 'children'
+        pids.extend(int(child) for child in children.read_text().split())
+    return round(total / 1024, 1)
+
+
+def machine() -> Machine:
+    """CPU, memory and runtime of this machine. Linux only."""
+    return {
+        'cpu': _proc_field(Path('/proc/cpuinfo'), 'model name'),
+        'cpus': str(os.cpu_count()),
+        'memory': _proc_field(Path('/proc/meminfo'), 'MemTotal'),
+        'system': '{0} {1}'.format(platform.system(), platform.machine()),
+        'python': platform.python_version(),
+    }
+
+
+def _step_report(
+    sorted_durations: List[float],
+    errors: int,
+    elapsed: float,
+) -> StepReport:
+    step_report: StepReport = {
+        'requests': len(sorted_durations),
+        'errors': errors,
+        'rps': round(len(sorted_durations) / elapsed, 1),
+    }
+    for rank in _PERCENTILES:
+        step_report['p{0}'.format(rank)] = round(
+            percentile(sorted_durations, rank) * 1000, 1,
+        )
+    return step_report
+
+
+def _step_regressions(
+    step: str,
+    actual: StepReport,
+    expected: StepReport,
+    tolerance: float,
+) -> Iterator[str]:
+    enough_requests = min(
+        actual['requests'], expected['requests'],
+    ) >= _MIN_REQUESTS
+    if enough_requests and actual['p95'] > expected['p95'] * (1 + tolerance):
+        yield '{0}: p95 {1} ms, was {2} ms'.format(
+            step, actual['p95'], expected['p95'],
+        )
+    if _error_rate(actual) > max(_error_rate(expected), _MAX_ERROR_RATE):
+        yield '{0}: {1} errors of {2} requests'.format(
+            step, actual['errors'], actual['requests'],
+        )
+
+
+def _app_regressions(
+    report: Report,
+    baseline: Report,
+    tolerance: float,
+) -> Iterator[str]:
+    total = report.get('total')
+    expected_rps = baseline['total']['rps']
+    if total is not None and total['rps'] < expected_rps * (1 - tolerance):
+        yield 'total: {0} rps, was {1} rps'.format(total['rps'], expected_rps)
+    memory = report.get(_MEMORY, {}).get('pss', 0)
+    expected_memory = baseline.get(_MEMORY, {}).get('pss', memory)
+    if memory > expected_memory * (1 + tolerance):
+        yield 'memory: {0} MB, was {1} MB'.format(memory, expected_memory)
+
+
+def _error_rate(step_report: StepReport) -> float:
+    return step_report['errors'] / max(step_report['requests'], 1)
+
+
+def _profile_form() -> Dict[str, object]:
+    return {
+        'first_name': 'Bench',
+        'last_name': uuid4().hex[:8],
+        'date_of_birth': '1990-01-01',
+        'address': 'Moscow',
+        'job_title': 'Tester',
+        'phone': '+79990000000',
+    }
+
+
+def _cookie(session: requests.Session, name: str) -> str:
+    # `RequestsCookieJar.get` is not typed, plain `CookieJar` API is:
+    for cookie in session.cookies:
+        if cookie.name == name:
+            return cookie.value or ''
+    return ''
+
+
+def _proc_field(path: Path, name: str) -> str:
+    # Lines of `/proc` files look like `Pss:    1234 kB`:
+    for line in path.read_text().splitlines():
+        field_name, _, field_value = line.partition(':')
+        if field_name.strip() == name:
+            return field_value.strip()
+    return ''
+
+
+@contextmanager
+def _process(
+    args: List[str],
+    *,
+    ready_url: str,
+    env: Optional[Dict[str, str]] = None,
+) -> Iterator['subprocess.Popen[bytes]']:
+    # Request logs would flood the report, errors still go to `stderr`:
+    process = subprocess.Popen(  # noqa: S603
+        args, env=env, stdout=subprocess.DEVNULL,
+    )
+    try:
+        yield _wait_until_ready(ready_url, process)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _wait_until_ready(
+    url: str,
+    process: 'subprocess.Popen[bytes]',
+    timeout: float = 60,
+) -> 'subprocess.Popen[bytes]':
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:  # noqa: WPS457
+        if process.poll() is not None:
+            raise RuntimeError('{0!r} has exited'.format(process.args))
+        try:
+            requests.get(url, timeout=1)
+        except requests.ConnectionError:
+            time.sleep(0.2)
+        else:
+            return process
+    raise RuntimeError('{0} is not ready'.format(url))
+
+
+def _fake_api_command(args: argparse.Namespace) -> List[str]:
+    return [
+        sys.executable,
+        '-m',
+        'benchmarks.fake_placeholder',
+        '--port',
+        str(_API_PORT),
+        '--latency',
+        str(args.latency),
+        '--jitter',
+        str(args.jitter),
+        '--error-rate',
+        str(args.error_rate),
+    ]
+
+
+def _app_command() -> List[str]:
+    return [
+        sys.executable,
+        '-m',
+        'gunicorn',
+        '--config',
+        'python:docker.django.gunicorn_config',
+        '--bind',
+        '127.0.0.1:{0}'.format(_APP_PORT),
+    ]
+
+
+def _app_env(args: argparse.Namespace, api_url: str) -> Dict[str, str]:
+    return {
+        **os.environ,
+        # Production settings, but served over plain `http`:
+        'DJANGO_ENV': 'benchmark',
+        'DJANGO_PLACEHOLDER_API_URL': api_url,
+        'GUNICORN_WORKER_PROFILE': args.profile,
+        'GUNICORN_WORKERS': str(args.workers or ''),
+        'GUNICORN_THREADS': str(args.threads),
+        'PROMETHEUS_MULTIPROC_DIR': tempfile.mkdtemp(),
+    }
+
+
+def _benchmark(args: argparse.Namespace) -> Report:
+    run = partial(
+        run_load,
+        users=args.users,
+        duration=args.duration,
+        warmup=args.warmup,
+    )
+    if args.url:
+        return run(args.url)
+
+    api_url = 'http://127.0.0.1:{0}/'.format(_API_PORT)
+    app_url = 'http://127.0.0.1:{0}'.format(_APP_PORT)
+    with _process(_fake_api_command(args), ready_url=api_url):
+        with _process(
+            _app_command(), ready_url=app_url, env=_app_env(args, api_url),
+        ) as app:
+            report = run(app_url)
+            report[_MEMORY] = {'pss': memory_megabytes(app.pid)}
+    return report
+
+
+def _save_baseline(path: Path, report: Report, note: str) -> None:
+    path.parent.mkdir(exist_ok=True)
+    baseline = {'machine': machine(), 'note': note, 'report': report}
+    path.write_text('{0}\n'.format(json.dumps(baseline, indent=2)))
+
+
+def _compare_with_baseline(
+    path: Path,
+    report: Report,
+    tolerance: float,
+) -> List[str]:
+    baseline = json.loads(path.read_text())
+    if baseline['machine'] != machine():
+        sys.stdout.write('Baseline is from another machine: {0}\n'.format(
+            baseline['machine'],
+        ))
+    return compare(report, baseline['report'], tolerance=tolerance)
+
+
+def _print_report(report: Report, regressions: List[str]) -> None:
+    columns = ('requests', 'errors', 'rps', 'p50', 'p95', 'p99')
+    sys.stdout.write('{0:<20}{1}\n'.format('step', ''.join(
+        '{0:>10}'.format(column) for column in columns
+    )))
+    for step, step_report in report.items():
+        if step == _MEMORY:
+            continue
+        sys.stdout.write('{0:<20}{1}\n'.format(step, ''.join(
+            '{0:>10}'.format(step_report[column]) for column in columns
+        )))
+    memory = report.get(_MEMORY)
+    if memory is not None:
+        sys.stdout.write('Memory: {0} MB\n'.format(memory['pss']))
+    for regression in regressions:
+        sys.stdout.write('Regression: {0}\n'.format(regression))
+
+
+def _add_app_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--url', help='benchmark a running app instead of starting one',
+    )
+    parser.add_argument(
+        '--profile', default='gthread', choices=('gthread', 'uvicorn', 'sync'),
+    )
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--threads', type=int, default=8)
+
+
+def _add_load_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=60)
+    parser.add_argument('--warmup', type=float, default=10)
+    parser.add_argument(
+        '--latency', type=float, default=0.1, help='fake API latency',
+    )
+    parser.add_argument('--jitter', type=float, default=0.05)
+    parser.add_argument('--error-rate', type=float, default=0)
+
+
+def _add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--baseline', help='baseline name, profile name by default',
+    )
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument(
+        '--note',
+        default='',
+        help='saved with the baseline, like the database the app used',
+    )
+    parser.add_argument('--tolerance', type=float, default=0.2)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Load benchmark of the main user flows.',
+    )
+    _add_app_arguments(parser)
+    _add_load_arguments(parser)
+    _add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark, compare it with the baseline or save a new one."""
+    args = _parse_args()
+    report = _benchmark(args)
+
+    baseline_path = _BASELINES / '{0}.json'.format(
+        args.baseline or args.profile,
+    )
+    regressions: List[str] = []
+    if args.save_baseline:
+        _save_baseline(baseline_path, report, args.note)
+    elif baseline_path.exists():
+        regressions = _compare_with_baseline(
+            baseline_path, report, args.tolerance,
+        )
+
+    _print_report(report, regressions)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+Micro-benchmarks of the building blocks of our requests.
+
+They reuse fixtures and factories of our tests,
+run them without coverage, it slows down the measured code:
+
+.. code:: bash
+
+  pytest benchmarks/micro --no-cov
+
+"""
+
+pytest_plugins = [
+    # Should be the first custom one:
+    'tests.plugins.django_settings',
+
+    # Factories:
+    'tests.plugins.identity.users',
+    'tests.plugins.pictures.pictures',
+]
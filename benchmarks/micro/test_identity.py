@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Final
+
+from django.conf import LazySettings
+from django.contrib.auth.hashers import check_password, make_password
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.identity.container import container
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.usecases.user_update import UserUpdate
+from server.apps.identity.models import User
+
+#: Logins that happen at the same time in a single worker process:
+_CONCURRENT_LOGINS: Final = 8
+
+
+def test_serialize_user(
+    benchmark: BenchmarkFixture,
+    user_data: Dict[str, Any],
+) -> None:
+    """This benchmark measures serializing users for Placeholder API."""
+    user = User(**user_data)
+
+    serialized = benchmark(placeholder._serialize_user, user)
+
+    assert serialized['email'] == user.email
+
+
+def test_container_instantiate(benchmark: BenchmarkFixture) -> None:
+    """This benchmark measures resolving a use case with its dependencies."""
+    user_update = benchmark(container.instantiate, UserUpdate)
+
+    assert isinstance(user_update, UserUpdate)
+
+
+def test_password_check(
+    benchmark: BenchmarkFixture,
+    settings: LazySettings,
+) -> None:
+    """This benchmark measures concurrent logins with production hashing."""
+    settings.PASSWORD_HASHERS = [
+        'server.common.django.hashers.Argon2PasswordHasher',
+    ]
+    encoded = make_password('password')
+
+    with ThreadPoolExecutor(_CONCURRENT_LOGINS) as requests:
+        checked = benchmark(lambda: list(requests.map(
+            check_password,
+            repeat('password', _CONCURRENT_LOGINS),
+            repeat(encoded, _CONCURRENT_LOGINS),
+        )))
+
+    assert all(checked)
+    benchmark.extra_info['logins'] = _CONCURRENT_LOGINS
@@ -0,0 +1,185 @@
+import io
+import json
+from functools import partial
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+import requests
+from django.conf import LazySettings
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.template.response import TemplateResponse
+from django.test import RequestFactory
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from server.apps.identity.models import User
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.django.forms import FavouritesForm
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
+from server.apps.pictures.views.dashboard import DashboardView
+from server.common.services import json_stream
+from tests.plugins.identity.users import UserFactory
+from tests.plugins.pictures.pictures import (
+    FavouritesFactory,
+    PictureJsonFactory,
+    picture_json,
+)
+
+
+@pytest.mark.parametrize('total', [10, 5000])
+def test_picture_response_from_json(
+    benchmark: BenchmarkFixture,
+    picture_json_factory: PictureJsonFactory,
+    total: int,
+) -> None:
+    """This benchmark measures validating already decoded pictures."""
+    pictures = picture_json_factory(total)
+
+    parsed = benchmark(
+        lambda: [PictureResponse.from_json(picture) for picture in pictures],
+    )
+
+    assert len(parsed) == total
+
+
+@pytest.mark.parametrize('total', [10, 5000])
+def test_picture_response_streaming(
+    benchmark: BenchmarkFixture,
+    picture_json_factory: PictureJsonFactory,
+    total: int,
+) -> None:
+    """This benchmark measures parsing a streamed API response."""
+    body = json.dumps(picture_json_factory(total)).encode('utf8')
+
+    parsed = benchmark.pedantic(
+        _parse_pictures,
+        setup=partial(_streamed_response, body),
+        rounds=50,
+    )
+
+    assert len(parsed) == total
+
+
+@pytest.mark.django_db()
+def test_favourites_form_save(
+    benchmark: BenchmarkFixture,
+    user_factory: UserFactory,
+) -> None:
+    """This benchmark measures validating and saving a favourite picture."""
+    user = user_factory()
+    foreign_ids = count(1)
+
+    benchmark(lambda: _save_favourite(user, next(foreign_ids)))
+
+
+def test_container_instantiate(benchmark: BenchmarkFixture) -> None:
+    """This benchmark measures resolving a use case with its dependencies."""
+    pictures_fetch = benchmark(container.instantiate, PicturesFetch)
+
+    assert isinstance(pictures_fetch, PicturesFetch)
+
+
+@pytest.mark.timeout(600)
+@pytest.mark.django_db()
+@pytest.mark.parametrize('total', [10, 10000, 1000000])
+def test_favourites_first_page(
+    benchmark: BenchmarkFixture,
+    user_factory: UserFactory,
+    favourites_factory: FavouritesFactory,
+    total: int,
+) -> None:
+    """This benchmark measures the first page of user's favourites."""
+    user: User = user_factory()
+    favourites_factory(user, total)
+
+    page = benchmark(
+        favourite_pictures.page_by_user,
+        user.id,
+        cursor=None,
+        page_size=50,
+    )
+
+    assert len(page.object_list) == min(total, 50)
+
+
+@pytest.mark.parametrize('fragments_cached', [False, True])
+def test_render_dashboard(
+    benchmark: BenchmarkFixture,
+    settings: LazySettings,
+    rf: RequestFactory,
+    user_data: Dict[str, Any],
+    fragments_cached: bool,
+) -> None:
+    """
+    This benchmark measures rendering the dashboard with its pictures.
+
+    Each round is a new request of a new visitor, like in production,
+    so nothing personal is reused between rounds.
+    """
+    if not fragments_cached:
+        dummy = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+        settings.CACHES = {alias: dummy for alias in settings.CACHES}
+    user = User(id=1, **user_data)
+    view = DashboardView.as_view(extra_context={
+        'pictures': [
+            PictureResponse.from_json(picture_json(foreign_id))
+            for foreign_id in range(1, 11)
+        ],
+        'favourites_count': 10,
+    })
+
+    response = benchmark.pedantic(
+        partial(_render, view),
+        setup=partial(_dashboard_request, rf, user),
+        rounds=1000,
+    )
+
+    assert response.status_code == 200
+
+
+def _streamed_response(
+    body: bytes,
+) -> Tuple[Tuple[requests.Response], Dict[str, Any]]:
+    response = requests.Response()
+    response.raw = io.BytesIO(body)
+    return (response,), {}
+
+
+def _parse_pictures(response: requests.Response) -> List[PictureResponse]:
+    return [
+        PictureResponse.from_json(picture)
+        for picture in json_stream.iter_json_array(response)
+    ]
+
+
+def _save_favourite(user: User, foreign_id: int) -> None:
+    picture = picture_json(foreign_id)
+    form = FavouritesForm(
+        data={'foreign_id': picture['id'], 'url': picture['url']},
+        user=user,
+    )
+    assert form.is_valid()
+    form.save()
+
+
+def _dashboard_request(
+    rf: RequestFactory,
+    user: User,
+) -> Tuple[Tuple[HttpRequest], Dict[str, Any]]:
+    request = rf.get('/pictures/dashboard')
+    request.user = user
+    return (request,), {}
+
+
+def _render(
+    view: Callable[..., HttpResponseBase],
+    request: HttpRequest,
+) -> HttpResponseBase:
+    response = view(request)
+    assert isinstance(response, TemplateResponse)
+    return response.render()
@@ -63,8 +63,7 @@ run_ci () {
   python manage.py lintmigrations --exclude-apps=axes --warnings-as-errors
 
   # Check production settings for gunicorn:
-  gunicorn --check-config --config python:docker.django.gunicorn_config \
-    server.wsgi
+  gunicorn --check-config --config python:docker.django.gunicorn_config
 
   # Checking if all the dependencies are secure and do not have any
   # known vulnerabilities:
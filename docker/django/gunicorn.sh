@@ -37,5 +37,4 @@ find /var/www/django/static -type f \
 # Docs: http://docs.gunicorn.org/en/stable/settings.html
 # Make sure it is in sync with `django/ci.sh` check:
 /usr/local/bin/gunicorn \
-  --config python:docker.django.gunicorn_config \
-  server.wsgi
+  --config python:docker.django.gunicorn_config
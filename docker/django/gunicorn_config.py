@@ -3,15 +3,75 @@
 # https://docs.gunicorn.org/en/stable/settings.html
 
 import multiprocessing
+import os
+import shutil
+from pathlib import Path
+
+# Workers share prometheus metrics through files in memory,
+# see `server/common/services/metrics.py`.
+# It must be set before `prometheus_client` is imported,
+# because it selects the storage of all metrics on import:
+_metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', '/dev/shm/prometheus',  # noqa: S108
+)
+
+from prometheus_client import multiprocess  # noqa: E402
 
 bind = '0.0.0.0:8000'
+
+# Worker profiles, see `docs/pages/template/production.rst`:
+# - `gthread`: threads of a worker wait for Placeholder API concurrently
+# - `uvicorn`: ASGI, async views do not block a worker while they wait
+# - `sync`: one request per worker at a time, simple but needs more memory
+_profiles = {
+    'gthread': ('gthread', 'server.wsgi'),
+    'uvicorn': ('uvicorn.workers.UvicornWorker', 'server.asgi'),
+    'sync': ('sync', 'server.wsgi'),
+}
+_profile = os.environ.get('GUNICORN_WORKER_PROFILE', 'gthread')
+if _profile not in _profiles:
+    raise ValueError(
+        'Unknown GUNICORN_WORKER_PROFILE {0!r}, use one of: {1}'.format(
+            _profile, ', '.join(_profiles),
+        ),
+    )
+worker_class, wsgi_app = _profiles[_profile]
+
 # Concerning `workers` setting see:
 # https://github.com/wemake-services/wemake-django-template/issues/1022
-workers = multiprocessing.cpu_count() * 2 + 1
+# Requests mostly wait for I/O, so concurrency comes from `threads`
+# or the event loop, while `workers` only need to keep all CPUs busy:
+workers = int(
+    os.environ.get('GUNICORN_WORKERS') or multiprocessing.cpu_count() + 1,
+)
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+if _profile == 'sync':
+    # `gunicorn` silently runs `gthread` workers for `sync` with more threads:
+    threads = 1
+
+# Application is imported once before workers are forked,
+# so they share its memory pages until they are written to:
+preload_app = True
 
-max_requests = 2000
-max_requests_jitter = 400
+# Workers are recycled to limit possible memory leaks,
+# jitter makes sure they don't restart all at once:
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '20000'))
+max_requests_jitter = max_requests // 10
 
 log_file = '-'
-chdir = '/code'
+# `/code` in docker, repository root for benchmarks:
+chdir = str(Path(__file__).resolve().parents[2])
 worker_tmp_dir = '/dev/shm'  # noqa: S108
+
+
+def on_starting(server):
+    """Removes metrics of previous runs."""
+    shutil.rmtree(_metrics_dir, ignore_errors=True)
+    os.makedirs(_metrics_dir)
+
+
+def child_exit(server, worker):
+    """Dead workers must not be reported as live ones."""
+    multiprocess.mark_process_dead(  # type: ignore[no-untyped-call]
+        worker.pid,
+    )
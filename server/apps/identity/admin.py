@@ -2,7 +2,7 @@ from typing import final
 
 from django.contrib import admin
 
-from server.apps.identity.models import User
+from server.apps.identity.models import LeadOutbox, LeadUpdateOutbox, User
 from server.common.django.admin import TimeReadOnlyMixin
 
 
@@ -17,3 +17,24 @@ class UserAdmin(TimeReadOnlyMixin, admin.ModelAdmin[User]):
         'first_name',
         'last_name',
     )
+
+
+@final
+@admin.register(LeadOutbox)
+class LeadOutboxAdmin(TimeReadOnlyMixin, admin.ModelAdmin[LeadOutbox]):
+    """This class represents `LeadOutbox` in admin panel."""
+
+    list_display = ('id', 'user_id', 'attempts', 'next_attempt_at')
+    raw_id_fields = ('user',)
+
+
+@final
+@admin.register(LeadUpdateOutbox)
+class LeadUpdateOutboxAdmin(
+    TimeReadOnlyMixin,
+    admin.ModelAdmin[LeadUpdateOutbox],
+):
+    """This class represents `LeadUpdateOutbox` in admin panel."""
+
+    list_display = ('id', 'user_id', 'attempts', 'next_attempt_at')
+    raw_id_fields = ('user',)
@@ -0,0 +1,21 @@
+from typing import final
+
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+@final
+class IdentityConfig(AppConfig):
+    """Connects signal receivers, models are not ready before this."""
+
+    name = 'server.apps.identity'
+
+    def ready(self) -> None:
+        """Invalidate cached users when they change."""
+        from server.apps.identity.intrastructure.django import (  # noqa: WPS433
+            signals,
+        )
+        from server.apps.identity.models import User  # noqa: WPS433
+
+        post_save.connect(signals.invalidate_user, sender=User)
+        post_delete.connect(signals.invalidate_user, sender=User)
@@ -0,0 +1,24 @@
+from typing import Optional, final
+
+from django.contrib.auth.backends import ModelBackend
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.user_cached import UserCachedGet
+from server.apps.identity.models import User
+
+
+@final
+class CachedModelBackend(ModelBackend):
+    """
+    Regular model backend, but users of each request come from the cache.
+
+    ``AuthenticationMiddleware`` loads the user with :meth:`get_user`
+    on every authenticated request, this saves a query for each of them.
+    """
+
+    def get_user(self, user_id: int) -> Optional[User]:
+        """Cached user, but only an active one."""
+        user = container.instantiate(UserCachedGet)(user_id)
+        if user is None or not self.user_can_authenticate(user):
+            return None
+        return user
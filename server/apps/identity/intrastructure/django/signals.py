@@ -0,0 +1,22 @@
+from functools import partial
+from typing import Any
+
+from django.db import transaction
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.user_cached import UserInvalidate
+from server.apps.identity.models import User
+
+
+def invalidate_user(instance: User, **kwargs: Any) -> None:
+    """
+    Drop cached user on ``post_save`` and ``post_delete``.
+
+    We catch all changes this way, including the ones from django itself:
+    rehashed passwords, ``last_login``, admin and password reset.
+    Cache is invalidated after the commit, otherwise other requests
+    could cache the old user again before the change is visible to them.
+    """
+    transaction.on_commit(
+        partial(container.instantiate(UserInvalidate), instance.pk),
+    )
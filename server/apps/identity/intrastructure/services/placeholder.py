@@ -1,6 +1,7 @@
-from typing import Dict, final
-
-import requests
+import hashlib
+import json
+from typing import Dict, Optional, final
+from uuid import UUID
 
 from server.apps.identity.models import User
 from server.common import pydantic_model
@@ -25,12 +26,17 @@ class LeadCreate(http.BaseFetcher):
         self,
         *,
         user: User,
+        idempotency_key: Optional[UUID] = None,
     ) -> UserResponse:
         """Create remote user and return assigned ids."""
-        response = requests.post(
+        headers = {}
+        if idempotency_key is not None:
+            headers['Idempotency-Key'] = str(idempotency_key)
+        response = self._request(
+            'POST',
             self.url_path(),
             json=_serialize_user(user),
-            timeout=self._api_timeout,
+            headers=headers,
         )
         response.raise_for_status()
         return UserResponse.parse_raw(response.text)
@@ -48,14 +54,20 @@ class LeadUpdate(http.BaseFetcher):
         user: User,
     ) -> None:
         """Update remote user."""
-        response = requests.patch(
+        response = self._request(
+            'PATCH',
             self.url_path().format(user.lead_id),
             json=_serialize_user(user),
-            timeout=self._api_timeout,
         )
         response.raise_for_status()
 
 
+def fingerprint(user: User) -> str:
+    """Hash of the data we send about users, equal for unchanged users."""
+    serialized = json.dumps(_serialize_user(user), sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf8')).hexdigest()
+
+
 def _serialize_user(user: User) -> Dict[str, str]:
     if user.date_of_birth is not None:
         date_of_birth = user.date_of_birth.strftime('%d.%m.%Y')
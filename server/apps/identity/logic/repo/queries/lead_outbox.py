@@ -0,0 +1,19 @@
+import datetime as dt
+
+from django.db.models import QuerySet
+
+from server.apps.identity.models import LeadOutbox, LeadUpdateOutbox
+
+
+def due(now: dt.datetime) -> QuerySet[LeadOutbox]:
+    """Search :class:`LeadOutbox` items that are ready, with their users."""
+    return LeadOutbox.objects.filter(
+        next_attempt_at__lte=now,
+    ).select_related('user').order_by('next_attempt_at')
+
+
+def due_updates(now: dt.datetime) -> QuerySet[LeadUpdateOutbox]:
+    """Search :class:`LeadUpdateOutbox` items that are ready to be sent."""
+    return LeadUpdateOutbox.objects.filter(
+        next_attempt_at__lte=now,
+    ).select_related('user').order_by('next_attempt_at')
@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import final
+
+import attr
+import requests
+from django.db import connections
+
+from server.apps.identity.logic.usecases.lead_outbox_process import (
+    LeadOutboxProcess,
+)
+from server.common.django.types import Settings
+from server.common.services import circuit_breaker
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadOutboxBackfill(object):
+    """
+    Drain the :term:`lead outbox` with concurrent, rate-limited calls.
+
+    It is used after bulk imports, when the regular worker
+    would take too long. Items are claimed one by one with
+    :class:`LeadOutboxProcess`, so it is safe to run next to the worker.
+    Failed items stay in the outbox, the regular worker retries them.
+    """
+
+    _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
+
+    def __call__(self, *, concurrency: int, rate: float) -> int:
+        """Process all due items, returns the number of processed ones."""
+        process_outbox = LeadOutboxProcess(
+            settings=self._settings,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
+        )
+        rate_limiter = _RateLimiter(rate)
+        with ThreadPoolExecutor(concurrency) as executor:
+            workers = [
+                executor.submit(_drain, process_outbox, rate_limiter)
+                for _ in range(concurrency)
+            ]
+        return sum(worker.result() for worker in workers)
+
+
+@final
+class _RateLimiter(object):
+    """
+    Spaces calls evenly: no more than ``rate`` calls per second.
+
+    It is shared by all threads,
+    each of them waits for its own turn in :meth:`acquire`.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_call - now
+            self._next_call = max(self._next_call, now) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _drain(
+    process_outbox: LeadOutboxProcess,
+    rate_limiter: _RateLimiter,
+) -> int:
+    processed = 0
+    # Items are claimed one by one, so each call waits its turn:
+    while True:  # noqa: WPS457
+        rate_limiter.acquire()
+        if not process_outbox(batch_size=1):
+            break
+        processed += 1
+    connections.close_all()  # only this thread's connections
+    return processed
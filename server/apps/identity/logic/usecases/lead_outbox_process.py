@@ -0,0 +1,204 @@
+import datetime as dt
+from typing import List, final
+
+import attr
+import pydantic
+import requests
+from django.db import transaction
+from django.utils import timezone
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.repo.queries import lead_outbox
+from server.apps.identity.models import LeadOutbox, LeadUpdateOutbox, User
+from server.common.django.types import Settings
+from server.common.services import circuit_breaker
+
+#: Both are temporary for us: API can be fixed, responses can be retried.
+_RETRYABLE_ERRORS = (requests.RequestException, pydantic.ValidationError)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadOutboxProcess(object):
+    """
+    Create users from the :term:`lead outbox` in :term:`Placeholder API`.
+
+    Items are claimed in batches for ``PLACEHOLDER_OUTBOX_LEASE`` seconds,
+    so multiple workers can run at the same time.
+    Failed items are retried with exponential backoff.
+    """
+
+    _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
+
+    def __call__(self, batch_size: int) -> int:
+        """Process a single batch, returns the number of claimed items."""
+        batch = self._claim(batch_size)
+        for outbox in batch:
+            self._process(outbox)
+        return len(batch)
+
+    def _claim(self, batch_size: int) -> List[LeadOutbox]:
+        now = timezone.now()
+        with transaction.atomic():
+            due = lead_outbox.due(now).select_for_update(
+                skip_locked=True, of=('self',),
+            )
+            batch = list(due[:batch_size])
+            LeadOutbox.objects.filter(
+                pk__in=[outbox.pk for outbox in batch],
+            ).update(
+                next_attempt_at=now + dt.timedelta(
+                    seconds=self._settings.PLACEHOLDER_OUTBOX_LEASE,
+                ),
+            )
+        return batch
+
+    def _process(self, outbox: LeadOutbox) -> None:
+        try:
+            new_ids = self._create_lead(outbox)
+        except _RETRYABLE_ERRORS as exc:
+            self._retry_later(outbox, exc)
+            return
+
+        with transaction.atomic():
+            # Users can be deleted while we wait for the API,
+            # their outbox items are deleted with them:
+            user = User.objects.select_for_update().filter(pk=outbox.user_id)
+            if not user.exists():
+                return
+            outbox.user.lead_id = new_ids.id
+            outbox.user.save(update_fields=['lead_id'])
+            outbox.delete()
+            # Changes parked without `lead_id` can be sent now,
+            # the state we have just created is not sent again:
+            LeadUpdateOutbox.objects.filter(user=outbox.user).update(
+                sent_fingerprint=placeholder.fingerprint(outbox.user),
+                attempts=0,
+                last_error='',
+                next_attempt_at=timezone.now(),
+            )
+
+    def _create_lead(self, outbox: LeadOutbox) -> placeholder.UserResponse:
+        return placeholder.LeadCreate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
+        )(user=outbox.user, idempotency_key=outbox.idempotency_key)
+
+    def _retry_later(
+        self,
+        outbox: LeadOutbox,
+        exc: Exception,
+    ) -> None:
+        # Nothing is updated when the user was deleted meanwhile:
+        LeadOutbox.objects.filter(pk=outbox.pk).update(
+            attempts=outbox.attempts + 1,
+            last_error=str(exc),
+            next_attempt_at=_retry_at(outbox.attempts + 1, self._settings),
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class LeadUpdateOutboxProcess(object):
+    """
+    Send changed users to :term:`Placeholder API`.
+
+    Only the latest user state is sent, users that did not change
+    since the last successful call are skipped.
+    Items saved again while being sent stay in the outbox.
+    Users without :term:`lead_id` wait until :class:`LeadOutboxProcess`
+    creates them.
+    """
+
+    _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
+
+    def __call__(self, batch_size: int) -> int:
+        """Process a single batch, returns the number of claimed items."""
+        batch = self._claim(batch_size)
+        for outbox in batch:
+            self._process(outbox)
+        return len(batch)
+
+    def _claim(self, batch_size: int) -> List[LeadUpdateOutbox]:
+        now = timezone.now()
+        with transaction.atomic():
+            due = lead_outbox.due_updates(now).select_for_update(
+                skip_locked=True, of=('self',),
+            )
+            batch = list(due[:batch_size])
+            # `update()` does not touch `updated_at`, we rely on it later:
+            LeadUpdateOutbox.objects.filter(
+                pk__in=[outbox.pk for outbox in batch],
+            ).update(
+                next_attempt_at=now + dt.timedelta(
+                    seconds=self._settings.PLACEHOLDER_OUTBOX_LEASE,
+                ),
+            )
+        return batch
+
+    def _process(self, outbox: LeadUpdateOutbox) -> None:
+        if outbox.user.lead_id is None:
+            # Not created yet, creation wakes the item up again:
+            self._park(outbox)
+            return
+
+        fingerprint = placeholder.fingerprint(outbox.user)
+        if fingerprint != outbox.sent_fingerprint:
+            try:
+                self._update_lead(outbox)
+            except _RETRYABLE_ERRORS as exc:
+                self._retry_later(outbox, str(exc))
+                return
+        self._mark_sent(outbox, fingerprint)
+
+    def _update_lead(self, outbox: LeadUpdateOutbox) -> None:
+        placeholder.LeadUpdate(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
+        )(user=outbox.user)
+
+    def _mark_sent(self, outbox: LeadUpdateOutbox, fingerprint: str) -> None:
+        sent = LeadUpdateOutbox.objects.filter(pk=outbox.pk)
+        sent.update(sent_fingerprint=fingerprint)
+        # Users saved again while we were sending stay in the outbox:
+        sent.filter(updated_at=outbox.updated_at).update(
+            pending_since=None,
+            attempts=0,
+            last_error='',
+            next_attempt_at=None,
+        )
+
+    def _park(self, outbox: LeadUpdateOutbox) -> None:
+        LeadUpdateOutbox.objects.filter(
+            pk=outbox.pk,
+            updated_at=outbox.updated_at,
+        ).update(
+            attempts=0,
+            last_error='',
+            next_attempt_at=None,
+        )
+
+    def _retry_later(self, outbox: LeadUpdateOutbox, error: str) -> None:
+        LeadUpdateOutbox.objects.filter(
+            pk=outbox.pk,
+            updated_at=outbox.updated_at,
+        ).update(
+            attempts=outbox.attempts + 1,
+            last_error=error,
+            next_attempt_at=_retry_at(outbox.attempts + 1, self._settings),
+        )
+
+
+def _retry_at(attempts: int, settings: Settings) -> dt.datetime:
+    return timezone.now() + dt.timedelta(seconds=min(
+        2 ** attempts,
+        settings.PLACEHOLDER_OUTBOX_MAX_BACKOFF,
+    ))
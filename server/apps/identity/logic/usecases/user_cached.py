@@ -0,0 +1,69 @@
+from typing import Optional, final
+
+import attr
+from django.core.cache import BaseCache, caches
+from django.db import DEFAULT_DB_ALIAS
+
+from server.apps.identity.models import User
+from server.common.django.types import Settings
+from server.common.services import caching, metrics
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class UserCachedGet(object):
+    """
+    Load :term:`user` by id, it is used for each authenticated request.
+
+    Users are cached until they are saved again,
+    see :class:`UserInvalidate`.
+    """
+
+    _settings: Settings
+
+    def __call__(self, user_id: int) -> Optional[User]:
+        """Return cached user, missing users are not cached."""
+        cache = _cache(self._settings)
+        # Version is read before the database, so a concurrent save
+        # can never leave an old user cached under a new version:
+        version = caching.get_version(cache, _version_key(user_id))
+        user_key = 'identity:user:{0}'.format(user_id)
+
+        user = cache.get(user_key, version=version)
+        metrics.CACHE_LOOKUPS.labels(
+            'identity_user', 'miss' if user is None else 'hit',
+        ).inc()
+        if user is None:
+            # Cached users outlive the primary pin of `ReplicaReadsMiddleware`,
+            # so they are never loaded from the lagging replica:
+            user = User.objects.using(DEFAULT_DB_ALIAS).filter(
+                pk=user_id,
+            ).first()
+            if user is not None:
+                cache.set(
+                    user_key,
+                    user,
+                    timeout=self._settings.IDENTITY_USER_CACHE_TTL,
+                    version=version,
+                )
+        return user
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class UserInvalidate(object):
+    """Drop cached :term:`user`, must be called after each change."""
+
+    _settings: Settings
+
+    def __call__(self, user_id: int) -> None:
+        """Invalidate cached user."""
+        caching.bump_version(_cache(self._settings), _version_key(user_id))
+
+
+def _cache(settings: Settings) -> BaseCache:
+    return caches[settings.IDENTITY_USER_CACHE]
+
+
+def _version_key(user_id: int) -> str:
+    return 'identity:user:{0}:version'.format(user_id)
@@ -0,0 +1,141 @@
+from concurrent.futures import Executor
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple, final
+
+import attr
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from server.apps.identity.models import LeadOutbox, User
+
+#: The same fields users fill in when they register, and `password`:
+_FIELDS = (User.USERNAME_FIELD, *User.REQUIRED_FIELDS)
+
+#: Passwords of a chunk are sent to hashing processes in this many batches:
+_HASHING_BATCHES = 16
+
+#: Row numbers in the chunk and their validation errors:
+InvalidRows = List[Tuple[int, str]]
+
+#: Valid user and its plain password, if the row has one:
+_UserRow = Tuple[User, Optional[str]]
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class ImportResult(object):
+    """What happened to a single chunk of imported rows."""
+
+    created: int
+    skipped: int  # users with these emails already exist
+    invalid: InvalidRows
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class UserImport(object):
+    """
+    Create many users at once, like partner's customers.
+
+    Users are saved with a few queries per chunk, instead of a few per user,
+    and are added to the :term:`lead outbox` in the same transaction.
+    Passwords are hashed by ``executor``: hashing is slow on purpose,
+    use a process pool to hash them on all CPUs.
+    Users without passwords can't log in until they reset them.
+    """
+
+    def __call__(
+        self,
+        rows: Sequence[Mapping[str, str]],
+        *,
+        executor: Executor,
+    ) -> ImportResult:
+        """Import a chunk of rows, users with known emails are skipped."""
+        valid, invalid = _validate(rows)
+        new_users = self._create(_hash_passwords(_new_rows(valid), executor))
+        return ImportResult(
+            created=len(new_users),
+            skipped=len(valid) - len(new_users),
+            invalid=invalid,
+        )
+
+    def _create(self, users: List[User]) -> List[User]:
+        try:
+            self._save(users)
+        except IntegrityError:
+            # Some of them have registered after our check,
+            # they can keep registering, so we skip them one by one:
+            return [user for user in users if self._create_one(user)]
+        return users
+
+    def _create_one(self, user: User) -> bool:
+        try:
+            self._save([user])
+        except IntegrityError:
+            return False
+        return True
+
+    def _save(self, users: List[User]) -> None:
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            # Not all databases return ids of created rows:
+            LeadOutbox.objects.bulk_create(
+                LeadOutbox(user_id=user_id)
+                for user_id in User.objects.filter(
+                    email__in=[user.email for user in users],
+                ).values_list('id', flat=True)
+            )
+
+
+def _validate(
+    rows: Sequence[Mapping[str, str]],
+) -> Tuple[Dict[str, _UserRow], InvalidRows]:
+    valid: Dict[str, _UserRow] = {}
+    invalid = []
+    for row_number, row in enumerate(rows):
+        user = _user(row)
+        try:
+            # Uniqueness is checked for the whole chunk at once:
+            user.full_clean(exclude=['password'], validate_unique=False)
+        except ValidationError as exc:
+            invalid.append((row_number, '; '.join(exc.messages)))
+            continue
+        # The first row wins when emails are repeated:
+        valid.setdefault(user.email, (user, row.get('password') or None))
+    return valid, invalid
+
+
+def _user(row: Mapping[str, str]) -> User:
+    fields: Dict[str, Optional[str]] = {
+        field: row.get(field) or '' for field in _FIELDS
+    }
+    fields['email'] = User.objects.normalize_email(fields['email'])
+    fields['date_of_birth'] = fields['date_of_birth'] or None
+    return User(**fields)
+
+
+def _new_rows(valid: Dict[str, _UserRow]) -> List[_UserRow]:
+    existing = _existing_emails(list(valid))
+    return [
+        user_row for email, user_row in valid.items() if email not in existing
+    ]
+
+
+def _existing_emails(emails: List[str]) -> Set[str]:
+    existing = User.objects.filter(email__in=emails)
+    return set(existing.values_list('email', flat=True))
+
+
+def _hash_passwords(
+    user_rows: Sequence[_UserRow],
+    executor: Executor,
+) -> List[User]:
+    hashed_passwords = executor.map(
+        make_password,
+        [password for _, password in user_rows],
+        chunksize=max(len(user_rows) // _HASHING_BATCHES, 1),
+    )
+    users = [user for user, _ in user_rows]
+    for user, hashed_password in zip(users, hashed_passwords):
+        user.password = hashed_password
+    return users
@@ -1,9 +1,10 @@
+import datetime as dt
 from typing import final
 
 import attr
+from django.utils import timezone
 
-from server.apps.identity.intrastructure.services import placeholder
-from server.apps.identity.models import User
+from server.apps.identity.models import LeadUpdateOutbox, User
 from server.common.django.types import Settings
 
 
@@ -11,9 +12,12 @@ from server.common.django.types import Settings
 @attr.dataclass(slots=True, frozen=True)
 class UserUpdate(object):
     """
-    Update existing user in :term:`Placeholder API`.
+    Schedule updating existing user in :term:`Placeholder API`.
 
-    Get their :term:`lead_id` back and save it locally.
+    Changes are sent by :class:`LeadUpdateOutboxProcess`
+    after ``PLACEHOLDER_OUTBOX_DEBOUNCE`` seconds without new changes,
+    but no later than ``PLACEHOLDER_OUTBOX_MAX_DELAY`` seconds
+    after the first unsent change.
 
     .. warning:
         This use-case does not handle transactions!
@@ -24,10 +28,23 @@ class UserUpdate(object):
 
     def __call__(self, user: User) -> None:
         """Update existing user in the remote api."""
-        return self._update_lead(user)
-
-    def _update_lead(self, user: User) -> None:
-        return placeholder.LeadUpdate(
-            api_url=self._settings.PLACEHOLDER_API_URL,
-            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
-        )(user=user)
+        now = timezone.now()
+        outbox, _ = LeadUpdateOutbox.objects.get_or_create(user=user)
+        if outbox.pending_since is None:
+            outbox.pending_since = now
+        outbox.attempts = 0
+        outbox.next_attempt_at = min(
+            now + dt.timedelta(
+                seconds=self._settings.PLACEHOLDER_OUTBOX_DEBOUNCE,
+            ),
+            outbox.pending_since + dt.timedelta(
+                seconds=self._settings.PLACEHOLDER_OUTBOX_MAX_DELAY,
+            ),
+        )
+        # Other fields are changed by the worker at the same time:
+        outbox.save(update_fields=[
+            'pending_since',
+            'attempts',
+            'next_attempt_at',
+            'updated_at',
+        ])
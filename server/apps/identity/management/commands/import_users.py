@@ -0,0 +1,137 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Sequence, final
+
+import django
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_outbox_backfill import (
+    LeadOutboxBackfill,
+)
+from server.apps.identity.logic.usecases.user_import import UserImport
+from server.common.django.types import Settings
+
+
+@final
+class Command(BaseCommand):
+    """
+    Bulk import of users from ``.csv`` or ``.jsonl`` files.
+
+    Rows have the same fields as the registration form,
+    and an optional plain ``password``.
+    Imported rows are checkpointed after each chunk,
+    so the import continues where it stopped when it is run again.
+    Then :term:`lead_id` of imported users is backfilled
+    from the :term:`lead outbox` by concurrent, rate-limited calls.
+    """
+
+    help = 'Imports users from a file and creates them in Placeholder API.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Import options."""
+        settings = container.resolve(Settings)
+        parser.add_argument('path', type=Path)
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows saved in a single transaction.',
+        )
+        parser.add_argument(
+            '--hash-workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Processes that hash passwords.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.PLACEHOLDER_API_MAX_CONCURRENCY,
+            help='Concurrent Placeholder API calls, limited by its bulkhead.',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=10,
+            help='Placeholder API calls per second.',
+        )
+        parser.add_argument(
+            '--no-backfill',
+            action='store_true',
+            help='Leave users in the lead outbox for the regular worker.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Import all rows, then backfill their leads."""
+        for option in ('concurrency', 'rate'):
+            if options[option] <= 0:
+                raise CommandError('--{0} must be positive'.format(option))
+        self._import(options['path'], options)
+        if options['no_backfill']:
+            return
+        processed = container.instantiate(LeadOutboxBackfill)(
+            concurrency=options['concurrency'],
+            rate=options['rate'],
+        )
+        # Failed items stay in the outbox, the regular worker retries them:
+        self.stdout.write('Lead outbox items processed: {0}'.format(
+            processed,
+        ))
+
+    def _import(self, path: Path, options: Dict[str, Any]) -> None:
+        checkpoint = path.with_name('{0}.checkpoint'.format(path.name))
+        done = int(checkpoint.read_text()) if checkpoint.exists() else 0
+        rows = islice(_read_rows(path), done, None)
+
+        with ProcessPoolExecutor(
+            options['hash_workers'],
+            # Hashers are configured in settings:
+            initializer=django.setup,
+        ) as executor:
+            while True:  # noqa: WPS457
+                chunk = list(islice(rows, options['chunk_size']))
+                if not chunk:
+                    return
+                self._import_chunk(chunk, executor, done=done)
+                done += len(chunk)
+                _write_checkpoint(checkpoint, done)
+
+    def _import_chunk(
+        self,
+        chunk: Sequence[Mapping[str, str]],
+        executor: ProcessPoolExecutor,
+        *,
+        done: int,
+    ) -> None:
+        imported = container.instantiate(UserImport)(chunk, executor=executor)
+        for row_number, error in imported.invalid:
+            self.stderr.write('Row {0}: {1}'.format(
+                done + row_number + 1, error,
+            ))
+        self.stdout.write('Rows: {0}, created: {1}, skipped: {2}'.format(
+            done + len(chunk), imported.created, imported.skipped,
+        ))
+
+
+def _read_rows(path: Path) -> Iterator[Dict[str, str]]:
+    with path.open(newline='', encoding='utf8') as rows_file:
+        if path.suffix == '.jsonl':
+            yield from (json.loads(line) for line in rows_file if line.strip())
+        else:
+            yield from csv.DictReader(rows_file)
+
+
+def _write_checkpoint(checkpoint: Path, done: int) -> None:
+    # Replacing is atomic, so the checkpoint is never half-written:
+    temporary = checkpoint.with_name('{0}.tmp'.format(checkpoint.name))
+    temporary.write_text(str(done))
+    os.replace(temporary, checkpoint)
@@ -0,0 +1,53 @@
+import time
+from typing import Any, final
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.lead_outbox_process import (
+    LeadOutboxProcess,
+    LeadUpdateOutboxProcess,
+)
+from server.common.django.types import Settings
+
+
+@final
+class Command(BaseCommand):
+    """Worker that sends users from the :term:`lead outbox`."""
+
+    help = 'Creates and updates users in Placeholder API.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Worker options."""
+        settings = container.resolve(Settings)
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.PLACEHOLDER_OUTBOX_BATCH_SIZE,
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1,
+            help='Seconds to sleep when the outbox is empty.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process a single batch and exit.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Process the outbox until stopped."""
+        processors = (
+            container.instantiate(LeadOutboxProcess),
+            container.instantiate(LeadUpdateOutboxProcess),
+        )
+        while True:  # noqa: WPS457
+            processed = sum(
+                process(options['batch_size']) for process in processors
+            )
+            if options['once']:
+                return
+            if not processed:
+                time.sleep(options['poll_interval'])
@@ -0,0 +1,62 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:34
+
+import uuid
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+class Migration(migrations.Migration):
+    """Adds lead outbox for async user creation in Placeholder API."""
+
+    dependencies = [
+        ('identity', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadOutbox',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                (
+                    'idempotency_key',
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        unique=True,
+                    ),
+                ),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                (
+                    'next_attempt_at',
+                    models.DateTimeField(
+                        db_index=True,
+                        default=timezone.now,
+                    ),
+                ),
+                ('last_error', models.TextField(blank=True)),
+                (
+                    'user',
+                    models.OneToOneField(
+                        on_delete=models.CASCADE,
+                        related_name='lead_outbox',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
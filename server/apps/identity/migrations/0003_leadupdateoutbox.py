@@ -0,0 +1,52 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Adds coalesced outbox for user updates in Placeholder API."""
+
+    dependencies = [
+        ('identity', '0002_leadoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadUpdateOutbox',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                (
+                    'sent_fingerprint',
+                    models.CharField(blank=True, max_length=64),
+                ),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                (
+                    'next_attempt_at',
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+                ('last_error', models.TextField(blank=True)),
+                (
+                    'user',
+                    models.OneToOneField(
+                        on_delete=models.CASCADE,
+                        related_name='lead_update_outbox',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.18 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Adds the time of the first unsent user change."""
+
+    dependencies = [
+        ('identity', '0003_leadupdateoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='leadupdateoutbox',
+            name='pending_since',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import uuid
 from typing import TYPE_CHECKING, Final, final
 
 from django.contrib.auth.models import (
@@ -6,11 +7,13 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.utils import timezone
 
 from server.common.django.models import TimedMixin
 
 # For now we use a single length for all items, later it can be changed.
 _NAME_LENGTH: Final = 254
+_SHA256_HEX_LENGTH: Final = 64
 
 
 @final
@@ -90,3 +93,72 @@ class User(AbstractBaseUser, PermissionsMixin, TimedMixin):
         # Raw password that is stored in the instance before it is saved,
         # it is actually `str | None` in runtime, but `str` in most tests.
         _password: str
+
+
+@final
+class LeadOutbox(TimedMixin, models.Model):
+    """
+    Users waiting to be created in :term:`Placeholder API`.
+
+    Rows are saved in the same transaction as users themselves,
+    so we never lose them and never wait for the remote API while
+    holding database locks. See :term:`lead outbox`.
+    """
+
+    # Linking:
+    user = models.OneToOneField(
+        User,
+        related_name='lead_outbox',
+        on_delete=models.CASCADE,
+    )
+
+    # Sent with each request, so retries do not create duplicate leads:
+    idempotency_key = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+    )
+
+    # Retries:
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<LeadOutbox for {0}>'.format(self.user_id)
+
+
+@final
+class LeadUpdateOutbox(TimedMixin, models.Model):
+    """
+    Users whose changes are not yet sent to :term:`Placeholder API`.
+
+    There is at most one row per user: repeated saves are coalesced,
+    only the latest state is sent and unchanged users are skipped.
+    """
+
+    # Linking:
+    user = models.OneToOneField(
+        User,
+        related_name='lead_update_outbox',
+        on_delete=models.CASCADE,
+    )
+
+    # Fingerprint of the last state we have sent:
+    sent_fingerprint = models.CharField(
+        max_length=_SHA256_HEX_LENGTH,
+        blank=True,
+    )
+
+    # When the first change that is not sent yet was made:
+    pending_since = models.DateTimeField(null=True, blank=True)
+
+    # Retries, empty `next_attempt_at` means that there's nothing to send:
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<LeadUpdateOutbox for {0}>'.format(self.user_id)
@@ -38,8 +38,8 @@ class RegistrationView(RatelimitMixin, FormView[RegistrationForm]):
     """
     Registers users.
 
-    After the registration we notify :term:`Placeholder API`
-    about new users and get their ids back.
+    After the registration we add new users to the :term:`lead outbox`,
+    so :term:`Placeholder API` is notified without slowing us down.
     """
 
     form_class = RegistrationForm
@@ -57,5 +57,5 @@ class RegistrationView(RatelimitMixin, FormView[RegistrationForm]):
         user_create_new = container.instantiate(UserCreateNew)
         with transaction.atomic():
             user = form.save()
-            user_create_new(user)  # does http request, can slow down db
+            user_create_new(user)  # only writes to the outbox, fast
         return super().form_valid(form)
@@ -2,6 +2,7 @@ from typing import Optional, final
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpResponse
 from django.urls import reverse_lazy
@@ -44,13 +45,14 @@ class UserUpdateView(RatelimitMixin, UpdateView[User, UserUpdateForm]):
 
         In this case we need to:
         1. Show success message
-        2. Sync information with :term:`Placeholder API`
+        2. Schedule sync with :term:`Placeholder API`
         """
         user_update = container.instantiate(UserUpdate)
 
         # Using Russian text without `gettext` is ugly, but we don't support
         # other languages at all in this demo.
         messages.success(self.request, 'Ваши данные сохранены')
-        response = super().form_valid(form)
-        user_update(self.object)
+        with transaction.atomic():
+            response = super().form_valid(form)
+            user_update(self.object)  # only writes to the outbox, fast
         return response
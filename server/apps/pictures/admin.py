@@ -1,8 +1,14 @@
-from typing import final
+from typing import Any, final
 
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 
-from server.apps.pictures.models import FavouritePicture
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_list import (
+    FavouritesInvalidate,
+)
+from server.apps.pictures.models import FavouritePicture, Picture
 from server.common.django.admin import TimeReadOnlyMixin
 
 
@@ -17,3 +23,44 @@ class FavouritePictureAdmin(
     list_display = ('id', 'foreign_id', 'url', 'user_id')
     list_select_related = ('user',)
     raw_id_fields = ('user',)
+
+    def save_model(
+        self,
+        request: HttpRequest,
+        obj: FavouritePicture,  # noqa: WPS110
+        form: Any,
+        change: bool,
+    ) -> None:
+        """Drop cached :term:`favourites` of the changed user."""
+        super().save_model(request, obj, form, change)
+        container.instantiate(FavouritesInvalidate)(obj.user_id)
+
+    def delete_model(
+        self,
+        request: HttpRequest,
+        obj: FavouritePicture,  # noqa: WPS110
+    ) -> None:
+        """Drop cached :term:`favourites` of the changed user."""
+        super().delete_model(request, obj)
+        container.instantiate(FavouritesInvalidate)(obj.user_id)
+
+    def delete_queryset(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[FavouritePicture],
+    ) -> None:
+        """Drop cached :term:`favourites` of all changed users."""
+        user_ids = set(queryset.values_list('user_id', flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_favourites = container.instantiate(FavouritesInvalidate)
+        for user_id in user_ids:
+            invalidate_favourites(user_id)
+
+
+@final
+@admin.register(Picture)
+class PictureAdmin(TimeReadOnlyMixin, admin.ModelAdmin[Picture]):
+    """This class represents `Picture` in admin panel."""
+
+    list_display = ('id', 'foreign_id', 'url', 'updated_at')
+    search_fields = ('=foreign_id',)
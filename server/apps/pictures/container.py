@@ -1,12 +1,27 @@
+from functools import partial
+
 import punq
+import requests
 from django.conf import settings
 
 from server.common.django.types import Settings
+from server.common.services import circuit_breaker, http
 
 container = punq.Container()
 
 # Custom dependencies go here:
-# TODO: add custom deps
+container.register(
+    requests.Session,
+    # Created lazily, so each worker process gets its own connection pool:
+    factory=partial(http.create_session, settings),
+    scope=punq.Scope.singleton,
+)
+container.register(
+    circuit_breaker.CircuitBreaker,
+    # Bulkheads are per process, circuit state is in the shared cache:
+    factory=partial(circuit_breaker.create_circuit_breaker, settings),
+    scope=punq.Scope.singleton,
+)
 
 # Django stuff:
 container.register(Settings, instance=settings)
@@ -1,8 +1,15 @@
-from typing import Any, final
+from typing import Any, Dict, Final, List, final
 
 from django import forms
 
 from server.apps.pictures.models import FavouritePicture
+from server.common.django.forms import MultipleValueField
+
+#: We don't want too large insert statements:
+_MAX_BULK_SIZE: Final = 100
+
+#: Default length of `FavouritePicture.url` model field:
+_URL_LENGTH: Final = 200
 
 
 @final
@@ -19,9 +26,67 @@ class FavouritesForm(forms.ModelForm[FavouritePicture]):
         super().__init__(*args, **kwargs)
 
     def save(self, commit: bool = True) -> FavouritePicture:
-        """Add user to the model instance."""
+        """
+        Add user to the model instance.
+
+        Saving is idempotent: pictures that are already
+        in user's :term:`favourites` are ignored.
+        """
         instance = super().save(commit=False)
         instance.user_id = self._user.id
         if commit:
-            instance.save()
+            # `INSERT ... ON CONFLICT DO NOTHING`, so it is a single query:
+            FavouritePicture.objects.bulk_create(
+                [instance],
+                ignore_conflicts=True,
+            )
         return instance
+
+
+@final
+class FavouritesBulkForm(forms.Form):
+    """
+    Add many pictures to :term:`favourites` at once.
+
+    Expects the same number of ``foreign_id`` and ``url`` values.
+    """
+
+    foreign_id = MultipleValueField(forms.IntegerField())
+    url = MultipleValueField(forms.URLField(max_length=_URL_LENGTH))
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """We need an extra context: which user is adding items."""
+        self._user = kwargs.pop('user')
+        super().__init__(*args, **kwargs)
+
+    def clean(self) -> Dict[str, Any]:
+        """Check that ids and urls come in pairs."""
+        super().clean()
+        # `clean()` is typed as optional, cleaned data itself is not:
+        cleaned_data = self.cleaned_data
+        foreign_ids = cleaned_data.get('foreign_id', [])
+        urls = cleaned_data.get('url', [])
+        if len(foreign_ids) != len(urls):
+            raise forms.ValidationError('Each picture must have id and url')
+        if len(foreign_ids) > _MAX_BULK_SIZE:
+            raise forms.ValidationError(
+                'Too many pictures, max is {0}'.format(_MAX_BULK_SIZE),
+            )
+        return cleaned_data
+
+    def save(self) -> List[FavouritePicture]:
+        """Save all pictures with a single query, duplicates are ignored."""
+        return FavouritePicture.objects.bulk_create(
+            [
+                FavouritePicture(
+                    user_id=self._user.id,
+                    foreign_id=foreign_id,
+                    url=url,
+                )
+                for foreign_id, url in zip(
+                    self.cleaned_data['foreign_id'],
+                    self.cleaned_data['url'],
+                )
+            ],
+            ignore_conflicts=True,
+        )
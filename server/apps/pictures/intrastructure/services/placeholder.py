@@ -1,21 +1,39 @@
-from typing import List, final
+from http import HTTPStatus
+from typing import Any, List, Optional, final
 
-import pydantic
+import attr
 import requests
 
-from server.common import pydantic_model
-from server.common.services import http
+from server.common.services import http, json_stream
 
 
 @final
-class PictureResponse(pydantic_model.BaseModel):
-    """Schema for API response with :term:`picture` items."""
+@attr.dataclass(frozen=True, slots=True)
+class PictureResponse(object):
+    """
+    Schema for API response with :term:`picture` items.
+
+    It is a compact record instead of a ``pydantic`` model:
+    we fetch a lot of them and only need two fields.
+    """
 
     id: int
     url: str
 
+    @classmethod
+    def from_json(cls, element: Any) -> 'PictureResponse':
+        """Validate parsed JSON element, raises ``ValueError`` for bad ones."""
+        try:
+            picture_id, url = element['id'], element['url']
+        except (TypeError, KeyError):
+            raise ValueError('Picture must have id and url: {0!r}'.format(
+                element,
+            ))
+        if not _is_id(picture_id) or not isinstance(url, str):
+            raise ValueError('Invalid picture: {0!r}'.format(element))
+        return cls(id=picture_id, url=url)
+
 
-# TODO: use redis-based caching
 @final
 class PicturesFetch(http.BaseFetcher):
     """Service around fetching pictures from :term:`Placeholder API`."""
@@ -27,11 +45,66 @@ class PicturesFetch(http.BaseFetcher):
         *,
         limit: int,
     ) -> List[PictureResponse]:
-        """Create remote user and return assigned ids."""
-        response = requests.get(
+        """Fetch pictures, the response is parsed while it is downloaded."""
+        with self._request(
+            'GET',
             self.url_path(),
             params={'_limit': limit},
-            timeout=self._api_timeout,
-        )
-        response.raise_for_status()
-        return pydantic.parse_raw_as(List[PictureResponse], response.text)
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            return _parse_pictures(response)
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class PicturesPage(object):
+    """Single page of :term:`picture` items with its ``ETag``."""
+
+    pictures: List[PictureResponse]
+    etag: Optional[str]
+
+
+@final
+class PicturesPageFetch(http.BaseFetcher):
+    """Service around paging through all :term:`Placeholder API` pictures."""
+
+    _url_path = '/photos'
+
+    def __call__(
+        self,
+        *,
+        page: int,
+        limit: int,
+        etag: Optional[str] = None,
+    ) -> Optional[PicturesPage]:
+        """Fetch a page, ``None`` means it did not change since ``etag``."""
+        headers = {}
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        with self._request(
+            'GET',
+            self.url_path(),
+            params={'_page': page, '_limit': limit},
+            headers=headers,
+            stream=True,
+        ) as response:
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                return None
+            response.raise_for_status()
+            return PicturesPage(
+                pictures=_parse_pictures(response),
+                etag=response.headers.get('ETag'),
+            )
+
+
+def _is_id(picture_id: Any) -> bool:
+    # `bool` is a subclass of `int`, but `true` is not a valid id:
+    return isinstance(picture_id, int) and not isinstance(picture_id, bool)
+
+
+def _parse_pictures(response: requests.Response) -> List[PictureResponse]:
+    return [
+        PictureResponse.from_json(element)
+        for element in json_stream.iter_json_array(response)
+    ]
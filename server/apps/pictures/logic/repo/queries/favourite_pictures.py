@@ -1,9 +1,34 @@
+from typing import Optional
+
 from django.db.models import QuerySet
 
 from server.apps.pictures.models import FavouritePicture
+from server.common.django import pagination
 
 
 def by_user(user_id: int) -> QuerySet[FavouritePicture]:
     """Search :class:`FavouritePicture` by user id."""
-    # TODO: this should be limited and probably paginated
     return FavouritePicture.objects.filter(user_id=user_id)
+
+
+def page_by_user(
+    user_id: int,
+    *,
+    cursor: Optional[str],
+    page_size: int,
+    using: Optional[str] = None,
+) -> pagination.KeysetPage[FavouritePicture]:
+    """
+    Single page of :class:`FavouritePicture` by user id, newest first.
+
+    Only columns of the covering index are loaded,
+    so pages are read with index-only scans.
+    Pass ``using`` to read from a specific database instead of the routed one.
+    """
+    return pagination.paginate(
+        by_user(user_id).using(using).only(
+            'user', 'created_at', 'foreign_id', 'url',
+        ),
+        cursor=cursor,
+        page_size=page_size,
+    )
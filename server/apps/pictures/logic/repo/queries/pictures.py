@@ -0,0 +1,15 @@
+from typing import Iterable
+
+from django.db.models import QuerySet
+
+from server.apps.pictures.models import Picture
+
+
+def first(limit: int) -> QuerySet[Picture]:
+    """The same :class:`Picture` items the API returns for ``_limit``."""
+    return Picture.objects.order_by('foreign_id')[:limit]
+
+
+def by_foreign_ids(foreign_ids: Iterable[int]) -> QuerySet[Picture]:
+    """Search :class:`Picture` by their :term:`Placeholder API` ids."""
+    return Picture.objects.filter(foreign_id__in=foreign_ids)
@@ -0,0 +1,15 @@
+from typing import final
+
+import attr
+
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesCount(object):
+    """Count :term:`favourites` pictures for a given user."""
+
+    def __call__(self, user_id: int) -> int:
+        """Return the number of saved pictures."""
+        return favourite_pictures.by_user(user_id).count()
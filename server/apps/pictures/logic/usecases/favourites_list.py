@@ -1,21 +1,111 @@
-from typing import final
+import hashlib
+from typing import Optional, final
 
 import attr
-from django.db.models import QuerySet
+from django.core.cache import BaseCache, caches
+from django.db import DEFAULT_DB_ALIAS
 
 # NOTE: this can be a dependency as well
 from server.apps.pictures.logic.repo.queries import favourite_pictures
 from server.apps.pictures.models import FavouritePicture
+from server.common.django.pagination import KeysetPage
+from server.common.django.types import Settings
+from server.common.services import caching, metrics
 
 
 @final
 @attr.dataclass(slots=True, frozen=True)
 class FavouritesList(object):
-    """List :term:`favourites` pictures for a given user."""
+    """
+    List :term:`favourites` pictures for a given user page by page.
 
-    def __call__(self, user_id: int) -> QuerySet[FavouritePicture]:
-        """Update existing user in the remote api."""
-        return self._list_pictures(user_id)
+    Pages are cached until user's favourites change,
+    see :class:`FavouritesInvalidate`.
+    """
 
-    def _list_pictures(self, user_id: int) -> QuerySet[FavouritePicture]:
-        return favourite_pictures.by_user(user_id)
+    _settings: Settings
+
+    def __call__(
+        self,
+        user_id: int,
+        *,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+    ) -> KeysetPage[FavouritePicture]:
+        """Return a page of pictures, ``cursor`` comes from a previous one."""
+        cache = _cache(self._settings)
+        version = caching.get_version(cache, _version_key(user_id))
+        page_key = 'pictures:favourites:{0}:{1}:{2}'.format(
+            user_id,
+            page_size,
+            # Cursors come from users, we don't want them in keys as is:
+            hashlib.sha256((cursor or '').encode('utf8')).hexdigest(),
+        )
+
+        page = cache.get(page_key, version=version)
+        metrics.CACHE_LOOKUPS.labels(
+            'pictures_favourites', 'miss' if page is None else 'hit',
+        ).inc()
+        if page is None:
+            page = self._list_pictures(user_id, cursor, page_size)
+            cache.set(
+                page_key,
+                page,
+                timeout=self._settings.PICTURES_FAVOURITES_CACHE_TTL,
+                version=version,
+            )
+        return page
+
+    def _list_pictures(
+        self,
+        user_id: int,
+        cursor: Optional[str],
+        page_size: int,
+    ) -> KeysetPage[FavouritePicture]:
+        # Cached pages outlive the primary pin of `ReplicaReadsMiddleware`,
+        # so they are never filled from the lagging replica:
+        return favourite_pictures.page_by_user(
+            user_id,
+            cursor=cursor,
+            page_size=page_size,
+            using=DEFAULT_DB_ALIAS,
+        )
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesInvalidate(object):
+    """Drop cached :term:`favourites`, must be called after each change."""
+
+    _settings: Settings
+
+    def __call__(self, user_id: int) -> None:
+        """Invalidate all cached pages of a given user."""
+        caching.bump_version(_cache(self._settings), _version_key(user_id))
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class FavouritesVersion(object):
+    """
+    Version of :term:`favourites`, it changes with each change of them.
+
+    It is only a cache lookup, so it is cheap enough for ``ETag``.
+    """
+
+    _settings: Settings
+
+    def __call__(self, user_id: int) -> int:
+        """Current version of user's favourites."""
+        return caching.get_version(
+            _cache(self._settings),
+            _version_key(user_id),
+        )
+
+
+def _cache(settings: Settings) -> BaseCache:
+    return caches[settings.PICTURES_FAVOURITES_CACHE]
+
+
+def _version_key(user_id: int) -> str:
+    return 'pictures:favourites:{0}:version'.format(user_id)
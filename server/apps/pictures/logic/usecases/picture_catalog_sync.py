@@ -0,0 +1,117 @@
+import hashlib
+from typing import List, Optional, Tuple, final
+
+import attr
+import requests
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.utils import timezone
+
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.repo.queries import pictures as pictures_query
+from server.apps.pictures.models import Picture
+from server.common.django.types import Settings
+from server.common.services import circuit_breaker
+
+#: What we remember about synced pages: their ``ETag`` and content hash.
+_PageState = Tuple[Optional[str], str]
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class PictureCatalogSync(object):
+    """
+    Copy all :term:`Placeholder API` pictures to the :term:`picture catalog`.
+
+    Pages that did not change since the last sync are skipped:
+    by their ``ETag`` when the API sends it, by content hash otherwise.
+    Pictures removed from the API are kept.
+    """
+
+    _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
+
+    def __call__(self) -> int:
+        """Sync the whole catalog, returns the number of saved pictures."""
+        page_size = self._settings.PLACEHOLDER_CATALOG_PAGE_SIZE
+        saved = 0
+        page_number = 0
+        has_more = True
+        while has_more:
+            page_number += 1
+            page_saved, has_more = self._sync_page(page_number, page_size)
+            saved += page_saved
+        return saved
+
+    def _sync_page(self, page_number: int, page_size: int) -> Tuple[int, bool]:
+        state_key = 'placeholder:catalog:{0}:{1}'.format(
+            page_size, page_number,
+        )
+        known_state: Optional[_PageState] = self._cache().get(state_key)
+        page = self._fetch_page(
+            page_number,
+            page_size,
+            etag=known_state[0] if known_state else None,
+        )
+        if page is None:
+            return 0, True  # not modified
+
+        content_hash = _content_hash(page.pictures)
+        saved = 0
+        if known_state is None or known_state[1] != content_hash:
+            saved = _save(page.pictures)
+            self._cache().set(
+                state_key, (page.etag, content_hash), timeout=None,
+            )
+        # Only the last page is not full:
+        return saved, len(page.pictures) == page_size
+
+    def _cache(self) -> BaseCache:
+        return caches[self._settings.PLACEHOLDER_API_CACHE]
+
+    def _fetch_page(
+        self,
+        page_number: int,
+        page_size: int,
+        *,
+        etag: Optional[str],
+    ) -> Optional[placeholder.PicturesPage]:
+        return placeholder.PicturesPageFetch(
+            api_url=self._settings.PLACEHOLDER_API_URL,
+            api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
+        )(page=page_number, limit=page_size, etag=etag)
+
+
+def _content_hash(pictures: List[placeholder.PictureResponse]) -> str:
+    digest = hashlib.sha256()
+    for picture in pictures:
+        digest.update('{0}|{1}\n'.format(picture.id, picture.url).encode())
+    return digest.hexdigest()
+
+
+def _save(pictures: List[placeholder.PictureResponse]) -> int:
+    known = {
+        picture.foreign_id: picture
+        for picture in pictures_query.by_foreign_ids(
+            [picture.id for picture in pictures],
+        )
+    }
+    new_pictures = []
+    changed_pictures = []
+    for fetched in pictures:
+        existing = known.get(fetched.id)
+        if existing is None:
+            new_pictures.append(Picture(foreign_id=fetched.id, url=fetched.url))
+        elif existing.url != fetched.url:
+            existing.url = fetched.url
+            existing.updated_at = timezone.now()  # not set by `bulk_update`
+            changed_pictures.append(existing)
+
+    with transaction.atomic():
+        # Other workers might be saving the same pictures:
+        Picture.objects.bulk_create(new_pictures, ignore_conflicts=True)
+        Picture.objects.bulk_update(changed_pictures, ['url', 'updated_at'])
+    return len(new_pictures) + len(changed_pictures)
@@ -1,24 +1,111 @@
+from functools import partial
 from typing import List, final
 
 import attr
+import requests
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
 
 from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.logic.repo.queries import pictures
 from server.common.django.types import Settings
+from server.common.services import caching, circuit_breaker
 
 
 @final
 @attr.dataclass(slots=True, frozen=True)
 class PicturesFetch(object):
-    """Fetch :term:`picture` items from :term:`Placeholder API`."""
+    """
+    Fetch :term:`picture` items from the :term:`picture catalog`.
+
+    Until the catalog is synced, they are fetched from :term:`Placeholder API`
+    and cached per ``limit``, see ``PLACEHOLDER_API_CACHE*`` settings.
+    When the API circuit is open, we return whatever we still have cached,
+    possibly nothing.
+    """
 
     _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
 
     def __call__(self, limit: int = 10) -> List[placeholder.PictureResponse]:
-        """Update existing user in the remote api."""
-        return self._fetch_pictures(limit)
+        """Return first ``limit`` pictures, the same ones the API returns."""
+        return self.from_catalog(limit) or self.from_api(limit)
+
+    def from_catalog(self, limit: int) -> List[placeholder.PictureResponse]:
+        """Return pictures from the catalog, empty until it is synced."""
+        return [
+            placeholder.PictureResponse(id=foreign_id, url=url)
+            for foreign_id, url in pictures.first(limit).values_list(
+                'foreign_id', 'url',
+            )
+        ]
+
+    def from_api(self, limit: int) -> List[placeholder.PictureResponse]:
+        """Return cached pictures from the API, it does not use the database."""
+        cached_fetch = self._cached_fetch()
+        # Bump the version when `PictureResponse` changes, values are pickled:
+        cache_key = 'placeholder:pictures:v2:{0}'.format(limit)
+        try:
+            return cached_fetch(
+                cache_key,
+                partial(self._fetch_pictures, limit),
+            )
+        except circuit_breaker.CallRejectedError:
+            return cached_fetch.peek(cache_key) or []
+
+    def _cached_fetch(self) -> caching.StaleWhileRevalidate:
+        return caching.StaleWhileRevalidate(
+            cache=caches[self._settings.PLACEHOLDER_API_CACHE],
+            ttl=self._settings.PLACEHOLDER_API_CACHE_TTL,
+            stale_ttl=self._settings.PLACEHOLDER_API_CACHE_STALE_TTL,
+            lock_timeout=self._settings.PLACEHOLDER_API_CACHE_LOCK_TIMEOUT,
+            max_wait=self._settings.PLACEHOLDER_API_CACHE_MAX_WAIT,
+            name='placeholder_pictures',
+        )
 
     def _fetch_pictures(self, limit: int) -> List[placeholder.PictureResponse]:
         return placeholder.PicturesFetch(
             api_url=self._settings.PLACEHOLDER_API_URL,
             api_timeout=self._settings.PLACEHOLDER_API_TIMEOUT,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
         )(limit=limit)
+
+
+@final
+@attr.dataclass(slots=True, frozen=True)
+class PicturesFetchAsync(object):
+    """
+    Async version of :class:`PicturesFetch`.
+
+    Pictures are loaded in threads, so the event loop is not blocked
+    and other work can be done concurrently.
+    The catalog query runs in the thread that owns database connections,
+    the API fallback runs in its own thread, so a slow API call
+    does not hold up database queries awaited together with it.
+    """
+
+    _settings: Settings
+    _session: requests.Session
+    _circuit_breaker: circuit_breaker.CircuitBreaker
+
+    async def __call__(
+        self,
+        limit: int = 10,
+    ) -> List[placeholder.PictureResponse]:
+        """Fetch pictures without blocking the event loop."""
+        fetch_pictures = PicturesFetch(
+            settings=self._settings,
+            session=self._session,
+            circuit_breaker=self._circuit_breaker,
+        )
+        catalog_pictures = await sync_to_async(fetch_pictures.from_catalog)(
+            limit,
+        )
+        if catalog_pictures:
+            return catalog_pictures
+        return await sync_to_async(
+            fetch_pictures.from_api,
+            thread_sensitive=False,
+        )(limit)
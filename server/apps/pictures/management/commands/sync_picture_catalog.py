@@ -0,0 +1,56 @@
+import time
+from typing import Any, Final, final
+
+import requests
+from django.core.management.base import BaseCommand, CommandParser
+
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.picture_catalog_sync import (
+    PictureCatalogSync,
+)
+from server.common.django.types import Settings
+
+#: Sync can be retried after these, invalid API responses included:
+_SYNC_ERRORS: Final = (requests.RequestException, ValueError)
+
+
+@final
+class Command(BaseCommand):
+    """Worker that keeps the :term:`picture catalog` in sync."""
+
+    help = 'Copies pictures from Placeholder API to the local catalog.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Worker options."""
+        settings = container.resolve(Settings)
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.PLACEHOLDER_CATALOG_SYNC_INTERVAL,
+            help='Seconds to sleep between syncs.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Sync the catalog once and exit.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: WPS110
+        """Sync the catalog until stopped."""
+        sync_catalog = container.instantiate(PictureCatalogSync)
+        while True:  # noqa: WPS457
+            self._sync(sync_catalog, once=options['once'])
+            if options['once']:
+                return
+            time.sleep(options['interval'])
+
+    def _sync(self, sync_catalog: PictureCatalogSync, *, once: bool) -> None:
+        try:
+            saved = sync_catalog()
+        except _SYNC_ERRORS as exc:
+            if once:
+                raise
+            # Dashboard still has the old catalog, we will try later:
+            self.stderr.write('Sync failed: {0}'.format(exc))
+        else:
+            self.stdout.write('Saved pictures: {0}'.format(saved))
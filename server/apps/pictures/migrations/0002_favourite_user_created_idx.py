@@ -0,0 +1,59 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:37
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+#: Index that Django creates for the foreign key by default:
+_USER_INDEX = '"pictures_favouritepicture_user_id_18be7a23"'
+
+_CREATE_USER_INDEX = 'CREATE INDEX CONCURRENTLY IF NOT EXISTS {0} ON {1} ({2});'
+
+
+class Migration(migrations.Migration):
+    """Adds composite index for keyset pagination of favourites."""
+
+    # Indexes are built concurrently, without locking writes:
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('pictures', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='favouritepicture',
+            index=models.Index(
+                fields=['user', '-created_at', '-id'],
+                name='pictures_user_created_idx',
+            ),
+        ),
+        # The new index starts with `user_id`, so the old one is redundant:
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='favouritepicture',
+                    name='user',
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=models.CASCADE,
+                        related_name='pictures',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'DROP INDEX CONCURRENTLY IF EXISTS {0};'.format(
+                        _USER_INDEX,
+                    ),
+                    reverse_sql=_CREATE_USER_INDEX.format(
+                        _USER_INDEX,
+                        '"pictures_favouritepicture"',
+                        '"user_id"',
+                    ),
+                ),
+            ],
+        ),
+    ]
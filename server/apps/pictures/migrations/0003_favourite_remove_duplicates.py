@@ -0,0 +1,39 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+#: Pictures are unique by this field for each user:
+_FOREIGN_ID = 'foreign_id'
+
+
+def _remove_duplicates(apps, schema_editor):
+    """Keeps the oldest row for each duplicated picture."""
+    FavouritePicture = apps.get_model(  # noqa: N806
+        'pictures',
+        'FavouritePicture',
+    )
+    duplicates = FavouritePicture.objects.values(
+        'user_id',
+        _FOREIGN_ID,
+    ).annotate(
+        first_id=models.Min('id'),
+        total=models.Count('id'),
+    ).filter(total__gt=1)
+
+    for duplicate in duplicates.iterator():
+        FavouritePicture.objects.filter(
+            user_id=duplicate['user_id'],
+            foreign_id=duplicate[_FOREIGN_ID],
+        ).exclude(id=duplicate['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+    """Removes duplicated favourites before they are made unique."""
+
+    dependencies = [
+        ('pictures', '0002_favourite_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(_remove_duplicates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+_TABLE = '"pictures_favouritepicture"'
+_CONSTRAINT = '"pictures_unique_user_foreign_id"'
+
+
+class Migration(migrations.Migration):
+    """Makes favourites unique per user."""
+
+    # The unique index is built concurrently, without locking writes:
+    atomic = False
+
+    dependencies = [
+        ('pictures', '0003_favourite_remove_duplicates'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='favouritepicture',
+                    constraint=models.UniqueConstraint(
+                        fields=('user', 'foreign_id'),
+                        name='pictures_unique_user_foreign_id',
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY {0} ON {1} {2};'.format(
+                        _CONSTRAINT,
+                        _TABLE,
+                        '("user_id", "foreign_id")',
+                    ),
+                    reverse_sql='DROP INDEX CONCURRENTLY {0};'.format(
+                        _CONSTRAINT,
+                    ),
+                ),
+                # Attaching a ready index only takes a short lock:
+                migrations.RunSQL(
+                    'ALTER TABLE {0} ADD CONSTRAINT {1} {2};'.format(
+                        _TABLE,
+                        _CONSTRAINT,
+                        'UNIQUE USING INDEX {0}'.format(_CONSTRAINT),
+                    ),
+                    reverse_sql='ALTER TABLE {0} DROP CONSTRAINT {1};'.format(
+                        _TABLE,
+                        _CONSTRAINT,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:40
+
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Replaces keyset index of favourites with a covering one."""
+
+    # Indexes are built concurrently, without locking writes:
+    atomic = False
+
+    dependencies = [
+        ('pictures', '0004_favourite_unique_user_foreign_id'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='favouritepicture',
+            index=models.Index(
+                fields=['user', '-created_at', '-id'],
+                include=('foreign_id', 'url'),
+                name='pictures_user_created_cov_idx',
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name='favouritepicture',
+            name='pictures_user_created_idx',
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.18 on 2026-10-18 18:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Adds local picture catalog."""
+
+    dependencies = [
+        ('pictures', '0005_favourite_user_created_cov_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Picture',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('foreign_id', models.IntegerField(unique=True)),
+                ('url', models.URLField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -15,12 +15,49 @@ class FavouritePicture(TimedMixin, models.Model):
         settings.AUTH_USER_MODEL,
         related_name='pictures',
         on_delete=models.CASCADE,
+        # Covered by the composite index below:
+        db_index=False,
     )
 
     # Data:
     foreign_id = models.IntegerField()
     url = models.URLField()
 
+    class Meta(object):
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'foreign_id'],
+                name='pictures_unique_user_foreign_id',
+            ),
+        ]
+        indexes = [
+            # Used for keyset pagination of user's favourites,
+            # it covers all listed columns for index-only scans,
+            # see `favourite_pictures.page_by_user` query:
+            models.Index(
+                fields=['user', '-created_at', '-id'],
+                include=['foreign_id', 'url'],
+                name='pictures_user_created_cov_idx',
+            ),
+        ]
+
     def __str__(self) -> str:
         """Beatuful representation."""
         return '<Picture {0} by {1}>'.format(self.foreign_id, self.user_id)
+
+
+@final
+class Picture(TimedMixin, models.Model):
+    """
+    Represents a :term:`picture` from the local :term:`picture catalog`.
+
+    It is a copy of :term:`Placeholder API` data,
+    which is kept in sync by a background worker.
+    """
+
+    foreign_id = models.IntegerField(unique=True)
+    url = models.URLField()
+
+    def __str__(self) -> str:
+        """Beatuful representation."""
+        return '<Picture {0}>'.format(self.foreign_id)
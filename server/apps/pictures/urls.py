@@ -1,10 +1,20 @@
 from django.urls import path
 
-from server.apps.pictures.views import DashboardView, FavouritePicturesView
+from server.apps.pictures.views.dashboard_async import dashboard
+from server.apps.pictures.views.favourites import (
+    FavouritePicturesView,
+    FavouritesBulkCreateView,
+)
 
 app_name = 'pictures'
 
 urlpatterns = [
-    path('dashboard', DashboardView.as_view(), name='dashboard'),
+    # TODO: `django-stubs` does not allow async views in `path`:
+    path('dashboard', dashboard, name='dashboard'),  # type: ignore[arg-type]
     path('favourites', FavouritePicturesView.as_view(), name='favourites'),
+    path(
+        'favourites/bulk',
+        FavouritesBulkCreateView.as_view(),
+        name='favourites_bulk',
+    ),
 ]
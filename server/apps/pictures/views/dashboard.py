@@ -2,30 +2,23 @@ from typing import Any, Dict, final
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import QuerySet
 from django.http import HttpResponse
 from django.urls import reverse_lazy
-from django.views.generic import TemplateView
 from django.views.generic.edit import CreateView
-from django.views.generic.list import ListView
 
 from server.apps.pictures.container import container
 from server.apps.pictures.intrastructure.django.forms import FavouritesForm
-from server.apps.pictures.logic.usecases.favourites_list import FavouritesList
+from server.apps.pictures.logic.usecases.favourites_count import (
+    FavouritesCount,
+)
+from server.apps.pictures.logic.usecases.favourites_list import (
+    FavouritesInvalidate,
+)
 from server.apps.pictures.logic.usecases.pictures_fetch import PicturesFetch
 from server.apps.pictures.models import FavouritePicture
+from server.common.django import fragments
 from server.common.django.decorators import dispatch_decorator
-
-
-@final
-class IndexView(TemplateView):
-    """
-    View the :term:`laning`.
-
-    It is a main page open for everyone.
-    """
-
-    template_name = 'pictures/pages/index.html'
+from server.common.django.types import Settings
 
 
 @final
@@ -43,11 +36,28 @@ class DashboardView(CreateView[FavouritePicture, FavouritesForm]):
     success_url = reverse_lazy('pictures:dashboard')
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
-        """Innject extra context to template rendering."""
-        fetch_puctures = container.instantiate(PicturesFetch)
+        """
+        Innject extra context to template rendering.
 
+        Values prefetched by :func:`dashboard` come as ``extra_context``,
+        we only load the missing ones here.
+        """
         context = super().get_context_data(**kwargs)
-        context['pictures'] = fetch_puctures()  # sync http call, may hang
+        if 'pictures' not in context:
+            fetch_puctures = container.instantiate(PicturesFetch)
+            context['pictures'] = fetch_puctures()  # sync http call, may hang
+        if 'favourites_count' not in context:
+            count_favourites = container.instantiate(FavouritesCount)
+            context['favourites_count'] = count_favourites(
+                self.request.user.id,
+            )
+        # Cached pictures grid is the same for everyone, see the template:
+        settings = container.resolve(Settings)
+        context['grid'] = {
+            'version': fragments.content_version(context['pictures']),
+            'cache': settings.PICTURES_GRID_CACHE,
+            'ttl': settings.PICTURES_GRID_CACHE_TTL,
+        }
         return context
 
     def get_form_kwargs(self) -> Dict[str, Any]:
@@ -58,18 +68,9 @@ class DashboardView(CreateView[FavouritePicture, FavouritesForm]):
 
     def form_valid(self, form: FavouritesForm) -> HttpResponse:
         """Data is valid: show a message about it."""
-        messages.success(self.request, 'Добавлено')
-        return super().form_valid(form)
-
+        invalidate_favourites = container.instantiate(FavouritesInvalidate)
 
-@final
-@dispatch_decorator(login_required)
-class FavouritePicturesView(ListView[FavouritePicture]):
-    """View the :term:`favourites`."""
-
-    template_name = 'pictures/pages/favourites.html'
-
-    def get_queryset(self) -> QuerySet[FavouritePicture]:
-        """Return matching pictures."""
-        list_favourites = container.instantiate(FavouritesList)
-        return list_favourites(self.request.user.id)
+        messages.success(self.request, 'Добавлено')
+        response = super().form_valid(form)
+        invalidate_favourites(self.request.user.id)
+        return response
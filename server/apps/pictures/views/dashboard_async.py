@@ -0,0 +1,99 @@
+import asyncio
+from typing import List, Optional
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.services.placeholder import (
+    PictureResponse,
+)
+from server.apps.pictures.logic.usecases.favourites_count import (
+    FavouritesCount,
+)
+from server.apps.pictures.logic.usecases.pictures_fetch import (
+    PicturesFetchAsync,
+)
+from server.apps.pictures.views.dashboard import DashboardView
+from server.common.django import fragments
+
+_dashboard_view = DashboardView.as_view()
+
+
+async def dashboard(request: HttpRequest) -> HttpResponseBase:
+    """
+    Async entry point for the :term:`dashboard`.
+
+    Pictures are fetched from :term:`Placeholder API` concurrently
+    with database lookups, the worker is not blocked while we wait.
+    Everything except authenticated ``GET`` goes to :class:`DashboardView`.
+    Pages that browsers already have are not rendered again.
+    """
+    if request.method != 'GET':
+        return await sync_to_async(_dashboard_view)(request)
+    if not await sync_to_async(_is_authenticated)(request):
+        return await sync_to_async(_dashboard_view)(request)
+
+    fetch_pictures = container.instantiate(PicturesFetchAsync)
+    count_favourites = container.instantiate(FavouritesCount)
+    pictures, favourites_count = await asyncio.gather(
+        fetch_pictures(),
+        sync_to_async(count_favourites)(request.user.id),
+    )
+    response = await sync_to_async(_dashboard_response)(
+        request, pictures, favourites_count,
+    )
+    # Browsers must ask us each time, but they can reuse what they have:
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _dashboard_response(
+    request: HttpRequest,
+    pictures: List[PictureResponse],
+    favourites_count: int,
+) -> HttpResponseBase:
+    view = DashboardView.as_view(extra_context={
+        'pictures': pictures,
+        'favourites_count': favourites_count,
+    })
+    dashboard_etag = _dashboard_etag(request, pictures, favourites_count)
+    if dashboard_etag is None:
+        return view(request)
+
+    response: Optional[HttpResponseBase] = get_conditional_response(
+        request, etag=dashboard_etag,
+    )
+    if response is None:
+        response = view(request)
+    response['ETag'] = dashboard_etag
+    return response
+
+
+def _is_authenticated(request: HttpRequest) -> bool:
+    # Loads session and user from the database, must not run in event loop:
+    return request.user.is_authenticated
+
+
+def _dashboard_etag(
+    request: HttpRequest,
+    pictures: List[PictureResponse],
+    favourites_count: int,
+) -> Optional[str]:
+    # Anonymous users are redirected to login,
+    # flash messages are only shown once: such pages are never reused.
+    if not request.user.is_authenticated or messages.get_messages(request):
+        return None
+    return quote_etag(fragments.content_version([
+        request.user.pk,
+        request.user.updated_at,  # changes with each save
+        # Csrf tokens of the page are rotated on login,
+        # when a new session starts:
+        request.session.session_key,
+        favourites_count,
+        *pictures,
+    ]))
@@ -0,0 +1,99 @@
+from typing import Any, Dict, final
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse_lazy
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+from django.views.generic import TemplateView
+from django.views.generic.edit import FormView
+
+from server.apps.pictures.container import container
+from server.apps.pictures.intrastructure.django.forms import FavouritesBulkForm
+from server.apps.pictures.logic.usecases.favourites_list import (
+    FavouritesInvalidate,
+    FavouritesList,
+    FavouritesVersion,
+)
+from server.common.django import fragments
+from server.common.django.decorators import dispatch_decorator
+
+
+def _favourites_etag(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+    favourites_version = container.instantiate(FavouritesVersion)
+    return fragments.content_version([
+        request.user.pk,
+        favourites_version(request.user.id),
+        request.GET.get('cursor'),
+    ])
+
+
+@final
+@dispatch_decorator(login_required)
+class FavouritesBulkCreateView(FormView[FavouritesBulkForm]):
+    """
+    Add many :term:`pictures` to :term:`favourites` at once.
+
+    It is used by the "add all" button on the :term:`dashboard`.
+    """
+
+    form_class = FavouritesBulkForm
+    success_url = reverse_lazy('pictures:dashboard')
+    http_method_names = ['post']
+
+    def get_form_kwargs(self) -> Dict[str, Any]:
+        """Add current user to the context."""
+        base_kwargs = super().get_form_kwargs()
+        base_kwargs['user'] = self.request.user
+        return base_kwargs
+
+    def form_valid(self, form: FavouritesBulkForm) -> HttpResponse:
+        """Data is valid: save all pictures and show a message."""
+        invalidate_favourites = container.instantiate(FavouritesInvalidate)
+
+        form.save()
+        invalidate_favourites(self.request.user.id)
+        messages.success(self.request, 'Добавлено')
+        return super().form_valid(form)
+
+    def form_invalid(self, form: FavouritesBulkForm) -> HttpResponse:
+        """We don't have a page for this form, so we show errors as messages."""
+        for field_errors in form.errors.values():
+            messages.error(self.request, ' '.join(field_errors))
+        return redirect(self.success_url)
+
+
+@final
+@dispatch_decorator(login_required)
+@dispatch_decorator(cache_control(private=True, no_cache=True))
+@dispatch_decorator(etag(_favourites_etag))
+class FavouritePicturesView(TemplateView):
+    """
+    View the :term:`favourites`.
+
+    Pictures are shown page by page, newest first.
+    Pages are only rendered when favourites change,
+    otherwise browsers reuse what they have by ``ETag``.
+    """
+
+    template_name = 'pictures/pages/favourites.html'
+    page_size = 50
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """Inject matching pictures and a cursor for the next page."""
+        list_favourites = container.instantiate(FavouritesList)
+        try:
+            page = list_favourites(
+                self.request.user.id,
+                cursor=self.request.GET.get('cursor'),
+                page_size=self.page_size,
+            )
+        except ValueError:
+            raise Http404('Invalid cursor')
+
+        context = super().get_context_data(**kwargs)
+        context['object_list'] = page.object_list
+        context['next_cursor'] = page.next_cursor
+        return context
@@ -0,0 +1,38 @@
+from typing import Any, final
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.generic import TemplateView
+
+from server.apps.pictures.container import container
+from server.common.django.types import Settings
+
+
+@final
+class IndexView(TemplateView):
+    """
+    View the :term:`laning`.
+
+    It is a main page open for everyone.
+    """
+
+    template_name = 'pictures/pages/index.html'
+
+    def get(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponse:
+        """All anonymous visitors get the same page, so it can be cached."""
+        response = super().get(request, *args, **kwargs)
+        if request.user.is_authenticated:
+            patch_cache_control(response, private=True)
+        else:
+            settings = container.resolve(Settings)
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=settings.PUBLIC_PAGES_CACHE_MAX_AGE,
+            )
+        return response
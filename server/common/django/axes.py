@@ -0,0 +1,53 @@
+from typing import final
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from axes import middleware
+from axes.conf import settings as axes_settings
+from axes.helpers import get_lockout_response
+from django.http import HttpRequest
+
+from server.common.django.types import (
+    AnyResponse,
+    GetResponse,
+    MaybeAsyncResponse,
+)
+
+
+@final
+class AxesMiddleware(middleware.AxesMiddleware):
+    """
+    ``django-axes`` middleware, which works in async chains as well.
+
+    The original one is sync only, so under ASGI it would wrap
+    every async view into the single thread shared by sync code.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse) -> None:
+        """Django's API-compatible constructor."""
+        super().__init__(get_response)
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> MaybeAsyncResponse:
+        """Replace the response when the request was locked out."""
+        if self._is_async:
+            return self._acall(request)
+        return super().__call__(request)
+
+    async def _acall(self, request: HttpRequest) -> AnyResponse:
+        response: AnyResponse = await self.get_response(request)
+        if not axes_settings.AXES_ENABLED:
+            return response
+        if not getattr(request, 'axes_locked_out', None):
+            return response
+        return await sync_to_async(get_lockout_response)(
+            request, getattr(request, 'axes_credentials', None),
+        )
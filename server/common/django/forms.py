@@ -1,3 +1,5 @@
+from typing import Any, List
+
 from django import forms
 
 
@@ -6,3 +8,25 @@ class DateWidget(forms.DateInput):
 
     input_type = 'date'
     format = '%Y-%m-%d'  # noqa: WPS323
+
+
+class MultipleValueField(forms.Field):
+    """
+    List of values with the same name, like ``?id=1&id=2``.
+
+    Each value is validated by ``base_field``.
+    """
+
+    widget = forms.MultipleHiddenInput
+
+    def __init__(self, base_field: forms.Field, **kwargs: Any) -> None:
+        """Save the field used for each value."""
+        self._base_field = base_field
+        super().__init__(**kwargs)
+
+    def clean(self, value: Any) -> List[Any]:  # noqa: WPS110
+        """Validate all values, ``ValidationError`` is raised for bad ones."""
+        if not value:
+            # Raises for required fields, returns an empty list otherwise:
+            return super().clean([])
+        return [self._base_field.clean(each) for each in value]
@@ -0,0 +1,18 @@
+import hashlib
+from typing import Iterable
+
+
+def content_version(parts: Iterable[object]) -> str:
+    """
+    Version of a cached template fragment made from what it shows.
+
+    Pass it to ``{% cache %}``, so the fragment changes with its content
+    and never needs to be invalidated.
+    Parts must have a stable ``repr``, like ``attrs`` and ``pydantic``
+    models have.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode('utf8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
@@ -0,0 +1,71 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar, cast, final
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from server.common.django.types import Settings
+
+_ReturnType = TypeVar('_ReturnType')
+
+
+@final
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2 with the cost configured in settings, hashing in a bounded pool.
+
+    Stored hashes with other parameters still verify,
+    and django rehashes them on the next successful login,
+    see ``PASSWORD_ARGON2_*`` settings.
+
+    ``argon2`` releases the GIL while hashing,
+    so other threads of the worker keep serving requests meanwhile.
+    The pool limits how many hashes run at once in a worker process,
+    because each of them takes ``PASSWORD_ARGON2_MEMORY_COST`` of memory
+    and a whole CPU core.
+    """
+
+    @property
+    def time_cost(self) -> int:  # type: ignore[override]
+        """Number of iterations."""
+        return cast(Settings, settings).PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self) -> int:  # type: ignore[override]
+        """Memory in KiB."""
+        return cast(Settings, settings).PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self) -> int:  # type: ignore[override]
+        """Number of lanes."""
+        return cast(Settings, settings).PASSWORD_ARGON2_PARALLELISM
+
+    def encode(self, password: str, salt: str) -> str:
+        """Hash the password in the pool."""
+        return _in_pool(super().encode, password, salt)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """Check the password in the pool."""
+        return _in_pool(super().verify, password, encoded)
+
+
+@lru_cache(maxsize=None)
+def _pool() -> ThreadPoolExecutor:
+    # Created on the first use, so it is never shared by forked workers:
+    return ThreadPoolExecutor(
+        cast(Settings, settings).PASSWORD_HASHING_CONCURRENCY,
+        thread_name_prefix='password-hashing',
+    )
+
+
+# Threads do not survive a fork, children must create their own pool:
+os.register_at_fork(after_in_child=_pool.cache_clear)
+
+
+def _in_pool(
+    function: Callable[..., _ReturnType],
+    *args: str,
+) -> _ReturnType:
+    return _pool().submit(function, *args).result()
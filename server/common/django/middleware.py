@@ -0,0 +1,266 @@
+import time
+from typing import Dict, Final, Iterator, List, Union, cast, final
+
+import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, StreamingHttpResponse
+from django.template.response import SimpleTemplateResponse
+
+from server.common.django import routers
+from server.common.django.types import (
+    AnyResponse,
+    GetResponse,
+    MaybeAsyncResponse,
+    Settings,
+)
+from server.common.services import metrics, timing
+
+_SAFE_METHODS: Final = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+_REPORTED_KINDS: Final = (
+    timing.DATABASE,
+    timing.UPSTREAM,
+    timing.TEMPLATE,
+    timing.STREAM,
+)
+
+#: Logger name is configured in `server/settings/components/logging.py`
+logger = structlog.get_logger('server.requests')
+
+# Database connections are thread local, new ones are measured as well:
+connection_created.connect(
+    timing.install_execute_wrapper,
+    dispatch_uid='server.common.services.timing',
+)
+
+
+def _count_connection(
+    sender: object,
+    connection: BaseDatabaseWrapper,
+    **kwargs,
+) -> None:
+    metrics.DATABASE_CONNECTIONS.labels(connection.alias).inc()
+
+
+connection_created.connect(
+    _count_connection,
+    dispatch_uid='server.common.services.metrics',
+)
+
+
+@final
+class RequestTimingMiddleware(object):
+    """
+    Measures where the time of each request goes.
+
+    Wall time, database queries, :term:`Placeholder API` calls,
+    template rendering and response size are logged as a single line
+    and are sent back in ``Server-Timing`` header.
+    Latency is also observed by url name in our metrics.
+
+    Streamed bodies are generated after the view returns,
+    so such responses are logged when the whole body is sent,
+    and their header only has the time before streaming.
+
+    Only ``TemplateResponse`` rendering is measured,
+    direct ``render()`` calls are included in the view time.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse) -> None:
+        """Django's API-compatible constructor."""
+        self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> MaybeAsyncResponse:
+        """Measures the request and reports the results."""
+        if self._is_async:
+            return self._acall(request)
+
+        for connection in connections.all():
+            timing.install_execute_wrapper(connection)
+
+        with timing.collect() as timings:
+            response: AnyResponse = self.get_response(request)
+            return self._finish(request, response, timings)
+
+    def process_template_response(
+        self,
+        request: HttpRequest,
+        response: SimpleTemplateResponse,
+    ) -> SimpleTemplateResponse:
+        """Template responses are rendered right after this call."""
+        start = time.perf_counter()
+        response.add_post_render_callback(
+            lambda _: timing.record(
+                timing.TEMPLATE, time.perf_counter() - start,
+            ),
+        )
+        return response
+
+    async def _acall(self, request: HttpRequest) -> AnyResponse:
+        # Connections of `sync_to_async` threads get the wrapper
+        # from `connection_created` signal, timings follow the context:
+        with timing.collect() as timings:
+            response: AnyResponse = await self.get_response(request)
+            return self._finish(request, response, timings)
+
+    def _finish(
+        self,
+        request: HttpRequest,
+        response: AnyResponse,
+        timings: timing.RequestTimings,
+    ) -> AnyResponse:
+        response['Server-Timing'] = _server_timing(timings)
+        if isinstance(response, StreamingHttpResponse):
+            # Body is generated while it is sent, we report after that:
+            response.streaming_content = self._stream(
+                request, response, timings, iter(response.streaming_content),
+            )
+        else:
+            self._report(request, response, timings, len(response.content))
+        return response
+
+    def _stream(
+        self,
+        request: HttpRequest,
+        response: StreamingHttpResponse,
+        timings: timing.RequestTimings,
+        chunks: Iterator[bytes],
+    ) -> Iterator[bytes]:
+        response_size = 0
+        while True:
+            with timing.collect(timings):
+                with timing.measure(timing.STREAM):
+                    chunk = next(chunks, None)
+            if chunk is None:
+                break
+            response_size += len(chunk)
+            try:
+                yield chunk
+            except GeneratorExit:
+                # Servers close unfinished bodies, when clients go away:
+                self._report(request, response, timings, response_size)
+                raise
+        self._report(request, response, timings, response_size)
+
+    def _report(
+        self,
+        request: HttpRequest,
+        response: AnyResponse,
+        timings: timing.RequestTimings,
+        response_size: int,
+    ) -> None:
+        total = timings.elapsed()
+        metrics.REQUEST_LATENCY.labels(
+            _view_name(request), request.method,
+        ).observe(total)
+
+        request_metrics = _metrics(timings, total, response_size)
+        structlog.contextvars.bind_contextvars(**request_metrics)
+        logger.info(
+            'request_finished',
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+        )
+
+
+@final
+class ReplicaReadsMiddleware(object):
+    """
+    Reads from the replica in requests that don't write anything.
+
+    Replica lags behind the primary, so users who have just changed
+    something are pinned to the primary for ``DATABASE_REPLICA_PIN`` seconds
+    with a cookie: they must see their own changes.
+    """
+
+    cookie_name = 'primary_pin'
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse) -> None:
+        """Django's API-compatible constructor."""
+        self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> MaybeAsyncResponse:
+        """Route reads of safe requests to the replica."""
+        if self._is_async:
+            return self._acall(request)
+
+        if request.method not in _SAFE_METHODS:
+            return self._pin(self.get_response(request))
+        if self.cookie_name in request.COOKIES:
+            return self.get_response(request)
+        with routers.replica_reads():
+            return self.get_response(request)
+
+    async def _acall(self, request: HttpRequest) -> AnyResponse:
+        # Context variables are copied into `sync_to_async` threads:
+        if request.method not in _SAFE_METHODS:
+            return self._pin(await self.get_response(request))
+        if self.cookie_name in request.COOKIES:
+            return await self.get_response(request)
+        with routers.replica_reads():
+            return await self.get_response(request)
+
+    def _pin(self, response: AnyResponse) -> AnyResponse:
+        response.set_cookie(
+            self.cookie_name,
+            '1',
+            max_age=cast(Settings, settings).DATABASE_REPLICA_PIN,
+            secure=settings.SESSION_COOKIE_SECURE,
+            httponly=True,
+            samesite='Lax',
+        )
+        return response
+
+
+def _view_name(request: HttpRequest) -> str:
+    # Url names have low cardinality, unlike paths:
+    if request.resolver_match is None:
+        return '<unresolved>'
+    return request.resolver_match.view_name
+
+
+def _metrics(
+    timings: timing.RequestTimings,
+    total: float,
+    response_size: int,
+) -> Dict[str, Union[int, float]]:
+    request_metrics: Dict[str, Union[int, float]] = {
+        'duration_ms': _ms(total),
+        'response_size': response_size,
+    }
+    for kind in _REPORTED_KINDS:
+        timer = timings.timers.get(kind, timing.Timer())
+        request_metrics['{0}_count'.format(kind)] = timer.count
+        request_metrics['{0}_ms'.format(kind)] = _ms(timer.duration)
+    return request_metrics
+
+
+def _server_timing(timings: timing.RequestTimings) -> str:
+    # See: https://www.w3.org/TR/server-timing/
+    entries: List[str] = []
+    for kind, timer in sorted(timings.timers.items()):
+        entries.append('{0};dur={1};desc="{2}"'.format(
+            kind, _ms(timer.duration), timer.count,
+        ))
+    entries.append('total;dur={0}'.format(_ms(timings.elapsed())))
+    return ', '.join(entries)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
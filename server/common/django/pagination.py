@@ -0,0 +1,65 @@
+import base64
+import datetime as dt
+from typing import Generic, List, Optional, Tuple, TypeVar, final
+
+from attr import dataclass
+from django.db import models
+
+from server.common.django.models import TimedMixin
+
+_ModelT = TypeVar('_ModelT', bound=TimedMixin)
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class KeysetPage(Generic[_ModelT]):
+    """Single page of results and an opaque cursor for the next one."""
+
+    object_list: List[_ModelT]
+    next_cursor: Optional[str]
+
+
+def paginate(
+    queryset: models.QuerySet[_ModelT],
+    *,
+    cursor: Optional[str],
+    page_size: int,
+) -> KeysetPage[_ModelT]:
+    """
+    Newest first keyset pagination on ``(created_at, id)``.
+
+    Unlike ``OFFSET``, the cost of each page does not depend on its number,
+    when there's a matching index.
+    Raises ``ValueError`` for invalid cursors.
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    if cursor:
+        created_at, pk = _decode(cursor)
+        # The last condition is redundant, but it is a range condition
+        # on the leading column, so the index is scanned from the cursor:
+        queryset = queryset.filter(
+            models.Q(created_at__lt=created_at) |
+            models.Q(created_at=created_at, id__lt=pk),
+            created_at__lte=created_at,
+        )
+
+    # We fetch one extra item to know whether there's a next page:
+    object_list = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(object_list) > page_size:
+        next_cursor = _encode(object_list[page_size - 1])
+    return KeysetPage(
+        object_list=object_list[:page_size],
+        next_cursor=next_cursor,
+    )
+
+
+def _encode(instance: TimedMixin) -> str:
+    position = '{0}|{1}'.format(instance.created_at.isoformat(), instance.pk)
+    return base64.urlsafe_b64encode(position.encode('utf8')).decode('ascii')
+
+
+def _decode(cursor: str) -> Tuple[dt.datetime, int]:
+    position = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf8')
+    created_at, pk = position.split('|')
+    return dt.datetime.fromisoformat(created_at), int(pk)
@@ -0,0 +1,40 @@
+from typing import Any
+
+from django.db.backends.postgresql import base
+
+from server.common.services import metrics
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend that checks persistent connections before reuse.
+
+    Persistent connections can be closed by the server or by ``pgbouncer``
+    while a worker is idle. When ``CONN_HEALTH_CHECKS`` is set,
+    reused connections are checked before their first query in a request,
+    broken ones are replaced instead of failing the request.
+
+    This is a backport of the same Django 4.1 setting,
+    remove this backend after upgrading.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Nothing to check until the first request starts."""
+        super().__init__(*args, **kwargs)
+        self.health_check_pending = False
+
+    def close_if_unusable_or_obsolete(self) -> None:
+        """Called when requests start and finish."""
+        super().close_if_unusable_or_obsolete()
+        self.health_check_pending = bool(
+            self.settings_dict.get('CONN_HEALTH_CHECKS'),
+        )
+
+    def ensure_connection(self) -> None:
+        """Replace broken connection, if this is the first query."""
+        if self.health_check_pending and not self.in_atomic_block:
+            self.health_check_pending = False
+            if self.connection is not None and not self.is_usable():
+                metrics.DATABASE_BROKEN_CONNECTIONS.labels(self.alias).inc()
+                self.close()
+        super().ensure_connection()
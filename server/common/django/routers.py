@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Type, final
+
+from django.conf import settings
+from django.db.models import Model
+
+#: Database alias of the read replica, it is optional.
+REPLICA = 'replica'
+
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Send all reads made inside this block to the read replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@final
+class ReplicaRouter(object):
+    """
+    Sends reads to the read replica, but only inside :func:`replica_reads`.
+
+    Reads are not routed by default: the replica lags behind,
+    so it is only used for requests that don't write anything,
+    see :class:`server.common.django.middleware.ReplicaReadsMiddleware`.
+    Writes and migrations always go to the primary.
+    """
+
+    def db_for_read(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        """Replica, when it is configured and allowed."""
+        if _replica_reads.get() and REPLICA in settings.DATABASES:
+            return REPLICA
+        return None
+
+    def db_for_write(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        """Always the primary."""
+        return 'default'
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        """Both databases have the same data."""
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        """Replica is migrated by the replication itself."""
+        return db != REPLICA
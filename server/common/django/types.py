@@ -7,12 +7,55 @@ near each type, so we can easily track them and refactor
 our code when new versions are released.
 """
 
-from typing import Protocol
+from typing import Any, Awaitable, Callable, Protocol, Tuple, Union
+
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+
+#: Middlewares deal with both kinds of responses:
+AnyResponse = Union[HttpResponse, StreamingHttpResponse]
+
+# TODO: `django-stubs` only has sync middlewares,
+# `get_response` returns an awaitable in async chains:
+GetResponse = Callable[[HttpRequest], Any]
+MaybeAsyncResponse = Union[AnyResponse, Awaitable[AnyResponse]]
 
 
 # TODO: bug in django-stubs with settings
 class Settings(Protocol):
     """Our plugin cannot resolve some settings during type checking."""
 
+    DATABASE_REPLICA_PIN: int
     PLACEHOLDER_API_URL: str
-    PLACEHOLDER_API_TIMEOUT: int
+    PLACEHOLDER_API_TIMEOUT: Tuple[float, float]
+    PLACEHOLDER_API_POOL_SIZE: int
+    PLACEHOLDER_API_KEEP_ALIVE: bool
+    PLACEHOLDER_API_MAX_RETRIES: int
+    PLACEHOLDER_API_RETRY_BACKOFF: float
+    PLACEHOLDER_API_CIRCUIT_FAILURE_RATE: float
+    PLACEHOLDER_API_CIRCUIT_MIN_CALLS: int
+    PLACEHOLDER_API_CIRCUIT_WINDOW: int
+    PLACEHOLDER_API_CIRCUIT_OPEN_TIMEOUT: int
+    PLACEHOLDER_API_MAX_CONCURRENCY: int
+    PLACEHOLDER_API_CACHE: str
+    PLACEHOLDER_API_CACHE_TTL: int
+    PLACEHOLDER_API_CACHE_STALE_TTL: int
+    PLACEHOLDER_API_CACHE_LOCK_TIMEOUT: int
+    PLACEHOLDER_API_CACHE_MAX_WAIT: float
+    PLACEHOLDER_CATALOG_PAGE_SIZE: int
+    PLACEHOLDER_CATALOG_SYNC_INTERVAL: int
+    PLACEHOLDER_OUTBOX_BATCH_SIZE: int
+    PLACEHOLDER_OUTBOX_LEASE: int
+    PLACEHOLDER_OUTBOX_DEBOUNCE: int
+    PLACEHOLDER_OUTBOX_MAX_DELAY: int
+    PLACEHOLDER_OUTBOX_MAX_BACKOFF: int
+    PICTURES_FAVOURITES_CACHE: str
+    PICTURES_FAVOURITES_CACHE_TTL: int
+    PICTURES_GRID_CACHE: str
+    PICTURES_GRID_CACHE_TTL: int
+    IDENTITY_USER_CACHE: str
+    IDENTITY_USER_CACHE_TTL: int
+    PUBLIC_PAGES_CACHE_MAX_AGE: int
+    PASSWORD_ARGON2_TIME_COST: int
+    PASSWORD_ARGON2_MEMORY_COST: int
+    PASSWORD_ARGON2_PARALLELISM: int
+    PASSWORD_HASHING_CONCURRENCY: int
@@ -0,0 +1,14 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from server.common.services import metrics as app_metrics
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Exposes metrics of all workers for Prometheus to scrape."""
+    return HttpResponse(
+        app_metrics.export(),
+        content_type=CONTENT_TYPE_LATEST,
+    )
@@ -0,0 +1,136 @@
+import time
+from typing import Callable, Optional, Tuple, TypeVar, final
+
+from attr import dataclass
+from django.core.cache import BaseCache
+
+from server.common.services import metrics
+
+_ValueT = TypeVar('_ValueT')
+
+#: What we store in the cache: "fresh until" timestamp and the value itself.
+_Entry = Tuple[float, _ValueT]
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class StaleWhileRevalidate(object):
+    """
+    Cache-aside helper for slow upstream calls.
+
+    Fresh values are returned as is.
+    Stale values are returned to everyone except a single caller,
+    who refreshes them, and to this caller too when refreshing fails.
+    Missing values are also fetched by a single caller,
+    others wait for the result to appear in the cache for up to
+    ``max_wait`` seconds, then fetch it themselves.
+
+    Any django cache backend can be used: ``locmem`` is fine for tests,
+    but it must be a shared one in production, otherwise single-flight
+    only works per process.
+    """
+
+    #: Dependencies:
+    _cache: BaseCache
+
+    #: Configuration, all values are in seconds:
+    _ttl: int
+    _stale_ttl: int
+    _lock_timeout: int
+    _max_wait: float
+    _poll_interval: float = 0.05
+
+    #: Used to tell cached data apart in metrics:
+    _name: str = 'default'
+
+    def __call__(self, key: str, fetch: Callable[[], _ValueT]) -> _ValueT:
+        """Return cached value for the key, calls ``fetch`` when needed."""
+        entry: Optional[_Entry[_ValueT]] = self._cache.get(key)
+        if entry is not None:
+            fresh_until, cached_value = entry
+            if fresh_until > time.time():
+                self._count('hit')
+                return cached_value
+            self._count('stale')
+            return self._revalidate(key, cached_value, fetch)
+
+        self._count('miss')
+        if self._acquire(key):
+            return self._refresh(key, fetch)
+        return self._wait_for(key, fetch)
+
+    def peek(self, key: str) -> Optional[_ValueT]:
+        """Return cached value for the key, even a stale one, never fetch."""
+        entry: Optional[_Entry[_ValueT]] = self._cache.get(key)
+        return None if entry is None else entry[1]
+
+    def _count(self, lookup_result: str) -> None:
+        metrics.CACHE_LOOKUPS.labels(self._name, lookup_result).inc()
+
+    def _acquire(self, key: str) -> bool:
+        # `add` is atomic in all django cache backends we care about:
+        return self._cache.add(_lock_key(key), 1, timeout=self._lock_timeout)
+
+    def _revalidate(
+        self,
+        key: str,
+        stale_value: _ValueT,
+        fetch: Callable[[], _ValueT],
+    ) -> _ValueT:
+        if not self._acquire(key):
+            return stale_value
+        try:
+            return self._refresh(key, fetch)
+        except Exception:
+            # Stale value is better than an error, "stale-if-error":
+            return stale_value
+
+    def _refresh(self, key: str, fetch: Callable[[], _ValueT]) -> _ValueT:
+        try:
+            fetched = fetch()
+        except Exception:
+            self._cache.delete(_lock_key(key))  # others can try again
+            raise
+        entry: _Entry[_ValueT] = (time.time() + self._ttl, fetched)
+        self._cache.set(key, entry, timeout=self._ttl + self._stale_ttl)
+        self._cache.delete(_lock_key(key))
+        return fetched
+
+    def _wait_for(self, key: str, fetch: Callable[[], _ValueT]) -> _ValueT:
+        # Callers are waiting for a response, so we don't wait for the whole
+        # lock timeout: the lock owner can be dead or stuck.
+        deadline = time.monotonic() + min(self._max_wait, self._lock_timeout)
+        while time.monotonic() < deadline:
+            time.sleep(self._poll_interval)
+            entry: Optional[_Entry[_ValueT]] = self._cache.get(key)
+            if entry is not None:
+                return entry[1]
+            if self._cache.get(_lock_key(key)) is None:
+                break  # lock owner has failed, no need to wait any longer
+        # Lock owner is too slow or dead, we have to do the work ourselves:
+        return self._refresh(key, fetch)
+
+
+def _lock_key(key: str) -> str:
+    return '{0}:lock'.format(key)
+
+
+def get_version(cache: BaseCache, key: str) -> int:
+    """
+    Current version of a group of cached values.
+
+    Pass it as ``version`` to cache calls,
+    then :func:`bump_version` invalidates the whole group at once.
+    """
+    # Time based initial value, so evicted versions are never reused:
+    initial = time.time_ns()
+    return int(cache.get_or_set(key, initial, timeout=None) or initial)
+
+
+def bump_version(cache: BaseCache, key: str) -> None:
+    """Invalidate all values cached with the current version."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Version is missing or evicted, any new value is fine:
+        cache.set(key, time.time_ns(), timeout=None)
@@ -0,0 +1,172 @@
+import threading
+import time
+from typing import Callable, Dict, Final, Optional, Tuple, final
+
+import attr
+import requests
+from django.core.cache import BaseCache, caches
+
+from server.common.django.types import Settings
+
+#: Responses with this status or higher count as failed calls:
+_SERVER_ERROR: Final = 500
+
+
+@final
+class CallRejectedError(requests.ConnectionError):
+    """Endpoint was not called: its circuit is open or its bulkhead is full."""
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class CircuitBreaker(object):
+    """
+    Stops calling endpoints that keep failing.
+
+    Circuit of an endpoint opens when the share of failed calls
+    in the current time window reaches ``failure_rate``.
+    After ``open_timeout`` seconds a single probe call is allowed
+    (half-open state): its success closes the circuit,
+    its failure opens it again. Circuit state is kept in a shared cache,
+    so all workers see it: use the shared one in production.
+
+    Each endpoint also has its own per-process bulkhead:
+    no more than ``max_concurrency`` calls at the same time,
+    so a slow endpoint can't take all the threads.
+    """
+
+    #: Configuration, time values are in seconds:
+    _cache_alias: str
+    _failure_rate: float
+    _min_calls: int
+    _window: int
+    _open_timeout: int
+    _max_concurrency: int
+
+    #: Per-process state:
+    _bulkheads: Dict[str, threading.BoundedSemaphore] = attr.ib(
+        factory=dict, init=False,
+    )
+    _bulkheads_lock: threading.Lock = attr.ib(
+        factory=threading.Lock, init=False,
+    )
+
+    def __call__(
+        self,
+        endpoint: str,
+        send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        """Call ``send`` if the endpoint is healthy, record the outcome."""
+        is_probe = self._check(endpoint)
+        bulkhead = self._bulkhead(endpoint)
+        if not bulkhead.acquire(blocking=False):
+            if is_probe:
+                self._cache().delete(_probe_key(endpoint))  # others can probe
+            raise CallRejectedError('Too many concurrent calls to {0}'.format(
+                endpoint,
+            ))
+
+        try:
+            response = send()
+        except requests.RequestException:
+            self._record(endpoint, failed=True, is_probe=is_probe)
+            raise
+        finally:
+            bulkhead.release()
+        self._record(
+            endpoint,
+            failed=response.status_code >= _SERVER_ERROR,
+            is_probe=is_probe,
+        )
+        return response
+
+    def _check(self, endpoint: str) -> bool:
+        """Returns whether this call is the probe of a half-open circuit."""
+        open_until: Optional[float] = self._cache().get(_open_key(endpoint))
+        if open_until is None:
+            return False
+        if open_until > time.time():
+            raise CallRejectedError('Circuit is open for {0}'.format(endpoint))
+        # Half-open: only one probe at a time, the rest fail fast:
+        is_probe = self._cache().add(
+            _probe_key(endpoint), 1, timeout=self._open_timeout,
+        )
+        if not is_probe:
+            raise CallRejectedError('Circuit is half-open for {0}'.format(
+                endpoint,
+            ))
+        return True
+
+    def _record(self, endpoint: str, *, failed: bool, is_probe: bool) -> None:
+        # Calls started before the circuit has opened are not probes,
+        # only the call that owns the probe key can close it:
+        if is_probe and not failed:
+            self._cache().delete_many([
+                _open_key(endpoint),
+                _probe_key(endpoint),
+                *_window_keys(endpoint, self._window),
+            ])
+        elif is_probe or self._is_failing(endpoint, failed=failed):
+            self._cache().set(
+                _open_key(endpoint),
+                time.time() + self._open_timeout,
+                timeout=None,  # it is removed by a successful probe
+            )
+            self._cache().delete(_probe_key(endpoint))
+
+    def _is_failing(self, endpoint: str, *, failed: bool) -> bool:
+        calls_key, failures_key = _window_keys(endpoint, self._window)
+        calls = self._incr(calls_key)
+        if not failed:
+            return False
+        failures = self._incr(failures_key)
+        enough_calls = calls >= self._min_calls
+        return enough_calls and failures / calls >= self._failure_rate
+
+    def _incr(self, key: str) -> int:
+        self._cache().add(key, 0, timeout=self._window * 2)
+        try:
+            return self._cache().incr(key)
+        except ValueError:
+            # Expired right after `add`, this is the first call of the window:
+            self._cache().set(key, 1, timeout=self._window * 2)
+            return 1
+
+    def _cache(self) -> BaseCache:
+        # Cache connections are thread local, we can't keep a single one:
+        return caches[self._cache_alias]
+
+    def _bulkhead(self, endpoint: str) -> threading.BoundedSemaphore:
+        with self._bulkheads_lock:
+            return self._bulkheads.setdefault(
+                endpoint,
+                threading.BoundedSemaphore(self._max_concurrency),
+            )
+
+
+def create_circuit_breaker(settings: Settings) -> CircuitBreaker:
+    """Create circuit breaker for :class:`BaseFetcher` subclasses."""
+    return CircuitBreaker(
+        cache_alias=settings.PLACEHOLDER_API_CACHE,
+        failure_rate=settings.PLACEHOLDER_API_CIRCUIT_FAILURE_RATE,
+        min_calls=settings.PLACEHOLDER_API_CIRCUIT_MIN_CALLS,
+        window=settings.PLACEHOLDER_API_CIRCUIT_WINDOW,
+        open_timeout=settings.PLACEHOLDER_API_CIRCUIT_OPEN_TIMEOUT,
+        max_concurrency=settings.PLACEHOLDER_API_MAX_CONCURRENCY,
+    )
+
+
+def _open_key(endpoint: str) -> str:
+    return 'circuit:{0}:open'.format(endpoint)
+
+
+def _probe_key(endpoint: str) -> str:
+    return 'circuit:{0}:probe'.format(endpoint)
+
+
+def _window_keys(endpoint: str, window: int) -> Tuple[str, str]:
+    current = int(time.time() // window)
+    return (
+        'circuit:{0}:{1}:calls'.format(endpoint, current),
+        'circuit:{0}:{1}:failures'.format(endpoint, current),
+    )
@@ -1,16 +1,34 @@
-from typing import ClassVar
+from typing import Any, ClassVar, Final, Tuple
 from urllib.parse import urljoin
 
-from attr import dataclass
+import attr
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from server.common.django.types import Settings
+from server.common.services import metrics, timing
+from server.common.services.circuit_breaker import (
+    CallRejectedError,
+    CircuitBreaker,
+)
 
-@dataclass(frozen=True, slots=True)
+#: `(connect, read)` timeouts in seconds, the way `requests` expects them.
+Timeout = Tuple[float, float]
+
+#: We only retry responses that are likely to be temporary:
+_RETRY_STATUSES: Final = frozenset((502, 503, 504))
+
+
+@attr.dataclass(frozen=True, slots=True)
 class BaseFetcher(object):
     """Base class for our HTTP actions."""
 
     #: Dependencies:
     _api_url: str
-    _api_timeout: int
+    _api_timeout: Timeout
+    _session: requests.Session
+    _circuit_breaker: CircuitBreaker
 
     #: This must be defined in all subclasses:
     _url_path: ClassVar[str]
@@ -18,3 +36,63 @@ class BaseFetcher(object):
     def url_path(self) -> str:
         """Full URL for the request."""
         return urljoin(self._api_url, self._url_path)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Make a measured request with our session and timeout."""
+        fetcher = type(self).__name__
+        with timing.measure(timing.UPSTREAM):
+            with metrics.UPSTREAM_LATENCY.labels(fetcher).time():
+                try:
+                    response = self._circuit_breaker(
+                        fetcher,
+                        lambda: self._session.request(
+                            method,
+                            url,
+                            timeout=self._api_timeout,
+                            **kwargs,
+                        ),
+                    )
+                except CallRejectedError:
+                    metrics.UPSTREAM_RESPONSES.labels(
+                        fetcher, 'rejected',
+                    ).inc()
+                    raise
+                except requests.RequestException:
+                    metrics.UPSTREAM_RESPONSES.labels(fetcher, 'error').inc()
+                    raise
+        metrics.UPSTREAM_RESPONSES.labels(fetcher, response.status_code).inc()
+        return response
+
+
+def create_session(settings: Settings) -> requests.Session:
+    """
+    Create pooled keep-alive session for :class:`BaseFetcher` subclasses.
+
+    Only idempotent methods are retried, ``POST`` and ``PATCH`` are not.
+    Sessions must not be shared between processes,
+    so this must be called after the fork.
+    """
+    retries = Retry(
+        total=settings.PLACEHOLDER_API_MAX_RETRIES,
+        backoff_factor=settings.PLACEHOLDER_API_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,  # `raise_for_status()` is called by fetchers
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.PLACEHOLDER_API_POOL_SIZE,
+        pool_maxsize=settings.PLACEHOLDER_API_POOL_SIZE,
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not settings.PLACEHOLDER_API_KEEP_ALIVE:
+        session.headers['Connection'] = 'close'
+    return session
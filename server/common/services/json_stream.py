@@ -0,0 +1,130 @@
+import json
+import re
+from types import MappingProxyType
+from typing import Any, Final, Iterator, List, final
+
+import requests
+
+#: How much of a streamed response body we read at once, 64 KiB:
+_CHUNK_SIZE: Final = 65536
+
+_NOT_WHITESPACE: Final = re.compile(r'[^ \t\n\r]')
+
+#: Parser states, named after what is expected next:
+_OPENING: Final = 'opening'
+_FIRST_ELEMENT: Final = 'first element'
+_ELEMENT: Final = 'element'
+_SEPARATOR: Final = 'separator'
+_END: Final = 'end'
+
+#: Punctuation allowed in a state and the state it leads to:
+_TRANSITIONS: Final = MappingProxyType({
+    (_OPENING, '['): _FIRST_ELEMENT,
+    (_FIRST_ELEMENT, ']'): _END,
+    (_SEPARATOR, ','): _ELEMENT,
+    (_SEPARATOR, ']'): _END,
+})
+
+_EXPECTS_ELEMENT: Final = frozenset((_FIRST_ELEMENT, _ELEMENT))
+
+#: Marks elements that need more data, ``None`` is a valid element:
+_INCOMPLETE: Final = object()
+
+
+def iter_json_array(response: requests.Response) -> Iterator[Any]:
+    """
+    Parse JSON array from a streamed response element by element.
+
+    Only the current element and the unparsed chunks are kept in memory,
+    use it with ``stream=True`` requests for large responses.
+    Raises ``ValueError`` for invalid JSON arrays,
+    including trailing commas and anything but whitespace after the array.
+    """
+    # JSON is always `utf-8`, `requests` would not decode it otherwise:
+    response.encoding = response.encoding or 'utf-8'
+    parser = _ArrayParser()
+    for chunk in response.iter_content(_CHUNK_SIZE, decode_unicode=True):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+@final
+class _ArrayParser(object):
+    """
+    Incremental parser of a single JSON array.
+
+    Elements split between chunks are only decoded again
+    when the new chunks at least double the unparsed data,
+    so large elements take linear time instead of quadratic.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._state = _OPENING
+        self._buffer = ''
+        self._position = 0
+        self._chunks: List[str] = []
+        self._chunks_size = 0
+        self._wanted_size = 0
+
+    def feed(self, chunk: str) -> Iterator[Any]:
+        """Yields elements that are complete with the new chunk."""
+        self._chunks.append(chunk)
+        self._chunks_size += len(chunk)
+        if self._chunks_size >= self._wanted_size:
+            yield from self._parse(is_last=False)
+
+    def close(self) -> Iterator[Any]:
+        """Yields the remaining elements, when the whole body is read."""
+        yield from self._parse(is_last=True)
+        if self._state != _END:
+            raise ValueError('JSON array is not complete')
+
+    def _parse(self, *, is_last: bool) -> Iterator[Any]:
+        unparsed = self._buffer[self._position:]
+        self._buffer = unparsed + ''.join(self._chunks)
+        self._position = 0
+        self._chunks.clear()
+        self._chunks_size = 0
+        while self._skip_whitespace():
+            if self._punctuation():
+                continue
+            element = self._decode_element(is_last=is_last)
+            if element is _INCOMPLETE:
+                # Wait for as much new data as we already have:
+                self._wanted_size = len(self._buffer) - self._position
+                return
+            yield element
+        self._wanted_size = 0
+
+    def _skip_whitespace(self) -> bool:
+        match = _NOT_WHITESPACE.search(self._buffer, self._position)
+        self._position = match.start() if match else len(self._buffer)
+        return match is not None
+
+    def _punctuation(self) -> bool:
+        char = self._buffer[self._position]
+        next_state = _TRANSITIONS.get((self._state, char))
+        if next_state is not None:
+            self._state = next_state
+            self._position += 1
+            return True
+        if self._state not in _EXPECTS_ELEMENT:
+            raise ValueError('Invalid JSON array at {0!r}'.format(char))
+        return False
+
+    def _decode_element(self, *, is_last: bool) -> Any:
+        try:
+            element, element_end = self._decoder.raw_decode(
+                self._buffer,
+                self._position,
+            )
+        except json.JSONDecodeError as exc:
+            if is_last:
+                raise ValueError('Invalid JSON array element') from exc
+            return _INCOMPLETE
+        if element_end == len(self._buffer) and not is_last:
+            return _INCOMPLETE  # numbers can be split between chunks
+        self._state = _SEPARATOR
+        self._position = element_end
+        return element
@@ -0,0 +1,67 @@
+"""
+Prometheus metrics of the application.
+
+Each gunicorn worker writes its values into files
+inside ``PROMETHEUS_MULTIPROC_DIR``, see ``docker/django/gunicorn_config.py``.
+Without this variable values are only kept in memory of a single process.
+"""
+
+import os
+from typing import Final
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.registry import REGISTRY
+
+REQUEST_LATENCY: Final = Histogram(
+    'django_request_duration_seconds',
+    'Request latency by url name.',
+    ['view', 'method'],
+)
+
+DATABASE_CONNECTIONS: Final = Counter(
+    'django_db_connections_created',
+    'New database connections, compare with requests to see reuse.',
+    ['alias'],
+)
+
+DATABASE_BROKEN_CONNECTIONS: Final = Counter(
+    'django_db_broken_connections',
+    'Persistent database connections replaced after a failed health check.',
+    ['alias'],
+)
+
+UPSTREAM_LATENCY: Final = Histogram(
+    'placeholder_api_duration_seconds',
+    'Placeholder API call latency by fetcher.',
+    ['fetcher'],
+)
+
+UPSTREAM_RESPONSES: Final = Counter(
+    'placeholder_api_responses',
+    'Placeholder API calls by fetcher and status code.',
+    ['fetcher', 'status'],
+)
+
+CACHE_LOOKUPS: Final = Counter(
+    'cache_lookups',
+    'Cache lookups by cached data and result: hit, stale or miss.',
+    ['name', 'result'],
+)
+
+
+def export() -> bytes:
+    """Metrics of all processes in the text exposition format."""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(  # type: ignore[no-untyped-call]
+        registry,
+    )
+    return generate_latest(registry)
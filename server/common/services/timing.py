@@ -0,0 +1,121 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, final
+
+import attr
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+#: Kinds of work that we measure inside a single request:
+DATABASE = 'db'
+UPSTREAM = 'upstream'
+TEMPLATE = 'template'
+STREAM = 'stream'
+
+
+@final
+@attr.dataclass(slots=True)
+class Timer(object):
+    """How many times some kind of work was done and how long it took."""
+
+    count: int = 0
+    duration: float = 0  # seconds
+
+
+@final
+@attr.dataclass(slots=True)
+class RequestTimings(object):
+    """
+    Timings collected while a single request is handled.
+
+    It is shared with threads that work on the same request,
+    like ``sync_to_async`` calls, so updates are guarded by a lock.
+    """
+
+    timers: Dict[str, Timer] = attr.ib(factory=dict)
+    started_at: float = attr.ib(factory=time.perf_counter)
+    _lock: threading.Lock = attr.ib(factory=threading.Lock)
+
+    def elapsed(self) -> float:
+        """Seconds since the request has started."""
+        return time.perf_counter() - self.started_at
+
+    def record(self, kind: str, duration: float) -> None:
+        """Adds one more measurement of this kind."""
+        with self._lock:
+            timer = self.timers.setdefault(kind, Timer())
+            timer.count += 1
+            timer.duration += duration
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar(
+    'request_timings', default=None,
+)
+
+
+@contextmanager
+def collect(
+    timings: Optional[RequestTimings] = None,
+) -> Iterator[RequestTimings]:
+    """
+    Collects all measurements made inside this block.
+
+    Pass timings of a request to continue collecting them,
+    for example, while its streamed body is generated.
+    """
+    if timings is None:
+        timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def measure(kind: str) -> Iterator[None]:
+    """Measures the block, when there's an active :func:`collect` call."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(kind, time.perf_counter() - start)
+
+
+def record(kind: str, duration: float) -> None:
+    """Records already measured duration, when something is collecting."""
+    timings = _current.get()
+    if timings is not None:
+        timings.record(kind, duration)
+
+
+def execute_wrapper(
+    execute: Callable[..., Any],
+    sql: str,
+    sql_params: Any,
+    many: bool,
+    context: Dict[str, Any],
+) -> Any:
+    """Database execute wrapper, which measures all queries."""
+    with measure(DATABASE):
+        return execute(sql, sql_params, many, context)
+
+
+def install_execute_wrapper(
+    connection: BaseDatabaseWrapper,
+    **kwargs: Any,
+) -> None:
+    """
+    Installs :func:`execute_wrapper` into the database connection.
+
+    Connections are thread local, so this is also used
+    as ``connection_created`` signal receiver.
+    """
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
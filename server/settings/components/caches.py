@@ -1,15 +1,54 @@
 # Caching
 # https://docs.djangoproject.com/en/3.2/topics/cache/
 
+# Local memory cache is only fine for a single process,
+# production uses shared `redis` cache, see `environments/production.py`
 CACHES = {
     'default': {
-        # TODO: use some other cache in production,
-        # like https://github.com/jazzband/django-redis
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     },
+    # Used by `{% cache %}` by default. Fragments that are the same
+    # for everyone are cached by each process, without network calls:
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'template_fragments',
+    },
 }
 
 
+# User's favourite pictures are cached until they change,
+# this timeout is only a safety net, in seconds:
+PICTURES_FAVOURITES_CACHE = 'default'
+PICTURES_FAVOURITES_CACHE_TTL = 60 * 60
+
+# Dashboard pictures grid is the same for all users, so it is shared
+# by all workers. New pictures get a new key, in seconds:
+PICTURES_GRID_CACHE = 'default'
+PICTURES_GRID_CACHE_TTL = 5 * 60
+
+# Users of authenticated requests are cached until they are saved again,
+# this timeout is only a safety net, in seconds:
+IDENTITY_USER_CACHE = 'default'
+IDENTITY_USER_CACHE_TTL = 60 * 60
+
+
+# HTTP caching
+# https://docs.djangoproject.com/en/3.2/topics/conditional-view-processing/
+
+# Public pages are the same for all anonymous visitors,
+# so browsers and proxies can keep them for this long, in seconds:
+PUBLIC_PAGES_CACHE_MAX_AGE = 60 * 60
+
+
+# Sessions
+# https://docs.djangoproject.com/en/3.2/topics/http/sessions/#using-cached-sessions
+
+# Sessions are read from the cache and written through to the database,
+# so they survive cache restarts:
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'default'
+
+
 # django-axes
 # https://django-axes.readthedocs.io/en/latest/4_configuration.html#configuring-caches
 
@@ -8,7 +8,7 @@ For the full list of settings and their config, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 from django.utils.translation import gettext_lazy as _
 
@@ -52,6 +52,10 @@ INSTALLED_APPS: Tuple[str, ...] = (
 MIDDLEWARE: Tuple[str, ...] = (
     # Logging:
     'server.settings.components.logging.LoggingContextVarsMiddleware',
+    'server.common.django.middleware.RequestTimingMiddleware',
+
+    # Database:
+    'server.common.django.middleware.ReplicaReadsMiddleware',
 
     # Content Security Policy:
     'csp.middleware.CSPMiddleware',
@@ -69,36 +73,69 @@ MIDDLEWARE: Tuple[str, ...] = (
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 
     # Axes:
-    'axes.middleware.AxesMiddleware',
-
-    # Django HTTP Referrer Policy:
-    'django_http_referrer_policy.middleware.ReferrerPolicyMiddleware',
+    'server.common.django.axes.AxesMiddleware',
 )
 
 ROOT_URLCONF = 'server.urls'
 
 WSGI_APPLICATION = 'server.wsgi.application'
 
+# `axes` only looks for its own middleware by path,
+# our async-capable subclass of it is used instead:
+SILENCED_SYSTEM_CHECKS = ['axes.W002']
+
+ASGI_APPLICATION = 'server.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
+# Set to `True` when the database is behind `pgbouncer`
+# in transaction pooling mode: it does not support server side cursors
+# and connection options, so `statement_timeout` is set with `ALTER ROLE`.
+# See `docs/pages/template/production.rst`
+_PGBOUNCER = config('DJANGO_DATABASE_PGBOUNCER', cast=bool, default=False)
+
+_DATABASE_OPTIONS: Dict[str, Union[int, str]] = {'connect_timeout': 10}
+if not _PGBOUNCER:
+    _DATABASE_OPTIONS['options'] = '-c statement_timeout=15000ms'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        # Our backend adds `CONN_HEALTH_CHECKS` support:
+        'ENGINE': 'server.common.django.postgresql',
         'NAME': config('POSTGRES_DB'),
         'USER': config('POSTGRES_USER'),
         'PASSWORD': config('POSTGRES_PASSWORD'),
         'HOST': config('DJANGO_DATABASE_HOST'),
         'PORT': config('DJANGO_DATABASE_PORT', cast=int),
         'CONN_MAX_AGE': config('CONN_MAX_AGE', cast=int, default=60),
-        'OPTIONS': {
-            'connect_timeout': 10,
-            'options': '-c statement_timeout=15000ms',
-        },
+        'CONN_HEALTH_CHECKS': config(
+            'DJANGO_DATABASE_HEALTH_CHECKS', cast=bool, default=True,
+        ),
+        'DISABLE_SERVER_SIDE_CURSORS': _PGBOUNCER,
+        'OPTIONS': _DATABASE_OPTIONS,
     },
 }
 
+# Optional read replica, it is used for reads of requests without writes,
+# see `server/common/django/routers.py`:
+_REPLICA_HOST = config('DJANGO_DATABASE_REPLICA_HOST', default='')
+if _REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': _REPLICA_HOST,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['server.common.django.routers.ReplicaRouter']
+
+# Users read from the primary for this many seconds after each write,
+# so they see their own changes. It must be more than replication lag:
+DATABASE_REPLICA_PIN = config(
+    'DJANGO_DATABASE_REPLICA_PIN', cast=int, default=5,
+)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.2/topics/i18n/
@@ -129,7 +166,7 @@ STATIC_URL = 'static/'
 # Templates
 # https://docs.djangoproject.com/en/3.2/ref/templates/api
 
-TEMPLATES = [{
+TEMPLATES: List[Dict[str, Any]] = [{
     'APP_DIRS': True,
     'BACKEND': 'django.template.backends.django.DjangoTemplates',
     'DIRS': [
@@ -169,9 +206,9 @@ SECURE_BROWSER_XSS_FILTER = True
 
 X_FRAME_OPTIONS = 'DENY'
 
-# https://github.com/DmytroLitvinov/django-http-referrer-policy
+# It is set by `SecurityMiddleware`, which also works with ASGI:
 # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Referrer-Policy
-REFERRER_POLICY = 'same-origin'
+SECURE_REFERRER_POLICY = 'same-origin'
 
 # https://github.com/adamchainz/django-permissions-policy#setting
 PERMISSIONS_POLICY: Dict[str, Union[str, List[str]]] = {}  # noqa: WPS234
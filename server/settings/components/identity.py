@@ -1,5 +1,7 @@
 from django.urls import reverse_lazy
 
+from server.settings.components import config
+
 # Django authentication system
 # https://docs.djangoproject.com/en/3.2/topics/auth/
 
@@ -7,16 +9,35 @@ AUTH_USER_MODEL = 'identity.User'
 
 AUTHENTICATION_BACKENDS = (
     'axes.backends.AxesBackend',
-    'django.contrib.auth.backends.ModelBackend',
+    # `ModelBackend` that loads users of each request from the cache:
+    'server.apps.identity.intrastructure.django.backends.CachedModelBackend',
 )
 
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'server.common.django.hashers.Argon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
     'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
 ]
 
+# Argon2 cost, stored passwords are rehashed on the next login when it
+# changes. Memory is in KiB, `python -m argon2` times values on a server:
+PASSWORD_ARGON2_TIME_COST = config(
+    'DJANGO_PASSWORD_ARGON2_TIME_COST', cast=int, default=2,
+)
+PASSWORD_ARGON2_MEMORY_COST = config(
+    'DJANGO_PASSWORD_ARGON2_MEMORY_COST', cast=int, default=102400,
+)
+PASSWORD_ARGON2_PARALLELISM = config(
+    'DJANGO_PASSWORD_ARGON2_PARALLELISM', cast=int, default=8,
+)
+
+# Passwords hashed at the same time by a single worker process,
+# logins over this limit wait for their turn:
+PASSWORD_HASHING_CONCURRENCY = config(
+    'DJANGO_PASSWORD_HASHING_CONCURRENCY', cast=int, default=2,
+)
+
 
 # Login settings
 # https://docs.djangoproject.com/en/3.2/ref/settings/
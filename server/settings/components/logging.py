@@ -5,9 +5,10 @@
 # 'Do not log' by Nikita Sobolev (@sobolevn)
 # https://sobolevn.me/2020/03/do-not-log
 
-from typing import TYPE_CHECKING, Callable, final
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Union, final
 
 import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse
@@ -48,6 +49,7 @@ LOGGING = {
     # These loggers are required by our app:
     # - django is required when using `logger.getLogger('django')`
     # - security is required by `axes`
+    # - server.requests is used by `RequestTimingMiddleware`
     'loggers': {
         'django': {
             'handlers': ['console'],
@@ -59,29 +61,55 @@ LOGGING = {
             'level': 'ERROR',
             'propagate': False,
         },
+        'server.requests': {
+            'handlers': ['json_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
 
 @final
 class LoggingContextVarsMiddleware(object):
-    """Used to reset ContextVars in structlog on each request."""
+    """
+    Used to reset ContextVars in structlog on each request.
+
+    Works in both sync and async chains,
+    so async views are not moved to the thread shared by sync code.
+    """
+
+    sync_capable = True
+    async_capable = True
 
     def __init__(
         self,
-        get_response: 'Callable[[HttpRequest], HttpResponse]',
+        get_response: 'Callable[[HttpRequest], Any]',
     ) -> None:
         """Django's API-compatible constructor."""
         self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            markcoroutinefunction(self)
 
-    def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
+    def __call__(
+        self,
+        request: 'HttpRequest',
+    ) -> 'Union[HttpResponse, Awaitable[HttpResponse]]':
         """
         Handle requests.
 
         Add your logging metadata here.
         Example: https://github.com/jrobichaud/django-structlog
         """
-        response = self.get_response(request)
+        if self._is_async:
+            return self._acall(request)
+        response: 'HttpResponse' = self.get_response(request)
+        structlog.contextvars.clear_contextvars()
+        return response
+
+    async def _acall(self, request: 'HttpRequest') -> 'HttpResponse':
+        response: 'HttpResponse' = await self.get_response(request)
         structlog.contextvars.clear_contextvars()
         return response
 
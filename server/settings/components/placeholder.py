@@ -7,5 +7,95 @@ from server.settings.components import config
 # to your custom one, that can be defined in `docker/placeholder`:
 PLACEHOLDER_API_URL = config('DJANGO_PLACEHOLDER_API_URL')
 
-# API default timeout in seconds:
-PLACEHOLDER_API_TIMEOUT = config('DJANGO_PLACEHOLDER_API_TIMEOUT', cast=int)
+# API timeouts in seconds: connect and read ones are set separately.
+# Connect timeout is slightly larger than a multiple of 3,
+# which is the default TCP packet retransmission window:
+PLACEHOLDER_API_TIMEOUT = (
+    config('DJANGO_PLACEHOLDER_API_CONNECT_TIMEOUT', cast=float, default=3.05),
+    config('DJANGO_PLACEHOLDER_API_READ_TIMEOUT', cast=float, default=5),
+)
+
+# Max number of kept-alive connections to the API per process:
+PLACEHOLDER_API_POOL_SIZE = config(
+    'DJANGO_PLACEHOLDER_API_POOL_SIZE', cast=int, default=10,
+)
+
+# Set to `False` to close connections after each request:
+PLACEHOLDER_API_KEEP_ALIVE = config(
+    'DJANGO_PLACEHOLDER_API_KEEP_ALIVE', cast=bool, default=True,
+)
+
+# Retries for idempotent requests, sleeps are `backoff * 2 ** retry` seconds:
+PLACEHOLDER_API_MAX_RETRIES = config(
+    'DJANGO_PLACEHOLDER_API_MAX_RETRIES', cast=int, default=2,
+)
+PLACEHOLDER_API_RETRY_BACKOFF = config(
+    'DJANGO_PLACEHOLDER_API_RETRY_BACKOFF', cast=float, default=0.3,
+)
+
+# Circuit breaker: calls are rejected for `OPEN_TIMEOUT` seconds
+# when this share of calls fails in a `WINDOW` seconds long window,
+# but only when there were at least `MIN_CALLS` calls in it:
+PLACEHOLDER_API_CIRCUIT_FAILURE_RATE = 0.5
+PLACEHOLDER_API_CIRCUIT_MIN_CALLS = 10
+PLACEHOLDER_API_CIRCUIT_WINDOW = 30
+PLACEHOLDER_API_CIRCUIT_OPEN_TIMEOUT = config(
+    'DJANGO_PLACEHOLDER_API_CIRCUIT_OPEN_TIMEOUT', cast=int, default=30,
+)
+
+# Bulkhead: max concurrent calls to a single endpoint per process,
+# extra calls are rejected right away instead of waiting:
+PLACEHOLDER_API_MAX_CONCURRENCY = config(
+    'DJANGO_PLACEHOLDER_API_MAX_CONCURRENCY', cast=int, default=5,
+)
+
+# Alias from `CACHES` used to store fetched pictures and circuit state,
+# it must be a shared cache in production:
+PLACEHOLDER_API_CACHE = 'default'
+
+# How long fetched pictures are considered fresh, in seconds:
+PLACEHOLDER_API_CACHE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_TTL', cast=int, default=60,
+)
+
+# How long stale pictures are served while being refreshed, in seconds:
+PLACEHOLDER_API_CACHE_STALE_TTL = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_STALE_TTL', cast=int, default=300,
+)
+
+# How long a single worker can refresh pictures before others
+# stop waiting for it, in seconds:
+PLACEHOLDER_API_CACHE_LOCK_TIMEOUT = 10
+
+# How long requests wait for pictures that another worker is fetching,
+# before they fetch them too, in seconds:
+PLACEHOLDER_API_CACHE_MAX_WAIT = config(
+    'DJANGO_PLACEHOLDER_API_CACHE_MAX_WAIT', cast=float, default=1,
+)
+
+# Picture catalog worker: how many pictures are fetched in a single request
+# and how often the whole catalog is synced, in seconds:
+PLACEHOLDER_CATALOG_PAGE_SIZE = 100
+PLACEHOLDER_CATALOG_SYNC_INTERVAL = config(
+    'DJANGO_PLACEHOLDER_CATALOG_SYNC_INTERVAL', cast=int, default=5 * 60,
+)
+
+# Lead outbox worker: how many users are created in a single batch,
+# for how long claimed users are hidden from other workers,
+# and the max delay between retries. All time values are in seconds:
+PLACEHOLDER_OUTBOX_BATCH_SIZE = config(
+    'DJANGO_PLACEHOLDER_OUTBOX_BATCH_SIZE', cast=int, default=50,
+)
+PLACEHOLDER_OUTBOX_LEASE = 60
+PLACEHOLDER_OUTBOX_MAX_BACKOFF = 60 * 60
+
+# User changes are sent only after this many seconds without new changes,
+# so repeated saves cost a single API call.
+# Users who keep changing things are still sent in the max delay
+# after their first unsent change:
+PLACEHOLDER_OUTBOX_DEBOUNCE = config(
+    'DJANGO_PLACEHOLDER_OUTBOX_DEBOUNCE', cast=int, default=5,
+)
+PLACEHOLDER_OUTBOX_MAX_DELAY = config(
+    'DJANGO_PLACEHOLDER_OUTBOX_MAX_DELAY', cast=int, default=60,
+)
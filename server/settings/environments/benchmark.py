@@ -0,0 +1,24 @@
+"""
+This file contains settings for load benchmarks, see `benchmarks/load.py`.
+
+They are production settings, but the app is served without `caddy`,
+so over plain `http`. All virtual users come from the same address,
+so rate limits are turned off.
+"""
+
+from split_settings.tools import include
+
+include('production.py')
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1']
+
+SECURE_SSL_REDIRECT = False
+SECURE_HSTS_SECONDS = 0
+SESSION_COOKIE_SECURE = False
+CSRF_COOKIE_SECURE = False
+
+# Static files are served by `caddy` and are not benchmarked,
+# so we don't need `collectstatic` to run first:
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+RATELIMIT_ENABLE = False
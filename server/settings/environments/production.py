@@ -6,6 +6,7 @@ values are overridden.
 """
 
 from server.settings.components import config
+from server.settings.components.common import TEMPLATES
 
 # Production flags:
 # https://docs.djangoproject.com/en/3.2/howto/deployment/
@@ -18,6 +19,9 @@ ALLOWED_HOSTS = [
 
     # We need this value for `healthcheck` to work:
     'localhost',
+
+    # We need this value to scrape metrics inside docker network:
+    'web',
 ]
 
 
@@ -45,6 +49,58 @@ STATICFILES_STORAGE = (
 MEDIA_ROOT = '/var/www/django/media'
 
 
+# Caching
+# https://github.com/jazzband/django-redis
+
+# All workers share one cache, so `axes` lockouts, rate limits
+# and cached api responses are consistent between them:
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': config('DJANGO_REDIS_URL'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {
+                # Per worker process, keep it below redis `maxclients`:
+                'max_connections': config(
+                    'DJANGO_REDIS_MAX_CONNECTIONS', cast=int, default=50,
+                ),
+                'retry_on_timeout': True,
+            },
+            'SOCKET_CONNECT_TIMEOUT': 1,  # seconds
+            'SOCKET_TIMEOUT': 1,  # seconds
+            'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+            # `pickle` is required to cache python objects,
+            # like `pydantic` models of the Placeholder API:
+            'SERIALIZER': config(
+                'DJANGO_REDIS_SERIALIZER',
+                default='django_redis.serializers.pickle.PickleSerializer',
+            ),
+        },
+    },
+    # Fragments that are the same for everyone, no need to share them:
+    'template_fragments': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'template_fragments',
+    },
+}
+
+
+# Templates
+# https://docs.djangoproject.com/en/3.2/ref/templates/api/#django.template.loaders.cached.Loader
+
+# Templates are compiled once per worker process, it is the default
+# without `DEBUG`, but we don't want to depend on it. Loaders can't be
+# combined with `APP_DIRS`:
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -69,6 +125,8 @@ SECURE_SSL_REDIRECT = True
 SECURE_REDIRECT_EXEMPT = [
     # This is required for healthcheck to work:
     '^health/',
+    # This is required for metrics scraping to work:
+    '^metrics/',
 ]
 
 SESSION_COOKIE_SECURE = True
@@ -9,19 +9,30 @@ This examples uses Django's default media
 files serving technique in development.
 """
 
+from typing import cast
+
 from django.conf import settings
 from django.contrib import admin
 from django.contrib.admindocs import urls as admindocs_urls
 from django.urls import include, path
+from django.views.decorators.cache import cache_control
 from django.views.generic import TemplateView
 from health_check import urls as health_urls
 
 from server.apps.identity import urls as identity_urls
 from server.apps.pictures import urls as pictures_urls
-from server.apps.pictures.views import IndexView
+from server.apps.pictures.views.index import IndexView
+from server.common.django.types import Settings
+from server.common.django.views import metrics
 
 admin.autodiscover()
 
+# Browsers and proxies can keep these pages:
+_public = cache_control(
+    public=True,
+    max_age=cast(Settings, settings).PUBLIC_PAGES_CACHE_MAX_AGE,
+)
+
 urlpatterns = [
     # Apps:
     path('pictures/', include(pictures_urls, namespace='pictures')),
@@ -30,19 +41,22 @@ urlpatterns = [
     # Health checks:
     path('health/', include(health_urls)),
 
+    # Prometheus metrics, only available inside our network:
+    path('metrics/', metrics, name='metrics'),
+
     # django-admin:
     path('admin/doc/', include(admindocs_urls)),
     path('admin/', admin.site.urls),
 
-    # Text and xml static files:
-    path('robots.txt', TemplateView.as_view(
+    # Text and xml static files, they are the same for everyone:
+    path('robots.txt', _public(TemplateView.as_view(
         template_name='common/txt/robots.txt',
         content_type='text/plain',
-    )),
-    path('humans.txt', TemplateView.as_view(
+    ))),
+    path('humans.txt', _public(TemplateView.as_view(
         template_name='common/txt/humans.txt',
         content_type='text/plain',
-    )),
+    ))),
 
     # It is a good practice to have an explicit index view:
     path('', IndexView.as_view(), name='index'),
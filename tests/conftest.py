@@ -10,5 +10,7 @@ pytest_plugins = [
     # Should be the first custom one:
     'plugins.django_settings',
 
-    # TODO: add your own plugins here!
+    # Factories:
+    'plugins.identity.users',
+    'plugins.pictures.pictures',
 ]
@@ -19,8 +19,10 @@ def _password_hashers(settings) -> None:
 @pytest.fixture(autouse=True)
 def _auth_backends(settings) -> None:
     """Deactivates security backend from Axes app."""
-    settings.AUTHENTICATION_BACKENDS = (
-        'django.contrib.auth.backends.ModelBackend',
+    settings.AUTHENTICATION_BACKENDS = tuple(
+        backend
+        for backend in settings.AUTHENTICATION_BACKENDS
+        if not backend.startswith('axes.')
     )
 
 
@@ -33,16 +35,30 @@ def _debug(settings) -> None:
 
 
 @pytest.fixture(autouse=True)
-def cache(settings) -> BaseCache:
-    """Modifies how cache is used in Django tests."""
+def cache(settings, tmpdir_factory) -> BaseCache:
+    """
+    Modifies how cache is used in Django tests.
+
+    File based cache is a local stand-in for shared production cache:
+    values are pickled the same way and are not shared between tests.
+    """
     test_cache = 'test'
 
-    # Patching cache settings:
-    settings.CACHES[test_cache] = {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    # Patching cache settings, new value resets cache connections:
+    settings.CACHES = {
+        **settings.CACHES,
+        test_cache: {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmpdir_factory.mktemp('cache', numbered=True)),
+        },
     }
     settings.RATELIMIT_USE_CACHE = test_cache
     settings.AXES_CACHE = test_cache
+    settings.PLACEHOLDER_API_CACHE = test_cache
+    settings.PICTURES_FAVOURITES_CACHE = test_cache
+    settings.PICTURES_GRID_CACHE = test_cache
+    settings.IDENTITY_USER_CACHE = test_cache
+    settings.SESSION_CACHE_ALIAS = test_cache
 
     # Clearing cache:
     caches[test_cache].clear()
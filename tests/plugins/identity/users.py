@@ -0,0 +1,59 @@
+import datetime as dt
+from typing import Any, Dict, Protocol, Type
+from uuid import uuid4
+
+import pytest
+from django.test import Client
+
+from server.apps.identity.models import User
+
+#: All users get the same password, tests use fast hashers anyway:
+USER_PASSWORD = 'password'  # noqa: S105
+
+_DATE_OF_BIRTH = dt.date.fromisoformat('1990-01-01')
+
+
+class UserFactory(Protocol):
+    """Creates saved users, all fields can be overridden."""
+
+    def __call__(self, **fields: Any) -> User:
+        """Create a user."""
+
+
+@pytest.fixture()
+def user_data() -> Dict[str, Any]:
+    """Valid details of a new user, the email is unique."""
+    return _user_data()
+
+
+@pytest.fixture()
+def user_factory(
+    django_user_model: Type[User],
+    db: None,
+) -> UserFactory:
+    """Factory of users with unique emails and all the details."""
+    def factory(**fields: Any) -> User:
+        return django_user_model.objects.create_user(
+            password=USER_PASSWORD,
+            **{**_user_data(), **fields},
+        )
+    return factory
+
+
+@pytest.fixture()
+def user_client(client: Client, user_factory: UserFactory) -> Client:
+    """Client with a new logged in user."""
+    client.force_login(user_factory())
+    return client
+
+
+def _user_data() -> Dict[str, Any]:
+    return {
+        'email': '{0}@example.com'.format(uuid4().hex),
+        'first_name': 'Ivan',
+        'last_name': 'Ivanov',
+        'date_of_birth': _DATE_OF_BIRTH,
+        'address': 'Moscow',
+        'job_title': 'Developer',
+        'phone': '+79990000000',
+    }
@@ -0,0 +1,67 @@
+from itertools import islice
+from typing import Any, Dict, List, Protocol
+
+import pytest
+
+from server.apps.identity.models import User
+from server.apps.pictures.models import FavouritePicture
+
+#: Rows are inserted in batches, so large datasets fit into memory:
+_BATCH_SIZE = 10000
+
+#: Placeholder API puts pictures into albums of this size:
+_ALBUM_SIZE = 50
+
+
+class PictureJsonFactory(Protocol):
+    """Creates :term:`Placeholder API` pictures, the way it returns them."""
+
+    def __call__(self, count: int) -> List[Dict[str, Any]]:
+        """Create ``count`` pictures."""
+
+
+class FavouritesFactory(Protocol):
+    """Saves pictures to :term:`favourites` of a user."""
+
+    def __call__(self, user: User, count: int) -> None:
+        """Save ``count`` pictures."""
+
+
+@pytest.fixture()
+def picture_json_factory() -> PictureJsonFactory:
+    """Factory of pictures as they come from :term:`Placeholder API`."""
+    def factory(count: int) -> List[Dict[str, Any]]:
+        return [picture_json(foreign_id) for foreign_id in range(1, count + 1)]
+    return factory
+
+
+@pytest.fixture()
+def favourites_factory(db: None) -> FavouritesFactory:
+    """Factory of favourite pictures, it works fine with millions of rows."""
+    def factory(user: User, count: int) -> None:
+        favourites = (
+            FavouritePicture(
+                user=user,
+                foreign_id=foreign_id,
+                url=picture_json(foreign_id)['url'],
+            )
+            for foreign_id in range(1, count + 1)
+        )
+        while True:  # noqa: WPS457
+            batch = list(islice(favourites, _BATCH_SIZE))
+            if not batch:
+                return
+            FavouritePicture.objects.bulk_create(batch)
+    return factory
+
+
+def picture_json(foreign_id: int) -> Dict[str, Any]:
+    """Single picture as it comes from :term:`Placeholder API`."""
+    url = 'https://via.placeholder.com/600/{0:06x}'.format(foreign_id)
+    return {
+        'albumId': (foreign_id - 1) // _ALBUM_SIZE + 1,
+        'id': foreign_id,
+        'title': 'picture {0}'.format(foreign_id),
+        'url': url,
+        'thumbnailUrl': url.replace('/600/', '/150/'),
+    }
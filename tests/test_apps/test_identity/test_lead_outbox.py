@@ -0,0 +1,245 @@
+from http import HTTPStatus
+from typing import Dict, List
+
+import pytest
+import requests
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.container import container
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.usecases.user_update import UserUpdate
+from server.apps.identity.models import LeadOutbox, LeadUpdateOutbox, User
+from tests.plugins.identity.users import UserFactory
+
+_LEAD_ID = 11
+_INVALID_RESPONSE = '{"id": null}'
+
+
+def _process_outbox() -> None:
+    call_command('process_lead_outbox', once=True)
+
+
+@pytest.fixture()
+def registration_data() -> Dict[str, str]:
+    """Valid registration form data."""
+    return {
+        'email': 'user@example.com',
+        'first_name': 'First',
+        'last_name': 'Last',
+        'date_of_birth': '2000-01-01',
+        'address': 'City',
+        'job_title': 'Job',
+        'phone': '+7000',
+        'password1': 'Some-Long-Pass1',
+        'password2': 'Some-Long-Pass1',
+    }
+
+
+@pytest.mark.django_db()
+def test_registration_uses_outbox(
+    client: Client,
+    registration_data: Dict[str, str],
+) -> None:
+    """This test ensures that registration does not call remote API."""
+    response = client.post(
+        reverse('identity:registration'),
+        data=registration_data,
+    )
+
+    assert response.status_code == HTTPStatus.FOUND
+    user = User.objects.get(email=registration_data['email'])
+    assert user.lead_id is None
+    assert LeadOutbox.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db()
+def test_outbox_processed(
+    monkeypatch: pytest.MonkeyPatch,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that worker saves :term:`lead_id`."""
+    user = user_factory()
+    LeadOutbox.objects.create(user=user)
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda *args, **kwargs: placeholder.UserResponse(id=_LEAD_ID),
+    )
+
+    _process_outbox()
+
+    user.refresh_from_db()
+    assert user.lead_id == _LEAD_ID
+    assert not LeadOutbox.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_outbox_retried(
+    monkeypatch: pytest.MonkeyPatch,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that failed items are retried later."""
+    user = user_factory()
+    LeadOutbox.objects.create(user=user)
+
+    def factory(*args, **kwargs) -> placeholder.UserResponse:
+        raise requests.ConnectionError('down')
+
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', factory)
+
+    _process_outbox()
+    _process_outbox()
+
+    outbox = LeadOutbox.objects.get(user=user)
+    assert outbox.attempts == 1
+    assert outbox.last_error == 'down'
+
+
+@pytest.mark.django_db()
+def test_outbox_invalid_response(
+    monkeypatch: pytest.MonkeyPatch,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that unexpected responses are retried later."""
+    user = user_factory()
+    LeadOutbox.objects.create(user=user)
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda *args, **kwargs: placeholder.UserResponse.parse_raw(
+            _INVALID_RESPONSE,
+        ),
+    )
+
+    _process_outbox()
+
+    outbox = LeadOutbox.objects.get(user=user)
+    assert outbox.attempts == 1
+    assert 'id' in outbox.last_error
+
+
+@pytest.mark.django_db()
+def test_outbox_user_deleted(
+    monkeypatch: pytest.MonkeyPatch,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that users deleted while being sent are skipped."""
+    LeadOutbox.objects.create(user=user_factory())
+
+    def factory(*args, user: User, **kwargs) -> placeholder.UserResponse:
+        User.objects.filter(pk=user.pk).delete()  # by another process
+        return placeholder.UserResponse(id=_LEAD_ID)
+
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', factory)
+
+    _process_outbox()
+
+    assert not User.objects.exists()
+    assert not LeadOutbox.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_outbox_user_deleted_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that failed items of deleted users are skipped."""
+    LeadOutbox.objects.create(user=user_factory())
+
+    def factory(*args, user: User, **kwargs) -> placeholder.UserResponse:
+        User.objects.filter(pk=user.pk).delete()  # by another process
+        raise requests.ConnectionError('down')
+
+    monkeypatch.setattr(placeholder.LeadCreate, '__call__', factory)
+
+    _process_outbox()
+
+    assert not LeadOutbox.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_updates_coalesced(
+    monkeypatch: pytest.MonkeyPatch,
+    settings,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that repeated saves cost a single API call."""
+    settings.PLACEHOLDER_OUTBOX_DEBOUNCE = 0
+    user = user_factory(lead_id=_LEAD_ID)
+    calls: List[str] = []
+    monkeypatch.setattr(
+        placeholder.LeadUpdate,
+        '__call__',
+        lambda *args, **kwargs: calls.append(kwargs['user'].first_name),
+    )
+
+    for first_name in ('First', 'Second', 'Second'):
+        user.first_name = first_name
+        user.save()
+        container.instantiate(UserUpdate)(user)
+    _process_outbox()
+    container.instantiate(UserUpdate)(user)
+    _process_outbox()
+
+    assert calls == ['Second']
+
+
+@pytest.mark.django_db()
+def test_updates_max_delay(
+    monkeypatch: pytest.MonkeyPatch,
+    settings,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that constant changes are not postponed forever."""
+    settings.PLACEHOLDER_OUTBOX_DEBOUNCE = 60
+    settings.PLACEHOLDER_OUTBOX_MAX_DELAY = 0
+    user = user_factory(lead_id=_LEAD_ID)
+    calls: List[str] = []
+    monkeypatch.setattr(
+        placeholder.LeadUpdate,
+        '__call__',
+        lambda *args, **kwargs: calls.append(kwargs['user'].first_name),
+    )
+
+    for first_name in ('First', 'Second'):
+        user.first_name = first_name
+        user.save()
+        container.instantiate(UserUpdate)(user)
+    _process_outbox()
+
+    assert calls == ['Second']
+
+
+@pytest.mark.django_db()
+def test_updates_wait_for_lead(
+    monkeypatch: pytest.MonkeyPatch,
+    settings,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that updates without :term:`lead_id` are parked."""
+    settings.PLACEHOLDER_OUTBOX_DEBOUNCE = 0
+    user = user_factory()
+    calls: List[str] = []
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda *args, **kwargs: placeholder.UserResponse(id=_LEAD_ID),
+    )
+    monkeypatch.setattr(
+        placeholder.LeadUpdate,
+        '__call__',
+        lambda *args, **kwargs: calls.append(kwargs['user'].first_name),
+    )
+
+    container.instantiate(UserUpdate)(user)
+    _process_outbox()
+    parked = LeadUpdateOutbox.objects.get(user=user)
+    LeadOutbox.objects.create(user=user)
+    _process_outbox()
+
+    assert parked.next_attempt_at is None
+    assert not parked.attempts
+    assert not calls  # the created lead already has the latest state
+    assert LeadUpdateOutbox.objects.get(user=user).next_attempt_at is None
@@ -0,0 +1,43 @@
+from http import HTTPStatus
+from typing import Callable, ContextManager
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from server.apps.identity.container import container
+from server.apps.identity.logic.usecases.user_cached import UserCachedGet
+from tests.plugins.identity.users import UserFactory
+
+
+def test_authenticated_requests_skip_database(user_client: Client) -> None:
+    """This test ensures that sessions and users come from the cache."""
+    user_client.get(reverse('identity:user_update'))  # fills the cache
+
+    queries = CaptureQueriesContext(connection)
+    with queries:
+        response = user_client.get(reverse('identity:user_update'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert not any(
+        'identity_user' in query['sql'] or 'django_session' in query['sql']
+        for query in queries.captured_queries
+    )
+
+
+def test_saved_user_is_invalidated(
+    user_factory: UserFactory,
+    django_capture_on_commit_callbacks: Callable[..., ContextManager[None]],
+) -> None:
+    """This test ensures that saved users are not served from the cache."""
+    user = user_factory()
+    user_cached_get = container.instantiate(UserCachedGet)
+    assert user_cached_get(user.pk).first_name == user.first_name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.first_name = 'Petr'
+        user.save(update_fields=['first_name'])
+
+    assert user_cached_get(user.pk).first_name == 'Petr'
+    assert user_cached_get(0) is None
@@ -0,0 +1,125 @@
+import csv
+import io
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from server.apps.identity.intrastructure.services import placeholder
+from server.apps.identity.logic.usecases import user_import
+from server.apps.identity.models import LeadOutbox, User
+from tests.plugins.identity.users import USER_PASSWORD, UserFactory
+
+_LEAD_ID = 11
+
+
+@pytest.fixture()
+def users_csv(tmp_path: Path, user_data: Dict[str, Any]) -> Path:
+    """File with two valid users and an invalid one."""
+    rows: List[Dict[str, Any]] = [
+        {**user_data, 'email': 'first@example.com', 'password': USER_PASSWORD},
+        {**user_data, 'email': 'second@example.com'},
+        {**user_data, 'email': 'not-an-email'},
+    ]
+    path = tmp_path / 'users.csv'
+    with path.open('w', newline='') as users_file:
+        writer = csv.DictWriter(users_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+@pytest.mark.django_db()
+def test_import_users(users_csv: Path) -> None:
+    """This test ensures that valid users are imported to the outbox."""
+    call_command(
+        'import_users',
+        str(users_csv),
+        '--chunk-size=2',
+        '--hash-workers=1',
+        '--no-backfill',
+    )
+
+    assert set(User.objects.values_list('email', flat=True)) == {
+        'first@example.com',
+        'second@example.com',
+    }
+    first, second = User.objects.order_by('email')
+    assert first.check_password(USER_PASSWORD)
+    assert not second.has_usable_password()
+    assert LeadOutbox.objects.count() == 2
+
+
+@pytest.mark.django_db()
+def test_import_users_resumes(users_csv: Path) -> None:
+    """This test ensures that imported rows are not read again."""
+    users_csv.with_name('users.csv.checkpoint').write_text('1')
+
+    call_command(
+        'import_users',
+        str(users_csv),
+        '--hash-workers=1',
+        '--no-backfill',
+    )
+
+    assert list(User.objects.values_list('email', flat=True)) == [
+        'second@example.com',
+    ]
+
+
+@pytest.mark.django_db()
+def test_import_users_registered_meanwhile(
+    monkeypatch: pytest.MonkeyPatch,
+    users_csv: Path,
+    user_factory: UserFactory,
+) -> None:
+    """This test ensures that concurrent registrations do not fail chunks."""
+    user_factory(email='first@example.com', first_name='Registered')
+    # The user registers after we have checked existing emails:
+    monkeypatch.setattr(user_import, '_existing_emails', lambda emails: set())
+    output = io.StringIO()
+
+    call_command(
+        'import_users',
+        str(users_csv),
+        '--hash-workers=1',
+        '--no-backfill',
+        stdout=output,
+    )
+
+    first = User.objects.get(email='first@example.com')
+    assert first.first_name == 'Registered'
+    assert LeadOutbox.objects.get().user.email == 'second@example.com'
+    assert 'created: 1, skipped: 1' in output.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_users_backfill(
+    monkeypatch: pytest.MonkeyPatch,
+    users_csv: Path,
+) -> None:
+    """This test ensures that imported users get :term:`lead_id`."""
+    monkeypatch.setattr(
+        placeholder.LeadCreate,
+        '__call__',
+        lambda *args, **kwargs: placeholder.UserResponse(id=_LEAD_ID),
+    )
+
+    call_command(
+        'import_users',
+        str(users_csv),
+        '--hash-workers=1',
+        '--concurrency=1',
+        '--rate=1000',
+    )
+
+    assert set(User.objects.values_list('lead_id', flat=True)) == {_LEAD_ID}
+    assert not LeadOutbox.objects.exists()
+
+
+@pytest.mark.parametrize('option', ['--rate=0', '--concurrency=0'])
+def test_import_users_invalid_backfill(users_csv: Path, option: str) -> None:
+    """This test ensures that backfill options are checked before import."""
+    with pytest.raises(CommandError, match='must be positive'):
+        call_command('import_users', str(users_csv), option)
@@ -0,0 +1,87 @@
+import io
+from typing import Dict, List, Optional
+
+import pytest
+from django.core.management import call_command
+
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.models import Picture
+
+_Pages = Dict[int, List[placeholder.PictureResponse]]
+
+
+@pytest.fixture()
+def api_pages(settings, monkeypatch: pytest.MonkeyPatch) -> _Pages:
+    """Fake :term:`Placeholder API` catalog, two pictures per page."""
+    settings.PLACEHOLDER_CATALOG_PAGE_SIZE = 2
+    pages: _Pages = {
+        1: [
+            placeholder.PictureResponse(id=1, url='https://example.com/1'),
+            placeholder.PictureResponse(id=2, url='https://example.com/2'),
+        ],
+        2: [placeholder.PictureResponse(id=3, url='https://example.com/3')],
+    }
+
+    def factory(
+        self,
+        *,
+        page: int,
+        limit: int,
+        etag: Optional[str] = None,
+    ) -> placeholder.PicturesPage:
+        return placeholder.PicturesPage(pictures=pages.get(page, []), etag=None)
+
+    monkeypatch.setattr(placeholder.PicturesPageFetch, '__call__', factory)
+    return pages
+
+
+def _invalid_page(self, **kwargs) -> placeholder.PicturesPage:
+    raise ValueError('Invalid picture')
+
+
+def _stop(interval: float) -> None:
+    raise KeyboardInterrupt
+
+
+@pytest.mark.django_db()
+def test_catalog_sync(api_pages: _Pages) -> None:
+    """This test ensures that all pages are synced and changes are found."""
+    call_command('sync_picture_catalog', once=True)
+
+    assert Picture.objects.count() == 3
+
+    api_pages[2] = [
+        placeholder.PictureResponse(id=3, url='https://example.com/new'),
+    ]
+    call_command('sync_picture_catalog', once=True)
+
+    assert Picture.objects.get(foreign_id=3).url == 'https://example.com/new'
+    assert Picture.objects.count() == 3
+
+
+def test_catalog_sync_survives_invalid_response(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that the sync worker is not killed by bad data."""
+    monkeypatch.setattr(
+        placeholder.PicturesPageFetch, '__call__', _invalid_page,
+    )
+    monkeypatch.setattr('time.sleep', _stop)  # after the first sync
+    stderr = io.StringIO()
+
+    with pytest.raises(KeyboardInterrupt):
+        call_command('sync_picture_catalog', stderr=stderr)
+
+    assert 'Invalid picture' in stderr.getvalue()
+
+
+@pytest.mark.parametrize('element', [
+    {'id': True, 'url': 'https://example.com/1'},
+    {'id': '1', 'url': 'https://example.com/1'},
+    {'id': 1},
+    None,
+])
+def test_invalid_picture(element: object) -> None:
+    """This test ensures that invalid API items are rejected."""
+    with pytest.raises(ValueError, match='[Pp]icture'):
+        placeholder.PictureResponse.from_json(element)
@@ -0,0 +1,146 @@
+from http import HTTPStatus
+from typing import List
+
+import pytest
+from django.core.cache import BaseCache
+from django.core.cache.utils import make_template_fragment_key
+from django.test import Client
+from django.urls import reverse_lazy
+
+from server.apps.identity.models import User
+from server.apps.pictures.intrastructure.services import placeholder
+from server.apps.pictures.models import FavouritePicture, Picture
+from server.common.django import fragments
+from server.common.services.circuit_breaker import CallRejectedError
+
+_DASHBOARD_URL = reverse_lazy('pictures:dashboard')
+_PICTURE = placeholder.PictureResponse(id=1, url='https://example.com/1')
+
+
+@pytest.fixture(autouse=True)
+def _placeholder_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    """We don't want to call real :term:`Placeholder API` in tests."""
+    def factory(*args, **kwargs) -> List[placeholder.PictureResponse]:
+        return [_PICTURE]
+
+    monkeypatch.setattr(placeholder.PicturesFetch, '__call__', factory)
+
+
+def test_dashboard_unauthorized(client: Client) -> None:
+    """This test ensures that dashboard requires auth."""
+    response = client.get(_DASHBOARD_URL)
+
+    assert response.status_code == HTTPStatus.FOUND
+
+
+@pytest.mark.django_db()
+def test_dashboard_pictures(user_client: Client) -> None:
+    """This test ensures that dashboard shows fetched pictures."""
+    response = user_client.get(_DASHBOARD_URL)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.context['pictures'] == [_PICTURE]
+    assert response.context['favourites_count'] == 0
+
+
+@pytest.mark.django_db()
+def test_dashboard_pictures_cached(
+    user_client: Client,
+    cache: BaseCache,
+) -> None:
+    """This test ensures that pictures grid is shared by all users."""
+    response = user_client.get(_DASHBOARD_URL)
+
+    grid = cache.get(
+        make_template_fragment_key('pictures_grid', [
+            fragments.content_version([_PICTURE]),
+        ]),
+    )
+    assert 'favourite-{0}'.format(_PICTURE.id) in grid
+    assert 'csrfmiddlewaretoken' not in grid
+    assert response.content.decode().count('csrfmiddlewaretoken') == 2
+
+
+@pytest.mark.django_db()
+def test_dashboard_not_modified(user_client: Client) -> None:
+    """This test ensures that the same dashboard is not rendered again."""
+    response = user_client.get(_DASHBOARD_URL)
+
+    not_modified_response = user_client.get(
+        _DASHBOARD_URL,
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+
+    assert not_modified_response.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified_response['ETag'] == response['ETag']
+    assert 'private' in response['Cache-Control']
+
+
+@pytest.mark.django_db()
+def test_dashboard_modified_after_login(
+    user_client: Client,
+) -> None:
+    """This test ensures that pages with old csrf tokens are not reused."""
+    response = user_client.get(_DASHBOARD_URL)
+    user_client.logout()
+    user_client.force_login(User.objects.get())
+
+    new_session_response = user_client.get(
+        _DASHBOARD_URL,
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+
+    assert new_session_response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db()
+def test_dashboard_picture_catalog(user_client: Client) -> None:
+    """This test ensures that synced pictures are not fetched from the API."""
+    picture = Picture.objects.create(foreign_id=2, url='https://example.com/2')
+
+    response = user_client.get(_DASHBOARD_URL)
+
+    assert response.context['pictures'] == [
+        placeholder.PictureResponse(id=picture.foreign_id, url=picture.url),
+    ]
+
+
+@pytest.mark.django_db()
+def test_dashboard_circuit_open(
+    user_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that dashboard works when the API is not called."""
+    def factory(*args, **kwargs) -> List[placeholder.PictureResponse]:
+        raise CallRejectedError('Circuit is open')
+
+    monkeypatch.setattr(placeholder.PicturesFetch, '__call__', factory)
+    response = user_client.get(_DASHBOARD_URL)
+
+    assert response.status_code == HTTPStatus.OK
+    assert not response.context['pictures']
+
+
+@pytest.mark.django_db()
+def test_dashboard_add_favourite(user_client: Client) -> None:
+    """This test ensures that pictures can be saved to favourites."""
+    response = user_client.post(_DASHBOARD_URL, data={
+        'foreign_id': _PICTURE.id,
+        'url': _PICTURE.url,
+    })
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert FavouritePicture.objects.filter(foreign_id=_PICTURE.id).exists()
+
+
+@pytest.mark.django_db()
+def test_dashboard_add_favourite_twice(user_client: Client) -> None:
+    """This test ensures that duplicate clicks do not create duplicates."""
+    for _ in range(2):
+        response = user_client.post(_DASHBOARD_URL, data={
+            'foreign_id': _PICTURE.id,
+            'url': _PICTURE.url,
+        })
+
+        assert response.status_code == HTTPStatus.FOUND
+    assert FavouritePicture.objects.filter(foreign_id=_PICTURE.id).count() == 1
@@ -0,0 +1,147 @@
+from http import HTTPStatus
+from typing import List, Optional
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.models import User
+from server.apps.pictures.logic.repo.queries import favourite_pictures
+from server.apps.pictures.models import FavouritePicture
+from server.apps.pictures.views.favourites import FavouritePicturesView
+from tests.plugins.identity.users import UserFactory
+
+_TOTAL = 5
+
+
+@pytest.fixture()
+def user(user_factory: UserFactory) -> User:
+    """User with some favourite pictures."""
+    user = user_factory()
+    FavouritePicture.objects.bulk_create([
+        FavouritePicture(
+            user=user,
+            foreign_id=foreign_id,
+            url='https://example.com/{0}'.format(foreign_id),
+        )
+        for foreign_id in range(_TOTAL)
+    ])
+    return user
+
+
+@pytest.mark.django_db()
+def test_favourites_pages(
+    client: Client,
+    user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """This test ensures that all favourites are reachable by cursors."""
+    monkeypatch.setattr(FavouritePicturesView, 'page_size', 2)
+    client.force_login(user)
+
+    seen: List[int] = []
+    cursor: Optional[str] = ''
+    while cursor is not None:
+        response = client.get(
+            reverse('pictures:favourites'),
+            data={'cursor': cursor},
+        )
+        assert response.status_code == HTTPStatus.OK
+        seen.extend(
+            picture.foreign_id for picture in response.context['object_list']
+        )
+        cursor = response.context['next_cursor']
+
+    assert seen == list(reversed(range(_TOTAL)))
+
+
+@pytest.mark.django_db()
+def test_favourites_invalid_cursor(client: Client, user: User) -> None:
+    """This test ensures that broken cursors are not found."""
+    client.force_login(user)
+
+    response = client.get(
+        reverse('pictures:favourites'),
+        data={'cursor': 'broken'},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_favourites_bulk(client: Client, user: User) -> None:
+    """This test ensures that many pictures are saved at once."""
+    client.force_login(user)
+
+    response = client.post(reverse('pictures:favourites_bulk'), data={
+        'foreign_id': [0, _TOTAL, _TOTAL + 1],
+        'url': [
+            'https://example.com/0',
+            'https://example.com/a',
+            'https://example.com/b',
+        ],
+    })
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert user.pictures.count() == _TOTAL + 2
+
+
+@pytest.mark.django_db()
+def test_favourites_bulk_invalid(client: Client, user: User) -> None:
+    """This test ensures that ids and urls must come in pairs."""
+    client.force_login(user)
+
+    response = client.post(reverse('pictures:favourites_bulk'), data={
+        'foreign_id': [_TOTAL, _TOTAL + 1],
+        'url': ['https://example.com/a'],
+    })
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert user.pictures.count() == _TOTAL
+
+
+@pytest.mark.django_db()
+def test_favourites_cache_invalidated(client: Client, user: User) -> None:
+    """This test ensures that cached favourites are dropped on changes."""
+    client.force_login(user)
+    client.get(reverse('pictures:favourites'))
+
+    client.post(reverse('pictures:favourites_bulk'), data={
+        'foreign_id': [_TOTAL],
+        'url': ['https://example.com/a'],
+    })
+    response = client.get(reverse('pictures:favourites'))
+
+    assert len(response.context['object_list']) == _TOTAL + 1
+
+
+@pytest.mark.django_db()
+def test_favourites_not_modified(client: Client, user: User) -> None:
+    """This test ensures that pages are only rendered after changes."""
+    client.force_login(user)
+    response = client.get(reverse('pictures:favourites'))
+
+    not_modified_response = client.get(
+        reverse('pictures:favourites'),
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+    client.post(reverse('pictures:favourites_bulk'), data={
+        'foreign_id': [_TOTAL],
+        'url': ['https://example.com/a'],
+    })
+    modified_response = client.get(
+        reverse('pictures:favourites'),
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+
+    assert not_modified_response.status_code == HTTPStatus.NOT_MODIFIED
+    assert 'private' in not_modified_response['Cache-Control']
+    assert modified_response.status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db()
+def test_favourites_page_covered(user: User) -> None:
+    """This test ensures that pages only load columns of the index."""
+    page = favourite_pictures.page_by_user(user.pk, cursor=None, page_size=1)
+
+    assert page.object_list[0].get_deferred_fields() == {'updated_at'}
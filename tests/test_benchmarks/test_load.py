@@ -0,0 +1,102 @@
+from typing import List
+
+import pytest
+
+from benchmarks.load import Report, StepReport, compare, percentile
+
+_TOLERANCE = 0.2
+
+#: Every metric of the baseline, noise within the tolerance and a regression:
+_EXPECTED = 10
+_NOISY = 12
+_REGRESSED = 13
+
+
+def _step(
+    *,
+    p95: float = _EXPECTED,
+    rps: float = _EXPECTED,
+    requests: int = 100,
+    errors: int = 0,
+) -> StepReport:
+    return {
+        'requests': requests,
+        'errors': errors,
+        'rps': rps,
+        'p50': p95 / 2,
+        'p95': p95,
+        'p99': p95 * 2,
+    }
+
+
+def _report(*, memory: float = _EXPECTED, **steps: StepReport) -> Report:
+    return {
+        'dashboard': _step(),
+        'total': _step(),
+        **steps,
+        'memory_mb': {'pss': memory},
+    }
+
+
+@pytest.mark.parametrize('report', [
+    _report(),
+    _report(dashboard=_step(p95=_NOISY)),
+    _report(dashboard=_step(errors=1)),
+    _report(total=_step(rps=9)),
+    _report(memory=_NOISY),
+])
+def test_compare_within_tolerance(report: Report) -> None:
+    """This test ensures that noise is not reported as regressions."""
+    assert not compare(report, _report(), tolerance=_TOLERANCE)
+
+
+@pytest.mark.parametrize(('report', 'regression'), [
+    (
+        _report(dashboard=_step(p95=_REGRESSED)),
+        'dashboard: p95 13 ms, was 10 ms',
+    ),
+    (
+        _report(dashboard=_step(errors=2)),
+        'dashboard: 2 errors of 100 requests',
+    ),
+    (_report(total=_step(rps=7)), 'total: 7 rps, was 10 rps'),
+    (_report(memory=_REGRESSED), 'memory: 13 MB, was 10 MB'),
+])
+def test_compare_regressions(report: Report, regression: str) -> None:
+    """This test ensures that regressions are reported."""
+    assert compare(report, _report(), tolerance=_TOLERANCE) == [regression]
+
+
+def test_compare_few_requests() -> None:
+    """This test ensures that latency of rare steps is not compared."""
+    report = _report(login=_step(p95=_REGRESSED, requests=10))
+
+    assert not compare(
+        report,
+        _report(login=_step(requests=10)),
+        tolerance=_TOLERANCE,
+    )
+
+
+def test_compare_new_steps() -> None:
+    """This test ensures that steps missing in the baseline are skipped."""
+    report = _report(favourites=_step(p95=1000))
+
+    assert not compare(report, _report(), tolerance=_TOLERANCE)
+
+
+@pytest.mark.parametrize(('sorted_values', 'rank', 'expected'), [
+    ([], 95, 0),
+    ([1], 50, 1),
+    ([1, 2, 3, 4, 5], 0, 1),
+    ([1, 2, 3, 4, 5], 50, 3),
+    ([1, 2, 3, 4, 5], 100, 5),
+    (list(range(100)), 95, 94),
+])
+def test_percentile(
+    sorted_values: List[float],
+    rank: int,
+    expected: float,
+) -> None:
+    """This test ensures that percentiles are nearest-rank ones."""
+    assert percentile(sorted_values, rank) == expected
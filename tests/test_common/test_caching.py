@@ -0,0 +1,82 @@
+import time
+from typing import Final
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import BaseCache
+
+from server.common.services.caching import StaleWhileRevalidate
+
+_KEY: Final = 'some:key'
+_POLL_INTERVAL: Final = 0.01
+_LOCK_TIMEOUT: Final = 60
+_MAX_WAIT: Final = 0.1
+
+
+@pytest.fixture()
+def cached_fetch(cache: BaseCache) -> StaleWhileRevalidate:
+    """Cache with short timeouts for tests."""
+    return StaleWhileRevalidate(
+        cache=cache,
+        ttl=60,
+        stale_ttl=60,
+        lock_timeout=_LOCK_TIMEOUT,
+        max_wait=_MAX_WAIT,
+        poll_interval=_POLL_INTERVAL,
+    )
+
+
+def test_fresh_value_is_cached(cached_fetch: StaleWhileRevalidate) -> None:
+    """This test ensures that fresh values do not hit the upstream."""
+    fetch = Mock(side_effect=[1, 2])
+
+    assert cached_fetch(_KEY, fetch) == 1
+    assert cached_fetch(_KEY, fetch) == 1
+    assert fetch.call_count == 1
+
+
+def test_stale_value_is_refreshed(
+    cache: BaseCache,
+    cached_fetch: StaleWhileRevalidate,
+) -> None:
+    """This test ensures that stale values are refreshed by lock owner."""
+    cache.set(_KEY, (time.time() - 1, 'stale'))
+
+    assert cached_fetch(_KEY, lambda: 'fresh') == 'fresh'
+    assert cached_fetch(_KEY, lambda: 'other') == 'fresh'
+
+
+def test_stale_value_served_while_locked(
+    cache: BaseCache,
+    cached_fetch: StaleWhileRevalidate,
+) -> None:
+    """This test ensures that stale values are served during refresh."""
+    cache.set(_KEY, (time.time() - 1, 'stale'))
+    cache.set('{0}:lock'.format(_KEY), 1)
+
+    assert cached_fetch(_KEY, lambda: 'fresh') == 'stale'
+
+
+def test_stale_value_served_on_error(
+    cache: BaseCache,
+    cached_fetch: StaleWhileRevalidate,
+) -> None:
+    """This test ensures that stale values are served when refresh fails."""
+    cache.set(_KEY, (time.time() - 1, 'stale'))
+    fetch = Mock(side_effect=[ValueError('upstream is down'), 'fresh'])
+
+    assert cached_fetch(_KEY, fetch) == 'stale'
+    assert cached_fetch(_KEY, fetch) == 'fresh'
+
+
+def test_missing_value_dead_lock_owner(
+    cache: BaseCache,
+    cached_fetch: StaleWhileRevalidate,
+) -> None:
+    """This test ensures that we do not wait for dead lock owners forever."""
+    cache.set('{0}:lock'.format(_KEY), 1, timeout=_LOCK_TIMEOUT)
+    started = time.monotonic()
+
+    assert cached_fetch(_KEY, lambda: 'fetched') == 'fetched'
+    assert cache.get(_KEY)[1] == 'fetched'
+    assert time.monotonic() - started < _LOCK_TIMEOUT / 10
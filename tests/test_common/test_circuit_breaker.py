@@ -0,0 +1,108 @@
+import time
+from functools import partial
+from http import HTTPStatus
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from server.common.services.circuit_breaker import (
+    CallRejectedError,
+    CircuitBreaker,
+)
+
+_ENDPOINT = 'SomeFetcher'
+_OPEN_KEY = 'circuit:{0}:open'.format(_ENDPOINT)
+_PROBE_KEY = 'circuit:{0}:probe'.format(_ENDPOINT)
+
+
+@pytest.fixture()
+def circuit_breaker(cache) -> CircuitBreaker:
+    """Circuit breaker that opens after two failed calls."""
+    return CircuitBreaker(
+        cache_alias='test',
+        failure_rate=0.5,
+        min_calls=2,
+        window=60,
+        open_timeout=60,
+        max_concurrency=1,
+    )
+
+
+def _ok() -> requests.Response:
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    return response
+
+
+def _fail() -> requests.Response:
+    raise requests.ConnectionError('down')
+
+
+def _open_meanwhile(cache) -> requests.Response:
+    cache.set(_OPEN_KEY, time.time() + 60)
+    return _ok()
+
+
+def _probe_meanwhile(
+    cache,
+    circuit_breaker: CircuitBreaker,
+) -> requests.Response:
+    cache.set(_OPEN_KEY, 0)  # half-open, the next call is a probe
+    with pytest.raises(CallRejectedError, match='concurrent'):
+        circuit_breaker(_ENDPOINT, _ok)
+    assert cache.get(_PROBE_KEY) is None
+    return _ok()
+
+
+def test_circuit_opens(circuit_breaker: CircuitBreaker) -> None:
+    """This test ensures that failing endpoints are not called."""
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            circuit_breaker(_ENDPOINT, _fail)
+
+    send = Mock(side_effect=_ok)
+
+    with pytest.raises(CallRejectedError):
+        circuit_breaker(_ENDPOINT, send)
+    send.assert_not_called()
+
+
+def test_circuit_closes_after_probe(
+    cache,
+    circuit_breaker: CircuitBreaker,
+) -> None:
+    """This test ensures that successful probe closes the circuit."""
+    cache.set(_OPEN_KEY, 0)
+
+    assert circuit_breaker(_ENDPOINT, _ok).status_code == HTTPStatus.OK
+    assert cache.get(_OPEN_KEY) is None
+
+
+def test_circuit_closed_only_by_probe(
+    cache,
+    circuit_breaker: CircuitBreaker,
+) -> None:
+    """This test ensures that calls started before opening are not probes."""
+    circuit_breaker(_ENDPOINT, partial(_open_meanwhile, cache))
+
+    assert cache.get(_OPEN_KEY) is not None
+
+
+def test_bulkhead_is_full(circuit_breaker: CircuitBreaker) -> None:
+    """This test ensures that concurrent calls are limited."""
+    with pytest.raises(CallRejectedError):
+        circuit_breaker(_ENDPOINT, partial(circuit_breaker, _ENDPOINT, _ok))
+
+
+def test_bulkhead_releases_probe(
+    cache,
+    circuit_breaker: CircuitBreaker,
+) -> None:
+    """This test ensures that rejected probes let others probe."""
+    response = circuit_breaker(
+        _ENDPOINT,
+        partial(_probe_meanwhile, cache, circuit_breaker),
+    )
+
+    assert response.status_code == HTTPStatus.OK
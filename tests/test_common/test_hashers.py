@@ -0,0 +1,34 @@
+from typing import List
+
+import pytest
+from django.conf import LazySettings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+@pytest.fixture()
+def _argon2(settings: LazySettings) -> None:
+    """Use our hasher with the cheapest cost, so tests stay fast."""
+    settings.PASSWORD_HASHERS = [
+        'server.common.django.hashers.Argon2PasswordHasher',
+    ]
+    settings.PASSWORD_ARGON2_TIME_COST = 1
+    settings.PASSWORD_ARGON2_MEMORY_COST = 8
+    settings.PASSWORD_ARGON2_PARALLELISM = 1
+
+
+@pytest.mark.usefixtures('_argon2')
+def test_rehash_on_cost_change(settings: LazySettings) -> None:
+    """This test ensures that hashes are updated when the cost changes."""
+    encoded = make_password('password')
+    rehashed: List[str] = []
+
+    assert check_password('password', encoded, rehashed.append)
+    assert not check_password('wrong', encoded, rehashed.append)
+    assert not rehashed
+
+    settings.PASSWORD_ARGON2_TIME_COST = 2
+
+    assert check_password('password', encoded, rehashed.append)
+    assert rehashed == ['password']
+    # Argon2 hashes keep their parameters, like `m=8,t=2,p=1`:
+    assert ',t=2,' in make_password('password')
@@ -0,0 +1,73 @@
+import io
+import json
+from typing import List
+
+import pytest
+import requests
+from django.conf import LazySettings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from server.common.services.http import create_session
+from server.common.services.json_stream import iter_json_array
+
+_MANY_ITEMS = 5000
+_OBJECT = b'{"id": 1}'
+
+
+@pytest.mark.parametrize('body', [
+    # Larger than a single chunk, so items are split between chunks:
+    [
+        {'id': index, 'url': 'https://example.com/é'}
+        for index in range(_MANY_ITEMS)
+    ],
+    # Single item split between many chunks:
+    ['a' * _MANY_ITEMS * 100],
+    [],
+    [1, 'a,]', [2, [3]], None],
+])
+def test_iter_json_array(body: List[object]) -> None:
+    """This test ensures that streamed JSON arrays are parsed correctly."""
+    response = requests.Response()
+    response.raw = io.BytesIO(json.dumps(body).encode('utf8'))
+
+    assert list(iter_json_array(response)) == body
+
+
+@pytest.mark.parametrize('body', [
+    b'',
+    b'[1, 2',
+    _OBJECT,
+    b'[1 2]',
+    b'[1,]',
+    b'[,]',
+    b'[1] x',
+    b'[1] [2]',
+    b'[tru]',
+])
+def test_iter_json_array_invalid(body: bytes) -> None:
+    """This test ensures that invalid JSON arrays are reported."""
+    response = requests.Response()
+    response.raw = io.BytesIO(body)
+
+    with pytest.raises(ValueError, match='JSON array'):
+        list(iter_json_array(response))
+
+
+@pytest.mark.parametrize('scheme', ['http://', 'https://'])
+def test_create_session(settings: LazySettings, scheme: str) -> None:
+    """This test ensures that sessions are pooled and retry safe calls."""
+    settings.PLACEHOLDER_API_POOL_SIZE = 3
+    settings.PLACEHOLDER_API_MAX_RETRIES = 2
+    settings.PLACEHOLDER_API_RETRY_BACKOFF = 1
+
+    adapter = create_session(settings).get_adapter(scheme)
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 3
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 1
+    # Idempotent ones, without `POST` and `PATCH`:
+    assert adapter.max_retries.allowed_methods == (
+        Retry.DEFAULT_ALLOWED_METHODS
+    )
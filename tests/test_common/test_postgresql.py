@@ -0,0 +1,22 @@
+from typing import cast
+
+import pytest
+from django.db import connection
+
+from server.common.django.postgresql.base import DatabaseWrapper
+
+
+@pytest.mark.django_db(transaction=True)
+def test_broken_connection_is_replaced() -> None:
+    """This test ensures that broken persistent connections are replaced."""
+    if connection.vendor != 'postgresql':
+        pytest.skip('Only our postgresql backend has health checks')
+
+    wrapper = cast(DatabaseWrapper, connection)
+    wrapper.ensure_connection()
+    wrapper.connection.close()  # like `pgbouncer` or server restart
+    wrapper.health_check_pending = True  # like a new request
+
+    with wrapper.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        assert cursor.fetchone() == (1,)
@@ -0,0 +1,75 @@
+import pytest
+from django.conf import LazySettings
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+
+from server.apps.identity.container import container as identity_container
+from server.apps.identity.logic.usecases.user_cached import UserCachedGet
+from server.apps.pictures.container import container
+from server.apps.pictures.logic.usecases.favourites_list import FavouritesList
+from server.common.django import routers
+from server.common.django.middleware import ReplicaReadsMiddleware
+from tests.plugins.identity.users import UserFactory
+
+
+@pytest.fixture()
+def _with_replica(settings: LazySettings) -> None:
+    """Configure read replica, it is never queried in these tests."""
+    settings.DATABASES = {
+        **settings.DATABASES,
+        routers.REPLICA: settings.DATABASES['default'],
+    }
+
+
+@pytest.mark.filterwarnings('ignore:Overriding setting DATABASES')
+@pytest.mark.usefixtures('_with_replica')
+def test_reads_routing() -> None:
+    """This test ensures that only allowed reads go to the replica."""
+    router = routers.ReplicaRouter()
+    user_model = get_user_model()
+
+    assert router.db_for_read(user_model) is None
+    with routers.replica_reads():
+        assert router.db_for_read(user_model) == routers.REPLICA
+        assert router.db_for_write(user_model) == 'default'
+    assert not router.allow_migrate(routers.REPLICA, 'identity')
+
+
+def test_reads_without_replica() -> None:
+    """This test ensures that reads stay on the primary without a replica."""
+    with routers.replica_reads():
+        assert routers.ReplicaRouter().db_for_read(get_user_model()) is None
+
+
+@pytest.mark.django_db()
+def test_primary_pin_after_write(client: Client) -> None:
+    """This test ensures that users are pinned to the primary after writes."""
+    cookie_name = ReplicaReadsMiddleware.cookie_name
+
+    assert cookie_name not in client.get(reverse('index')).cookies
+    assert cookie_name in client.post(reverse('identity:login')).cookies
+
+
+@pytest.mark.django_db()
+@pytest.mark.filterwarnings('ignore:Overriding setting DATABASES')
+@pytest.mark.usefixtures('_with_replica')
+def test_cache_filled_from_primary(user_factory: UserFactory) -> None:
+    """This test ensures that cached pages are not read from the replica."""
+    user = user_factory()
+    list_favourites = container.instantiate(FavouritesList)
+
+    with routers.replica_reads():
+        assert not list_favourites(user.pk).object_list
+
+
+@pytest.mark.django_db()
+@pytest.mark.filterwarnings('ignore:Overriding setting DATABASES')
+@pytest.mark.usefixtures('_with_replica')
+def test_user_cache_filled_from_primary(user_factory: UserFactory) -> None:
+    """This test ensures that cached users are not read from the replica."""
+    user = user_factory()
+    user_cached_get = identity_container.instantiate(UserCachedGet)
+
+    with routers.replica_reads():
+        assert user_cached_get(user.pk) == user
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+import structlog
+from django.http import StreamingHttpResponse
+from django.test import Client, RequestFactory
+
+from server.common.django.middleware import RequestTimingMiddleware
+from server.common.services import timing
+
+
+@pytest.mark.django_db()
+def test_server_timing_header(admin_client: Client) -> None:
+    """This test ensures that request timings are sent to the client."""
+    response = admin_client.get('/admin/')
+
+    server_timing = response['Server-Timing']
+    assert 'db;dur=' in server_timing
+    assert 'template;dur=' in server_timing
+    assert 'total;dur=' in server_timing
+
+
+def test_measure_collects_timings() -> None:
+    """This test ensures that measurements are only made when collecting."""
+    with timing.measure(timing.UPSTREAM):
+        time.sleep(0)  # nothing is collecting, this is not recorded anywhere
+
+    with timing.collect() as timings:
+        for _ in range(2):
+            with timing.measure(timing.UPSTREAM):
+                time.sleep(0)
+
+        assert timings.timers[timing.UPSTREAM].count == 2
+
+
+def test_streamed_body_measured(rf: RequestFactory) -> None:
+    """This test ensures that streamed bodies are reported when sent."""
+    timing_middleware = RequestTimingMiddleware(
+        lambda request: StreamingHttpResponse(iter([b'a', b'bc'])),
+    )
+
+    response = timing_middleware(rf.get('/'))
+    assert isinstance(response, StreamingHttpResponse)
+    body = b''.join(response.streaming_content)
+    reported = structlog.contextvars.get_contextvars()
+    structlog.contextvars.clear_contextvars()
+
+    assert body == b'abc'
+    assert reported['response_size'] == len(body)
+    assert reported['stream_count'] == 3  # the last one is the end
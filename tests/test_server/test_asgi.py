@@ -0,0 +1,35 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.http.response import HttpResponseBase
+from django.test.client import AsyncClient
+from django.utils.module_loading import import_string
+
+#: Development tools that only support sync requests:
+_SYNC_ONLY_MIDDLEWARE = frozenset((
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+))
+
+
+@pytest.mark.parametrize('middleware', [
+    middleware
+    for middleware in settings.MIDDLEWARE
+    if middleware not in _SYNC_ONLY_MIDDLEWARE
+])
+def test_middleware_async_capable(middleware: str) -> None:
+    """This test ensures that async views are not moved into a thread."""
+    assert getattr(import_string(middleware), 'async_capable', False)
+
+
+def test_async_request() -> None:
+    """This test ensures that our middlewares work in async chain."""
+    response = asyncio.run(_get('/robots.txt'))
+
+    assert response.status_code == HTTPStatus.OK
+    assert 'total;dur=' in response['Server-Timing']
+
+
+async def _get(path: str) -> HttpResponseBase:
+    return await AsyncClient().get(path)
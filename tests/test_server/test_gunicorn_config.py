@@ -0,0 +1,75 @@
+import os
+import runpy
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Final
+
+import pytest
+
+#: Prints the storage of metrics, when gunicorn config is loaded first:
+_METRICS_STORAGE: Final = '; '.join((
+    'import docker.django.gunicorn_config',
+    'from prometheus_client import values',
+    'print(values.ValueClass.__name__)',
+))
+
+_LoadConfig = Callable[..., Dict[str, Any]]
+
+
+@pytest.fixture()
+def load_config(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> _LoadConfig:
+    """Loads gunicorn config with given environment variables."""
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+
+    def factory(**env: str) -> Dict[str, Any]:
+        for env_name, env_value in env.items():
+            monkeypatch.setenv(env_name, env_value)
+        return runpy.run_module('docker.django.gunicorn_config')
+    return factory
+
+
+def test_metrics_multiprocess() -> None:
+    """This test ensures that workers share metrics through files."""
+    env = os.environ.copy()
+    env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', _METRICS_STORAGE],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == 'MmapedValue'
+
+
+@pytest.mark.parametrize(('profile', 'worker_class', 'threads'), [
+    ('gthread', 'gthread', 4),
+    ('uvicorn', 'uvicorn.workers.UvicornWorker', 4),
+    ('sync', 'sync', 1),
+])
+def test_worker_profiles(
+    load_config: _LoadConfig,
+    profile: str,
+    worker_class: str,
+    threads: int,
+) -> None:
+    """This test ensures that `sync` workers don't turn into `gthread`."""
+    config = load_config(
+        GUNICORN_WORKER_PROFILE=profile,
+        GUNICORN_THREADS='4',
+    )
+
+    assert config['worker_class'] == worker_class
+    assert config['threads'] == threads
+
+
+def test_unknown_worker_profile(load_config: _LoadConfig) -> None:
+    """This test ensures that typos in the profile are reported clearly."""
+    with pytest.raises(ValueError, match='GUNICORN_WORKER_PROFILE'):
+        load_config(GUNICORN_WORKER_PROFILE='gevent')
@@ -12,6 +12,15 @@ def test_health_check(client: Client) -> None:
     assert response.status_code == HTTPStatus.OK
 
 
+def test_metrics(client: Client) -> None:
+    """This test ensures that metrics are exposed by url names."""
+    client.get('/robots.txt')
+    response = client.get('/metrics/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert b'django_request_duration_seconds_bucket' in response.content
+
+
 def test_admin_unauthorized(client: Client) -> None:
     """This test ensures that admin panel requires auth."""
     response = client.get('/admin/')
@@ -53,3 +62,14 @@ def test_specials_txt(client: Client, page: str) -> None:
 
     assert response.status_code == HTTPStatus.OK
     assert response.get('Content-Type') == 'text/plain'
+    assert 'public' in response['Cache-Control']
+
+
+@pytest.mark.django_db()
+def test_index_cache_control(client: Client, admin_client: Client) -> None:
+    """This test ensures that only anonymous index page is public."""
+    response = client.get('/')
+    admin_response = admin_client.get('/')
+
+    assert 'public' in response['Cache-Control']
+    assert 'private' in admin_response['Cache-Control']